@@ -175,7 +175,7 @@ const ContactDetailPage = () => {
               <h2 className="text-xl font-bold text-gray-900">AI 분석 결과</h2>
               {contact.ai_model && (
                 <span className="ml-auto text-xs text-gray-500">
-                  {contact.ai_model} · {contact.ai_created_at && new Date(contact.ai_created_at).toLocaleString('ko-KR')}
+                  {contact.ai_model}{contact.ai_cached && ' (캐시)'} · {contact.ai_created_at && new Date(contact.ai_created_at).toLocaleString('ko-KR')}
                 </span>
               )}
             </div>
@@ -72,6 +72,7 @@ export interface User {
     ai_next_actions?: string[]
     ai_model?: string
     ai_created_at?: string
+    ai_cached?: boolean  // 같은 내용의 이전 분석 결과 재사용
 
     has_ai_analysis: boolean
   }
@@ -1,3 +1,4 @@
+import re
 from logging.config import fileConfig
 from alembic import context
 from sqlalchemy import create_engine, pool
@@ -17,6 +18,15 @@ import app.models  # app/models/__init__.py에서 전부 import하도록 구성
 
 target_metadata = Base.metadata
 
+
+def include_name(name, type_, parent_names):
+    # click_events 월별 파티션/아카이브는 모델이 아니라 scripts/click_partitions.py가 관리
+    if type_ == "table" and re.match(r"^click_events_(p\d{6}|default)$", name or ""):
+        return False
+    if type_ == "schema" and name == "click_archive":
+        return False
+    return True
+
 def run_migrations_offline() -> None:
     url = settings.DATABASE_URL
     context.configure(
@@ -25,6 +35,7 @@ def run_migrations_offline() -> None:
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
         compare_type=True,
+        include_name=include_name,
     )
     with context.begin_transaction():
         context.run_migrations()
@@ -40,6 +51,7 @@ def run_migrations_online() -> None:
             connection=connection,
             target_metadata=target_metadata,
             compare_type=True,
+            include_name=include_name,
         )
         with context.begin_transaction():
             context.run_migrations()
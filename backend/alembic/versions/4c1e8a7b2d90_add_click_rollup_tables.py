@@ -0,0 +1,64 @@
+"""add click rollup tables
+
+Revision ID: 4c1e8a7b2d90
+Revises: 9708749016a9
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1e8a7b2d90'
+down_revision: Union[str, None] = '9708749016a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('click_rollups_hourly',
+    sa.Column('ip_hash', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('hour', sa.DateTime(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('suspicious_count', sa.Integer(), nullable=False),
+    sa.Column('last_click', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('ip_hash', 'event_type', 'hour')
+    )
+    op.create_index('ix_click_rollups_hourly_hour', 'click_rollups_hourly', ['hour'], unique=False)
+
+    op.create_table('click_rollups_daily',
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('count', sa.Integer(), nullable=False),
+    sa.Column('suspicious_count', sa.Integer(), nullable=False),
+    sa.PrimaryKeyConstraint('event_type', 'day')
+    )
+    op.create_index('ix_click_rollups_daily_day', 'click_rollups_daily', ['day'], unique=False)
+
+    # ✅ 기존 click_events 백필
+    op.execute("""
+        INSERT INTO click_rollups_hourly (ip_hash, event_type, hour, count, suspicious_count, last_click)
+        SELECT ip_hash, event_type, date_trunc('hour', created_at),
+               count(*), count(*) FILTER (WHERE is_suspicious), max(created_at)
+        FROM click_events
+        WHERE created_at IS NOT NULL
+        GROUP BY ip_hash, event_type, date_trunc('hour', created_at)
+    """)
+    op.execute("""
+        INSERT INTO click_rollups_daily (event_type, day, count, suspicious_count)
+        SELECT event_type, created_at::date, count(*), count(*) FILTER (WHERE is_suspicious)
+        FROM click_events
+        WHERE created_at IS NOT NULL
+        GROUP BY event_type, created_at::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_click_rollups_daily_day', table_name='click_rollups_daily')
+    op.drop_table('click_rollups_daily')
+    op.drop_index('ix_click_rollups_hourly_hour', table_name='click_rollups_hourly')
+    op.drop_table('click_rollups_hourly')
@@ -0,0 +1,33 @@
+"""add partial index for published history ordering
+
+Revision ID: 5f9b2e7a1c83
+Revises: e2a5c8d14f37
+Create Date: 2026-10-17 14:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f9b2e7a1c83'
+down_revision: Union[str, None] = 'e2a5c8d14f37'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 공개 목록 정렬 + published_at 범위 필터 + 월별 아카이브 집계
+    op.create_index(
+        'ix_history_published_order',
+        'history',
+        [sa.text('published_at DESC'), sa.text('created_at DESC'), sa.text('id DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_published'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_history_published_order', table_name='history')
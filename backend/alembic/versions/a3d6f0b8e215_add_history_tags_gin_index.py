@@ -0,0 +1,26 @@
+"""add GIN index on history.tags
+
+Revision ID: a3d6f0b8e215
+Revises: 5f9b2e7a1c83
+Create Date: 2026-10-17 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d6f0b8e215'
+down_revision: Union[str, None] = '5f9b2e7a1c83'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_history_tags', 'history', ['tags'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    op.drop_index('ix_history_tags', table_name='history')
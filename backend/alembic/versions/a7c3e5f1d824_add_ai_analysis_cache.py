@@ -0,0 +1,48 @@
+"""add ai_analysis_cache table and contacts.ai_cached
+
+Revision ID: a7c3e5f1d824
+Revises: f4b8d2c6e019
+Create Date: 2026-10-17 20:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7c3e5f1d824'
+down_revision: Union[str, None] = 'f4b8d2c6e019'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'ai_analysis_cache',
+        sa.Column('key', sa.String(length=64), nullable=False),
+        sa.Column('model', sa.String(length=64), nullable=False),
+        sa.Column('prompt_version', sa.String(length=16), nullable=False),
+        sa.Column('result', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('hits', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_hit_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('expires_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+    op.create_index(op.f('ix_ai_analysis_cache_last_hit_at'), 'ai_analysis_cache', ['last_hit_at'], unique=False)
+    op.create_index(op.f('ix_ai_analysis_cache_expires_at'), 'ai_analysis_cache', ['expires_at'], unique=False)
+
+    op.add_column(
+        'contacts',
+        sa.Column('ai_cached', sa.Boolean(), server_default=sa.false(), nullable=False),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('contacts', 'ai_cached')
+    op.drop_index(op.f('ix_ai_analysis_cache_expires_at'), table_name='ai_analysis_cache')
+    op.drop_index(op.f('ix_ai_analysis_cache_last_hit_at'), table_name='ai_analysis_cache')
+    op.drop_table('ai_analysis_cache')
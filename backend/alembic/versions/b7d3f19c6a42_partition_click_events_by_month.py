@@ -0,0 +1,103 @@
+"""partition click_events by month
+
+Revision ID: b7d3f19c6a42
+Revises: 4c1e8a7b2d90
+Create Date: 2026-10-17 11:00:00.000000
+
+"""
+from datetime import date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7d3f19c6a42'
+down_revision: Union[str, None] = '4c1e8a7b2d90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# 기동 시 ensure_click_partitions()가 이후 달을 계속 채워줌
+MONTHS_AHEAD = 3
+
+
+def _add_months(d: date, months: int) -> date:
+    y, m = divmod(d.month - 1 + months, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+
+    # ✅ 기존 테이블은 옮겨두고 (인덱스/PK 이름 충돌 방지)
+    op.drop_index('ix_click_events_ip_hash', table_name='click_events')
+    op.drop_index('ix_click_events_created_at', table_name='click_events')
+    op.rename_table('click_events', 'click_events_legacy')
+    op.execute('ALTER TABLE click_events_legacy RENAME CONSTRAINT click_events_pkey TO click_events_legacy_pkey')
+
+    # ✅ 파티션 부모 테이블 (파티션 키 created_at은 PK에 포함 + NOT NULL)
+    op.execute("""
+        CREATE TABLE click_events (
+            id VARCHAR NOT NULL,
+            ip_hash VARCHAR NOT NULL,
+            event_type VARCHAR NOT NULL,
+            is_suspicious BOOLEAN,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT click_events_pkey PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+    """)
+
+    # ✅ 기존 데이터 가장 오래된 달 ~ 이번 달 + MONTHS_AHEAD 까지 월별 파티션
+    oldest = bind.execute(sa.text('SELECT min(created_at) FROM click_events_legacy')).scalar()
+    current = datetime.utcnow().date().replace(day=1)
+    start = (oldest.date() if oldest else current).replace(day=1)
+    last = _add_months(current, MONTHS_AHEAD)
+    while start <= last:
+        end = _add_months(start, 1)
+        op.execute(
+            f"CREATE TABLE click_events_p{start:%Y%m} PARTITION OF click_events "
+            f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+        )
+        start = end
+    op.execute('CREATE TABLE click_events_default PARTITION OF click_events DEFAULT')
+
+    # ✅ 데이터 이동 (created_at NULL은 now()로 보정)
+    op.execute("""
+        INSERT INTO click_events (id, ip_hash, event_type, is_suspicious, created_at)
+        SELECT id, ip_hash, event_type, is_suspicious, COALESCE(created_at, now())
+        FROM click_events_legacy
+    """)
+    op.drop_table('click_events_legacy')
+
+    # ✅ 핫 쿼리에 맞춘 복합 인덱스 (부모에 만들면 모든 파티션에 전파)
+    op.create_index('ix_click_events_ip_hash_created_at', 'click_events', ['ip_hash', 'created_at'], unique=False)
+    op.create_index('ix_click_events_ip_hash_event_type_created_at', 'click_events', ['ip_hash', 'event_type', 'created_at'], unique=False)
+    op.create_index('ix_click_events_created_at_id', 'click_events', ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.rename_table('click_events', 'click_events_partitioned')
+    op.execute('ALTER TABLE click_events_partitioned RENAME CONSTRAINT click_events_pkey TO click_events_partitioned_pkey')
+    op.drop_index('ix_click_events_ip_hash_created_at', table_name='click_events_partitioned')
+    op.drop_index('ix_click_events_ip_hash_event_type_created_at', table_name='click_events_partitioned')
+    op.drop_index('ix_click_events_created_at_id', table_name='click_events_partitioned')
+
+    op.create_table('click_events',
+    sa.Column('id', sa.String(), nullable=False),
+    sa.Column('ip_hash', sa.String(), nullable=False),
+    sa.Column('event_type', sa.String(), nullable=False),
+    sa.Column('is_suspicious', sa.Boolean(), nullable=True),
+    sa.Column('created_at', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.execute("""
+        INSERT INTO click_events (id, ip_hash, event_type, is_suspicious, created_at)
+        SELECT id, ip_hash, event_type, is_suspicious, created_at
+        FROM click_events_partitioned
+    """)
+    # 파티션도 함께 삭제됨
+    op.execute('DROP TABLE click_events_partitioned CASCADE')
+
+    op.create_index(op.f('ix_click_events_created_at'), 'click_events', ['created_at'], unique=False)
+    op.create_index(op.f('ix_click_events_ip_hash'), 'click_events', ['ip_hash'], unique=False)
@@ -0,0 +1,26 @@
+"""add index on residents.admission_date
+
+Revision ID: c81e4a9f3b56
+Revises: a3d6f0b8e215
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81e4a9f3b56'
+down_revision: Union[str, None] = 'a3d6f0b8e215'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(op.f('ix_residents_admission_date'), 'residents', ['admission_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f('ix_residents_admission_date'), table_name='residents')
@@ -0,0 +1,54 @@
+"""add history full-text search column and indexes
+
+Revision ID: e2a5c8d14f37
+Revises: b7d3f19c6a42
+Create Date: 2026-10-17 13:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2a5c8d14f37'
+down_revision: Union[str, None] = 'b7d3f19c6a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(excerpt, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'C')"
+)
+
+
+def upgrade() -> None:
+    op.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+
+    # generated column → 기존 row도 ADD COLUMN 시점에 채워짐
+    op.add_column('history', sa.Column(
+        'search_vector',
+        postgresql.TSVECTOR(),
+        sa.Computed(SEARCH_VECTOR_SQL, persisted=True),
+        nullable=True,
+    ))
+    op.create_index('ix_history_search_vector', 'history', ['search_vector'], unique=False, postgresql_using='gin')
+
+    op.create_index('ix_history_title_trgm', 'history', ['title'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'})
+    op.create_index('ix_history_excerpt_trgm', 'history', ['excerpt'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'excerpt': 'gin_trgm_ops'})
+    op.create_index('ix_history_content_trgm', 'history', ['content'], unique=False,
+                    postgresql_using='gin', postgresql_ops={'content': 'gin_trgm_ops'})
+
+
+def downgrade() -> None:
+    op.drop_index('ix_history_content_trgm', table_name='history')
+    op.drop_index('ix_history_excerpt_trgm', table_name='history')
+    op.drop_index('ix_history_title_trgm', table_name='history')
+    op.drop_index('ix_history_search_vector', table_name='history')
+    op.drop_column('history', 'search_vector')
+    # pg_trgm extension은 다른 곳에서 쓸 수 있으므로 남겨둠
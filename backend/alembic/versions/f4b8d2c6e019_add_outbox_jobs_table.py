@@ -0,0 +1,60 @@
+"""add outbox_jobs table
+
+Revision ID: f4b8d2c6e019
+Revises: c81e4a9f3b56
+Create Date: 2026-10-17 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f4b8d2c6e019'
+down_revision: Union[str, None] = 'c81e4a9f3b56'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'outbox_jobs',
+        sa.Column('id', sa.String(), nullable=False),
+        sa.Column('kind', sa.String(length=64), nullable=False),
+        sa.Column('payload', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column(
+            'status',
+            sa.Enum('PENDING', 'RUNNING', 'DONE', 'FAILED', name='outboxstatus'),
+            nullable=False,
+        ),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_after', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('locked_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('locked_by', sa.String(length=64), nullable=True),
+        sa.Column('last_error', sa.Text(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index(op.f('ix_outbox_jobs_kind'), 'outbox_jobs', ['kind'], unique=False)
+    op.create_index(op.f('ix_outbox_jobs_status'), 'outbox_jobs', ['status'], unique=False)
+    op.create_index(
+        'ix_outbox_jobs_due',
+        'outbox_jobs',
+        ['run_after'],
+        unique=False,
+        postgresql_where=sa.text("status = 'PENDING'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_outbox_jobs_due', table_name='outbox_jobs')
+    op.drop_index(op.f('ix_outbox_jobs_status'), table_name='outbox_jobs')
+    op.drop_index(op.f('ix_outbox_jobs_kind'), table_name='outbox_jobs')
+    op.drop_table('outbox_jobs')
+    sa.Enum(name='outboxstatus').drop(op.get_bind(), checkfirst=True)
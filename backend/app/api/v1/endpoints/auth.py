@@ -1,17 +1,31 @@
 from datetime import timedelta
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from pydantic import BaseModel, EmailStr, Field
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.client_ip import get_client_ip
 from app.core.config import settings
-from app.core.database import get_db
-from app.core.security import create_access_token, get_current_user, verify_password
+from app.core.database import get_async_db
+from app.core.security import (
+    PasswordHasherBusy,
+    Principal,
+    create_access_token,
+    get_current_user,
+    revoke_token,
+    verify_password_async,
+)
 from app.models.user import User  # UserRole도 필요하면 import
+from app.services.login_limiter import get_login_limiter
 
 router = APIRouter()
 
+# 로그아웃은 토큰이 없어도 200 (클라이언트는 응답과 무관하게 토큰 삭제)
+optional_bearer = HTTPBearer(auto_error=False)
+
 
 # -------------------------
 # Schemas
@@ -49,16 +63,38 @@ class LogoutResponse(BaseModel):
 # -------------------------
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, request: Request, db: AsyncSession = Depends(get_async_db)):
     """
     로그인 (JSON body)
-    - DB에서 email로 유저 조회 후 verify_password
+    - 이메일/IP 시도 제한 먼저 (초과 시 429, bcrypt 안 돌림)
+    - DB에서 email로 유저 조회 후 bcrypt 풀에서 verify_password
+      (없는 이메일도 더미 해시로 같은 비용 → 응답 시간 차이 없음)
     - token.sub = user.id (DB id)
     - token.role = user.role.value ("ADMIN"/"STAFF")
     """
-    user: Optional[User] = db.query(User).filter(User.email == payload.email).first()
+    limiter = get_login_limiter()
+    retry_after = await limiter.hit(payload.email, get_client_ip(request))
+    if retry_after is not None:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many login attempts. Please try again later.",
+            headers={"Retry-After": str(retry_after)},
+        )
+
+    user: Optional[User] = (await db.execute(select(User).where(User.email == payload.email))).scalar_one_or_none()
+    # 해시 계산(수백 ms) 동안 DB 커넥션을 잡고 있지 않도록 먼저 반납 (로드된 속성은 그대로 사용 가능)
+    await db.close()
+
+    try:
+        valid = await verify_password_async(payload.password, user.hashed_password if user else None)
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Server is busy. Please try again.",
+            headers={"Retry-After": "1"},
+        )
 
-    if not user or not verify_password(payload.password, user.hashed_password):
+    if not valid:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -74,6 +110,7 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
         },
         expires_delta=access_token_expires,
     )
+    await limiter.reset(payload.email)
 
     return TokenResponse(
         access_token=access_token,
@@ -87,19 +124,22 @@ def login(payload: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/logout", response_model=LogoutResponse)
-def logout():
+async def logout(credentials: Optional[HTTPAuthorizationCredentials] = Depends(optional_bearer)):
     """
-    JWT stateless logout: 서버는 할 일 없음.
-    클라이언트에서 토큰 삭제하면 됨.
+    로그아웃
+    - 클라이언트는 토큰 삭제
+    - 서버는 토큰 검증 캐시에서 제거 + exp까지 폐기 처리 (이후 같은 토큰은 401)
     """
+    if credentials is not None:
+        await revoke_token(credentials.credentials)
     return LogoutResponse()
 
 
 @router.get("/me", response_model=MeResponse)
-def me(current_user: User = Depends(get_current_user)):
+def me(current_user: Principal = Depends(get_current_user)):
     """
     현재 유저 정보
-    - get_current_user는 User ORM을 반환 (security.py 기준)
+    - get_current_user는 Principal(id/email/name/role)을 반환 (security.py 기준)
     """
     return MeResponse(
         user=UserResponse(
@@ -1,19 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from datetime import datetime
 
-from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.database import get_db, get_async_db
+from app.core.listing import ListParams, ListQuery, list_params
+from app.core.responses import api_json
+from app.core.security import Principal, get_current_admin_user, get_current_user
 from app.models.contact import Contact, ContactStatus
-from app.models.user import User
+from app.models.outbox import OutboxJob, OutboxStatus
 from app.schemas.response import ApiResponse
 from app.schemas.contact import (
     ContactResponse,
     ContactReplyRequest,
     ContactStatusUpdateRequest,
 )
-from fastapi import BackgroundTasks
-from app.services.email_service import send_customer_reply, contact_to_dict
+from app.services.email_service import contact_to_dict
+from app.services.contact_analysis import count_unanalyzed
+from app.services.openai import get_openai_client
+from app.services.outbox import JOB_CONTACT_ANALYZE_BACKLOG, JOB_EMAIL_CUSTOMER_REPLY, enqueue
 
 router = APIRouter()
 
@@ -21,21 +29,112 @@ def to_contact_dict(obj: Contact) -> dict:
     return ContactResponse.model_validate(obj).model_dump()
 
 
+contact_list = ListQuery(
+    Contact,
+    ContactResponse,
+    sorts={
+        "created_at": Contact.created_at,
+        "name": Contact.name,
+        "ticket_id": Contact.ticket_id,
+    },
+    computed={
+        "has_ai_analysis": and_(Contact.ai_summary.isnot(None), Contact.ai_summary != ""),
+    },
+    # ✅ 관리자 문의 테이블 화면용 (message / reply / ai_next_actions 등 큰 컬럼 제외)
+    presets={
+        "summary": (
+            "id", "ticket_id", "name", "phone", "inquiry_type", "status",
+            "ai_category", "ai_urgency", "has_ai_analysis", "created_at", "replied_at",
+        ),
+    },
+)
+
+
 @router.get("", response_model=ApiResponse)
 def list_contacts(
+    params: ListParams = Depends(list_params),
+    status: Optional[ContactStatus] = Query(None),
+    ai_urgency: Optional[str] = Query(None),
+    ai_category: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
-    contacts = db.query(Contact).order_by(Contact.created_at.desc()).all()
-    data = [to_contact_dict(c) for c in contacts]
-    return ApiResponse(success=True, data=data)
+    data, meta = contact_list.run(db, params, {
+        Contact.status: status,
+        Contact.ai_urgency: ai_urgency,
+        Contact.ai_category: ai_category,
+    })
+    # ✅ ListQuery 결과는 이미 검증된 JSON 호환 값 → response_model 재검증 없이 bytes로 응답
+    return api_json(data, meta=meta)
+
+
+async def _latest_backlog_job(db: AsyncSession) -> Optional[OutboxJob]:
+    return (
+        await db.execute(
+            select(OutboxJob)
+            .where(OutboxJob.kind == JOB_CONTACT_ANALYZE_BACKLOG)
+            .order_by(OutboxJob.created_at.desc())
+            .limit(1)
+        )
+    ).scalar_one_or_none()
+
+
+# ✅ /{contact_id} 보다 먼저 등록 (경로 충돌 방지)
+@router.get("/ai-backlog", response_model=ApiResponse)
+async def get_ai_backlog(
+    db: AsyncSession = Depends(get_async_db),
+    _: Principal = Depends(get_current_admin_user),
+):
+    """AI 분석 안 된 문의 수 + 마지막 backlog job 진행 상황 (payload.totals 누적)"""
+    job = await _latest_backlog_job(db)
+    return ApiResponse(success=True, data={
+        "unanalyzed": await count_unanalyzed(db),
+        "job": {
+            "id": job.id,
+            "status": job.status,
+            "cursor": job.payload.get("cursor"),
+            "totals": job.payload.get("totals"),
+            "started_at": job.payload.get("started_at"),
+            "last_error": job.last_error,
+        } if job else None,
+    })
+
+
+@router.post("/ai-backlog", response_model=ApiResponse)
+async def start_ai_backlog(
+    batch_size: Optional[int] = Query(None, ge=1, le=100),
+    db: AsyncSession = Depends(get_async_db),
+    _: Principal = Depends(get_current_admin_user),
+):
+    """AI 분석 결과가 없는(미분석 / 폴백) 문의 일괄 AI 분석 시작 (outbox 워커에서 실행, job마다 시간 예산만큼 진행 후 다음 job)"""
+    if get_openai_client().client is None:
+        raise HTTPException(status_code=400, detail="OpenAI API key not configured")
+
+    job = await _latest_backlog_job(db)
+    if job and job.status in (OutboxStatus.PENDING, OutboxStatus.RUNNING):
+        raise HTTPException(status_code=409, detail="AI backlog analysis already running")
+
+    unanalyzed = await count_unanalyzed(db)
+    if not unanalyzed:
+        return ApiResponse(success=True, data={"unanalyzed": 0, "job_id": None}, message="Nothing to analyze")
+
+    job = enqueue(db, JOB_CONTACT_ANALYZE_BACKLOG, {
+        "batch_size": batch_size,
+        "cursor": None,
+        "totals": {"processed": 0, "analyzed": 0, "failed": 0, "cached": 0},
+        "started_at": datetime.utcnow().isoformat(),
+    })
+    await db.flush()
+    job_id = job.id
+    await db.commit()
+    return ApiResponse(success=True, data={"unanalyzed": unanalyzed, "job_id": job_id}, message="AI backlog analysis queued")
 
 
 @router.get("/{contact_id}", response_model=ApiResponse)
 def get_contact(
     contact_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
@@ -43,7 +142,7 @@ def get_contact(
     return ApiResponse(success=True, data=to_contact_dict(contact))
 
 @router.get("/{contact_id}/ai-analysis")
-async def get_contact_ai_analysis(contact_id: str, db: Session = Depends(get_db), _: str = Depends(get_current_user)):
+async def get_contact_ai_analysis(contact_id: str, db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_user)):
     """
     상담 AI 분석 결과만 조회 (관리자)
     
@@ -55,7 +154,7 @@ async def get_contact_ai_analysis(contact_id: str, db: Session = Depends(get_db)
         - ai_model
         - ai_created_at
     """
-    contact = db.query(Contact).filter(Contact.id == contact_id).first()
+    contact = (await db.execute(select(Contact).where(Contact.id == contact_id))).scalar_one_or_none()
     if not contact:
         raise HTTPException(status_code=404, detail="Contact not found")
     
@@ -66,6 +165,7 @@ async def get_contact_ai_analysis(contact_id: str, db: Session = Depends(get_db)
         "ai_next_actions": contact.ai_next_actions,
         "ai_model": contact.ai_model,
         "ai_created_at": contact.ai_created_at,
+        "ai_cached": contact.ai_cached,
         "has_ai_analysis": contact.ai_summary is not None
     }
     
@@ -76,9 +176,8 @@ async def get_contact_ai_analysis(contact_id: str, db: Session = Depends(get_db)
 def reply_contact(
     contact_id: str,
     payload: ContactReplyRequest,
-    background_tasks: BackgroundTasks,   # ✅ 추가
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
@@ -89,11 +188,12 @@ def reply_contact(
     contact.replied_at = datetime.utcnow()           # timezone 통일하고 싶으면 func.now() 방식으로
     contact.replied_by = current_user.name or current_user.email
 
+    # ✅ 고객 답변 메일은 outbox job으로 (답변 저장과 같은 commit)
+    enqueue(db, JOB_EMAIL_CUSTOMER_REPLY, {"contact": contact_to_dict(contact), "reply": payload.reply})
+
     db.commit()
     db.refresh(contact)
     
-    background_tasks.add_task(send_customer_reply, contact_to_dict(contact), payload.reply)
-    
     return ApiResponse(success=True, data=to_contact_dict(contact))
 
 
@@ -102,7 +202,7 @@ def update_contact_status(
     contact_id: str,
     payload: ContactStatusUpdateRequest,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
@@ -121,7 +221,7 @@ def update_contact_status(
 def delete_contact(
     contact_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     contact = db.query(Contact).filter(Contact.id == contact_id).first()
     if not contact:
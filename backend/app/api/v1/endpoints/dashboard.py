@@ -1,8 +1,10 @@
 from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
-from datetime import datetime, timedelta
-from app.core.database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, func
+from datetime import datetime
+from app.core.cache import TTLCache, depends_on, register_invalidator
+from app.core.config import settings
+from app.core.database import get_async_db
 from app.core.security import get_current_user
 from app.models.resident import Resident, ResidentStatus
 from app.models.staff import Staff, StaffStatus
@@ -11,46 +13,51 @@ from app.schemas.response import ApiResponse
 
 router = APIRouter()
 
+# ✅ 여러 관리자가 동시에 새로고침해도 몇 초에 한 번만 집계
+# residents/staff/contacts 변경 commit 시 즉시 무효화
+CACHE_NS_DASHBOARD = depends_on(
+    "dashboard.stats",
+    Resident.__tablename__, Staff.__tablename__, Contact.__tablename__,
+)
+_stats_cache = TTLCache(maxsize=1, ttl=settings.DASHBOARD_STATS_TTL)
+register_invalidator(lambda ns: _stats_cache.clear() if ns == CACHE_NS_DASHBOARD else None)
+
+
+def _stats_query():
+    """대시보드 숫자 6개를 한 번의 쿼리로 (residents 1회 스캔 + staff/contacts 스칼라 서브쿼리)"""
+    now = datetime.utcnow()
+    today = now.date()
+    first_day_of_month = today.replace(day=1)
+
+    # admission_date는 Date 컬럼 → func.date() 없이 바로 비교해야 인덱스 사용
+    return select(
+        # 전체 입소자
+        func.count(Resident.id).label("totalResidents"),
+        # 활동 중인 입소자
+        func.count(Resident.id).filter(Resident.status == ResidentStatus.ACTIVE).label("activeResidents"),
+        # 재직 중인 직원
+        select(func.count(Staff.id))
+        .where(Staff.status == StaffStatus.ACTIVE)
+        .scalar_subquery()
+        .label("totalStaff"),
+        # 대기 중인 상담
+        select(func.count(Contact.id))
+        .where(Contact.status == ContactStatus.PENDING)
+        .scalar_subquery()
+        .label("pendingContacts"),
+        # 오늘 입소한 입소자
+        func.count(Resident.id).filter(Resident.admission_date == today).label("todayAdmissions"),
+        # 이번 달 입소한 입소자
+        func.count(Resident.id).filter(Resident.admission_date >= first_day_of_month).label("monthlyAdmissions"),
+    ).select_from(Resident)
+
+
 @router.get("/stats")
-async def get_stats(db: Session = Depends(get_db), _: str = Depends(get_current_user)):
-    # 전체 입소자
-    total_residents = db.query(func.count(Resident.id)).scalar() or 0
-    
-    # 활동 중인 입소자
-    active_residents = db.query(func.count(Resident.id)).filter(
-        Resident.status == ResidentStatus.ACTIVE
-    ).scalar() or 0
-    
-    # 재직 중인 직원
-    total_staff = db.query(func.count(Staff.id)).filter(
-        Staff.status == StaffStatus.ACTIVE
-    ).scalar() or 0
-    
-    # 대기 중인 상담
-    pending_contacts = db.query(func.count(Contact.id)).filter(
-        Contact.status == ContactStatus.PENDING
-    ).scalar() or 0
-    
-    # 오늘 입소한 입소자 (admission_date가 오늘인 경우)
-    today = datetime.utcnow().date()
-    today_admissions = db.query(func.count(Resident.id)).filter(
-        func.date(Resident.admission_date) == today
-    ).scalar() or 0
-    
-    # 이번 달 입소한 입소자
-    first_day_of_month = datetime.utcnow().replace(day=1, hour=0, minute=0, second=0, microsecond=0)
-    monthly_admissions = db.query(func.count(Resident.id)).filter(
-        Resident.admission_date >= first_day_of_month
-    ).scalar() or 0
-    
-    return ApiResponse(
-        success=True,
-        data={
-            "totalResidents": total_residents,
-            "activeResidents": active_residents,
-            "totalStaff": total_staff,
-            "pendingContacts": pending_contacts,
-            "todayAdmissions": today_admissions,
-            "monthlyAdmissions": monthly_admissions
-        }
-    )
\ No newline at end of file
+async def get_stats(db: AsyncSession = Depends(get_async_db), _: str = Depends(get_current_user)):
+    data = _stats_cache.get("stats")
+    if data is None:
+        row = (await db.execute(_stats_query())).one()
+        data = {k: v or 0 for k, v in row._mapping.items()}
+        _stats_cache.set("stats", data)
+
+    return ApiResponse(success=True, data=data)
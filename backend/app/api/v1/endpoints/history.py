@@ -1,12 +1,16 @@
 from datetime import datetime
 from typing import List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
 
 from app.core.database import get_db
+from app.core.listing import ListParams, ListQuery, list_params
+from app.core.responses import api_json
 from app.core.security import get_current_user
-from app.models.history import History
+from app.models.history import History, HistoryCategory
+from app.services.view_counter import get_view_counter
 from app.schemas.response import ApiResponse
 from app.schemas.history import HistoryCreate, HistoryUpdate, HistoryResponse
 
@@ -28,31 +32,50 @@ def simple_slugify(title: str) -> str:
     return s or "post"
 
 
+history_list = ListQuery(
+    History,
+    HistoryResponse,
+    sorts={
+        "created_at": History.created_at,
+        "title": History.title,
+        "view_count": History.view_count,
+    },
+    # ✅ 관리자 히스토리 테이블 화면용 (content 본문 제외)
+    presets={
+        "summary": (
+            "id", "title", "slug", "category", "is_published",
+            "published_at", "view_count", "created_at",
+        ),
+    },
+)
+
+
 @router.get("", response_model=ApiResponse)
 def list_history(
+    params: ListParams = Depends(list_params),
+    category: Optional[HistoryCategory] = Query(None),
+    is_published: Optional[bool] = Query(None),
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
 ):
     """히스토리 목록 조회"""
-    rows = db.query(History).order_by(History.created_at.desc()).all()
-    data = [to_history_dict(x) for x in rows]
-    return ApiResponse(success=True, data=data)
+    data, meta = history_list.run(db, params, {History.category: category, History.is_published: is_published})
+    # ✅ ListQuery 결과는 이미 검증된 JSON 호환 값 → response_model 재검증 없이 bytes로 응답
+    return api_json(data, meta=meta)
 
 
 @router.get("/{history_id}", response_model=ApiResponse)
-def get_history(
+async def get_history(
     history_id: str,
     db: Session = Depends(get_db),
     _=Depends(get_current_user),
 ):
-    """히스토리 상세 조회 + 조회수 증가"""
-    row = db.query(History).filter(History.id == history_id).first()
+    """히스토리 상세 조회 + 조회수 증가 (증가분은 버퍼 → 주기적으로 일괄 반영)"""
+    row = await run_in_threadpool(lambda: db.query(History).filter(History.id == history_id).first())
     if not row:
         raise HTTPException(status_code=404, detail="History not found")
 
-    row.view_count = (row.view_count or 0) + 1
-    db.commit()
-    db.refresh(row)
+    await get_view_counter().record(row.id)
 
     return ApiResponse(success=True, data=to_history_dict(row))
 
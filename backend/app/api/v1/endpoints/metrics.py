@@ -0,0 +1,56 @@
+"""
+Runtime Metrics API - 프로세스 내부 서브시스템 상태 (Admin)
+
+uvicorn 워커마다 값이 다름 (요청을 받은 워커 기준)
+"""
+import os
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+
+from app.core.cache import invalidate_namespaces, registered_namespaces, response_cache
+from app.core.security import get_current_admin_user, password_hasher_stats, token_cache_stats
+from app.schemas.response import ApiResponse
+from app.services.ai_cache import cache_stats as ai_cache_stats
+from app.services.click_counter import get_click_counter
+from app.services.click_ingest import get_click_ingestor
+from app.services.login_limiter import get_login_limiter
+from app.services.openai import get_openai_client
+from app.services.view_counter import get_view_counter
+
+router = APIRouter()
+
+
+@router.get("", response_model=ApiResponse)
+async def get_metrics(current_user=Depends(get_current_admin_user)):
+    """서브시스템 메트릭 (Admin)"""
+    return ApiResponse(
+        success=True,
+        data={
+            "pid": os.getpid(),
+            "click_ingest": get_click_ingestor().metrics(),
+            "click_counter": await get_click_counter().stats(),
+            "view_counter": await get_view_counter().metrics(),
+            "response_cache": response_cache.stats(),
+            "auth_token_cache": token_cache_stats(),
+            "login_limiter": get_login_limiter().metrics(),
+            "password_hasher": password_hasher_stats(),
+            "openai": get_openai_client().stats(),
+            "ai_analysis_cache": ai_cache_stats(),
+        },
+    )
+
+
+@router.post("/cache/invalidate", response_model=ApiResponse)
+async def invalidate_cache(
+    namespace: Optional[str] = Query(None, description="비우면 전체 namespace"),
+    current_user=Depends(get_current_admin_user),
+):
+    """
+    응답 캐시 수동 무효화 (Admin)
+    DB를 직접 수정(psql 등)해서 ORM 이벤트가 안 잡힐 때 사용
+    """
+    namespaces = [namespace] if namespace else sorted(registered_namespaces())
+    invalidate_namespaces(namespaces)
+    return ApiResponse(success=True, data={"invalidated": namespaces}, message="Cache invalidated")
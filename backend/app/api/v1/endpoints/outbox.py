@@ -0,0 +1,63 @@
+"""
+Outbox Jobs API - 워커 작업 상태 조회 / 재시도 (Admin)
+"""
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.core.database import get_async_db, get_db
+from app.core.listing import ListParams, ListQuery, list_params
+from app.core.responses import api_json
+from app.core.security import get_current_admin_user
+from app.models.outbox import OutboxJob, OutboxStatus
+from app.schemas.outbox import OutboxJobResponse
+from app.schemas.response import ApiResponse
+from app.services import outbox
+
+router = APIRouter()
+
+
+outbox_list = ListQuery(
+    OutboxJob,
+    OutboxJobResponse,
+    sorts={
+        "created_at": OutboxJob.created_at,
+        "run_after": OutboxJob.run_after,
+    },
+)
+
+
+@router.get("", response_model=ApiResponse)
+def list_jobs(
+    params: ListParams = Depends(list_params),
+    status: Optional[OutboxStatus] = Query(None),
+    kind: Optional[str] = Query(None),
+    db: Session = Depends(get_db),
+    _=Depends(get_current_admin_user),
+):
+    """outbox job 목록"""
+    data, meta = outbox_list.run(db, params, {OutboxJob.status: status, OutboxJob.kind: kind})
+    return api_json(data, meta=meta)
+
+
+@router.get("/stats", response_model=ApiResponse)
+async def get_job_stats(
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(get_current_admin_user),
+):
+    """kind/status별 job 수 + 가장 오래 기다린 대기 job (워커 밀림 확인용)"""
+    return ApiResponse(success=True, data=await outbox.job_stats(db))
+
+
+@router.post("/{job_id}/retry", response_model=ApiResponse)
+async def retry_job(
+    job_id: str,
+    db: AsyncSession = Depends(get_async_db),
+    _=Depends(get_current_admin_user),
+):
+    """FAILED job 즉시 재시도 (시도 횟수 초기화)"""
+    if not await outbox.retry_job(db, job_id):
+        raise HTTPException(status_code=404, detail="Job not found or not retryable")
+    return ApiResponse(success=True, message="Job re-queued")
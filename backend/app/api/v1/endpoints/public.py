@@ -1,20 +1,29 @@
+import json
 import time
 import logging
 from datetime import datetime
 from uuid import uuid4
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks, Query
+from functools import partial
+from urllib.parse import urlencode
+
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, asc, or_, extract
+from sqlalchemy import desc, asc, extract, and_, or_, tuple_, func, select, literal, cast, String, union_all
 from math import ceil
-from typing import Optional
+from typing import Literal, Optional
 
-from app.core.database import get_db
+from app.core.database import get_async_db
 
-# ⚠️ 중요: 백그라운드 태스크에서 "새 DB 세션"을 만들기 위해 SessionLocal 필요
+# ⚠️ 중요: 응답 캐시 builder(threadpool)에서 "새 DB 세션"을 만들기 위해 SessionLocal 필요
 # 네 프로젝트의 app/core/database.py에 SessionLocal이 정의돼 있어야 함.
 # 보통: SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 from app.core.database import SessionLocal  # <-- 만약 여기서 ImportError 나면 database.py 확인 필요
+from app.core.cache import CachedBody, TTLCache, depends_on, register_invalidator, response_cache
+from app.core.http_cache import CachePolicy, conditional_response
+from app.core.responses import dump_json
+from app.core.pagination import decode_cursor, encode_cursor
 
 # ✅ Contact는 admin이 보는 contacts 테이블로 저장
 from app.models.contact import Contact, ContactStatus
@@ -35,67 +44,85 @@ from app.schemas.public import (
     PublicApiResponse, PublicApiListResponse,
     HistoryListItemV2,
     HistoryDetailV2,
+    HistoryArchiveItem,
+    HistoryFacets,
+    FacetCount,
     PublicApiPageResponse,
 )
 
-from app.schemas.ai import ContactAnalysisRequest
-from app.services.openai import analyze_contact_inquiry
-from app.services.email_service import notify_admins_new_contact, contact_to_dict
+from app.services.contact_analysis import fill_from_cache
+from app.services.email_service import contact_to_dict
+from app.services.outbox import JOB_CONTACT_ANALYZE, JOB_EMAIL_ADMIN_NEW_CONTACT, enqueue
+from app.services.history_search import HistorySearch
+from app.services.triage import TRIAGE_MODEL, classify
+from app.services.view_counter import get_view_counter
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
 # ============================================================
-# Background Task: AI 분석 후 contacts 테이블에 저장
+# 응답 캐시 (자주 안 바뀌는 공개 데이터)
+# - 직렬화된 JSON bytes를 캐시 → hit 시 DB 세션/Pydantic 없이 바로 응답
+# - 관리자/스크립트가 ORM으로 테이블을 수정하면 commit 시점에 자동 무효화
+# - ETag + If-None-Match(304), Cache-Control 로 Caddy/브라우저/Next.js 캐시도 활용
 # ============================================================
-async def _run_ai_analysis_and_save(contact_id: int) -> None:
-    """
-    백그라운드에서 AI 분석 수행 후 contacts 테이블에 저장.
-    - 요청/응답을 막지 않음
-    - 요청에서 받은 db 세션을 재사용하지 않고 새 SessionLocal() 사용 (중요)
-    """
-    db = SessionLocal()
-    try:
-        contact = db.query(Contact).filter(Contact.id == contact_id).first()
-        if not contact:
-            logger.warning(f"[AI] contact not found: id={contact_id}")
-            return
-
-        ai_request = ContactAnalysisRequest(
-            name=contact.name,
-            inquiry_type=contact.inquiry_type,
-            message=contact.message,
-            phone=contact.phone,
-            email=contact.email,
-        )
+CACHE_NS_HISTORY = depends_on("public.history", History.__tablename__)
+CACHE_NS_REVIEWS = depends_on("public.reviews", PublicReview.__tablename__)
+CACHE_NS_SERVICES = depends_on("public.services", PublicService.__tablename__)
+CACHE_NS_DIFFERENTIATORS = depends_on("public.differentiators", PublicDifferentiator.__tablename__)
+CACHE_NS_INFO = depends_on("public.info", PublicInfo.__tablename__)
 
-        ai_result = await analyze_contact_inquiry(ai_request)
+# 라우트별 캐시 정책 (ttl=서버 캐시, 나머지는 Cache-Control)
+CACHE_POLICIES = {
+    CACHE_NS_HISTORY: CachePolicy(ttl=60, max_age=0, s_maxage=60, stale_while_revalidate=300),
+    CACHE_NS_REVIEWS: CachePolicy(ttl=300, max_age=60, s_maxage=300, stale_while_revalidate=3600),
+    CACHE_NS_SERVICES: CachePolicy(ttl=3600, max_age=300, s_maxage=3600, stale_while_revalidate=86400),
+    CACHE_NS_DIFFERENTIATORS: CachePolicy(ttl=3600, max_age=300, s_maxage=3600, stale_while_revalidate=86400),
+    CACHE_NS_INFO: CachePolicy(ttl=3600, max_age=300, s_maxage=3600, stale_while_revalidate=86400),
+}
 
-        if not ai_result:
-            logger.info(f"[AI] analysis skipped (maybe no API key): id={contact_id}")
-            return
 
-        # AI 결과 저장
-        contact.ai_summary = ai_result.summary
-        contact.ai_category = ai_result.category
-        contact.ai_urgency = ai_result.urgency
-        contact.ai_next_actions = ai_result.next_actions
-        contact.ai_model = "openai"
-        contact.ai_created_at = datetime.utcnow()
+# 공개 상세 slug → history id (조회수 기록용)
+_history_slug_ids = TTLCache(maxsize=4096, ttl=3600)
+# 목록 필터 조합별 total (페이지마다 COUNT(*) 하지 않도록)
+# 프로세스 로컬이라 history 수정 시 무효화는 요청을 처리한 uvicorn 워커에서만 일어남
+# → TTL을 history 응답 캐시 TTL과 같게 두어 다른 워커의 total도 목록 row와 같은 주기로 갱신
+#   (다른 워커에서 total이 최대 TTL만큼 늦을 수 있음 - 정확한 값이 아님)
+_history_counts = TTLCache(maxsize=1024, ttl=CACHE_POLICIES[CACHE_NS_HISTORY].ttl)
+
+
+def _on_history_invalidated(namespace: str) -> None:
+    if namespace == CACHE_NS_HISTORY:
+        _history_slug_ids.clear()
+        _history_counts.clear()
 
-        db.commit()
-        logger.info(
-            f"[AI] saved: id={contact_id}, category={ai_result.category}, urgency={ai_result.urgency}"
-        )
 
-    except Exception as e:
-        db.rollback()
-        logger.exception(f"[AI] failed: id={contact_id}, err={e}")
+register_invalidator(_on_history_invalidated)
+
+
+def _build_with_session(build) -> bytes:
+    """캐시 miss 시 threadpool에서 실행 - 요청 세션 대신 자체 SessionLocal 사용"""
+    db = SessionLocal()
+    try:
+        return dump_json(build(db))
     finally:
         db.close()
 
 
+async def _cached_entry(namespace: str, build, key: str = "all") -> CachedBody:
+    return await response_cache.get_or_build(
+        f"{namespace}:{key}",
+        CACHE_POLICIES[namespace].ttl,
+        lambda: _build_with_session(build),
+    )
+
+
+async def _cached_json(request: Request, namespace: str, build, key: str = "all") -> Response:
+    entry = await _cached_entry(namespace, build, key)
+    return conditional_response(request, entry.body, etag=entry.etag, policy=CACHE_POLICIES[namespace])
+
+
 # -------------------------
 # Contact  (✅ public -> contacts 테이블에 저장)
 # -------------------------
@@ -106,18 +133,21 @@ async def _run_ai_analysis_and_save(contact_id: int) -> None:
 )
 async def submit_contact_form(
     form: ContactFormRequest,
-    background_tasks: BackgroundTasks,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     상담문의 접수:
-    1) contacts 테이블에 즉시 저장하고
-    2) AI 분석은 BackgroundTasks로 비동기 수행 (응답 지연 없음)
+    1) contacts 테이블에 즉시 저장하고 (규칙 기반 임시 카테고리/긴급도 포함)
+    2) AI 분석 / 관리자 알림 메일은 같은 commit에 outbox job으로 등록
+       → 워커(python -m app.worker)가 처리 (응답 지연 없음, 재시작에도 유실 없음)
     """
 
     # ticket_id 생성: CNT-<epoch>-<short-uuid>
     ticket_id = f"CNT-{int(time.time())}-{uuid4().hex[:6]}"
 
+    # ✅ 규칙 기반 임시 분류 (수십 µs) - 관리자 목록에서 바로 긴급도/카테고리 확인, LLM 결과가 오면 덮어씀
+    triage = classify(form.inquiry_type, form.message)
+
     row = Contact(
         ticket_id=ticket_id,
         name=form.name,
@@ -127,18 +157,24 @@ async def submit_contact_form(
         message=form.message,
         privacy_agreed=form.privacy_agreed,
         status=ContactStatus.PENDING,
+        ai_category=triage.category,
+        ai_urgency=triage.urgency,
+        ai_model=TRIAGE_MODEL,
     )
 
     db.add(row)
-    db.commit()
-    db.refresh(row)
+    await db.flush()  # row.id 확정
 
-    logger.info(f"Contact created: ticket_id={ticket_id}, id={row.id}")
+    # ✅ 같은 내용의 분석 결과가 캐시에 있으면 바로 채움 (OpenAI 호출 / 분석 job 없음)
+    if not await fill_from_cache(db, row):
+        # ✅ AI 분석 / 관리자 알림 메일은 outbox job으로 (contact와 같은 트랜잭션)
+        enqueue(db, JOB_CONTACT_ANALYZE, {"contact_id": row.id})
+    enqueue(db, JOB_EMAIL_ADMIN_NEW_CONTACT, {"contact": contact_to_dict(row)})
 
-    # ✅ AI 분석은 백그라운드로
-    background_tasks.add_task(_run_ai_analysis_and_save, row.id)
-    # ✅ 관리자 알림 메일도 백그라운드로 (AI 분석과 동일한 방식)
-    background_tasks.add_task(notify_admins_new_contact, contact_to_dict(row))
+    await db.commit()
+    await db.refresh(row)
+
+    logger.info(f"Contact created: ticket_id={ticket_id}, id={row.id}")
 
     # ✅ response_model이 PublicApiResponse[dict] 이므로 dict로 감싸서 반환
     return PublicApiResponse(
@@ -154,12 +190,44 @@ async def submit_contact_form(
 # -------------------------
 # History (published only)
 # -------------------------
+# 공개 목록 정렬 (published_at DESC는 Postgres 기본 NULLS FIRST, id로 동률 정리)
+HISTORY_ORDER = (
+    History.published_at.desc().nulls_first(),
+    History.created_at.desc(),
+    History.id.desc(),
+)
+
+
+def _year_range(year: int):
+    return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+
+
+def _month_range(year: int, month: int):
+    start = datetime(year, month, 1)
+    end = datetime(year + 1, 1, 1) if month == 12 else datetime(year, month + 1, 1)
+    return start, end
+
+
+def _history_after(published_at, created_at, history_id):
+    """HISTORY_ORDER 기준 cursor 다음 row 조건 (published_at NULL은 맨 앞)"""
+    rest = tuple_(History.created_at, History.id) < tuple_(created_at, history_id)
+    if published_at is None:
+        return or_(
+            and_(History.published_at.is_(None), rest),
+            History.published_at.isnot(None),
+        )
+    return or_(
+        History.published_at < published_at,
+        and_(History.published_at == published_at, rest),
+    )
+
+
 @router.get(
     "/history",
     response_model=PublicApiPageResponse[HistoryListItemV2],
 )
-def get_published_history(
-    db: Session = Depends(get_db),
+async def get_published_history(
+    request: Request,
     page: int = Query(1, ge=1),
     limit: int = Query(12, ge=1, le=48),
     category: Optional[str] = Query(None),
@@ -167,8 +235,33 @@ def get_published_history(
     month: Optional[int] = Query(None, ge=1, le=12),
     search: Optional[str] = Query(None),
     tag: Optional[str] = Query(None),
+    sort: Literal["latest", "relevance"] = Query("latest", description="relevance는 search가 있을 때만 적용"),
+    highlight: bool = Query(False, description="search 결과에 본문 하이라이트 스니펫 포함"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (지정 시 page 무시)"),
 ):
-    q = db.query(History).filter(History.is_published.is_(True))
+    params = dict(
+        page=page, limit=limit, category=category, year=year, month=month,
+        search=search, tag=tag, sort=sort, highlight=highlight, cursor=cursor,
+    )
+    key = urlencode(sorted((k, v) for k, v in params.items() if v is not None))
+    return await _cached_json(request, CACHE_NS_HISTORY, partial(_build_published_history, **params), key=key)
+
+
+def _build_published_history(
+    db: Session,
+    page: int,
+    limit: int,
+    category: Optional[str],
+    year: Optional[int],
+    month: Optional[int],
+    search: Optional[str],
+    tag: Optional[str],
+    sort: str = "latest",
+    highlight: bool = False,
+    cursor: Optional[str] = None,
+) -> PublicApiPageResponse[HistoryListItemV2]:
+    # `WHERE is_published` 그대로 써야 partial index(ix_history_published_order) 조건과 매칭됨
+    q = db.query(History).filter(History.is_published)
 
     # ✅ category (Enum)
     if category:
@@ -177,36 +270,60 @@ def get_published_history(
             q = q.filter(History.category == HistoryCategory(category))
         except Exception:
             # 잘못된 카테고리면 빈 결과
-            return PublicApiPageResponse(success=True, data=[], total=0, page=page, limit=limit, total_pages=1)
+            return PublicApiPageResponse[HistoryListItemV2](success=True, data=[], total=0, page=page, limit=limit, total_pages=1)
 
-    # ✅ year/month (published_at 기준)
+    # ✅ year/month (published_at 기준) → 반열림 구간 [start, end) 으로 인덱스 사용
     if year is not None:
-        q = q.filter(History.published_at.isnot(None))
-        q = q.filter(extract("year", History.published_at) == year)
-
-    if month is not None:
+        start, end = _month_range(year, month) if month is not None else _year_range(year)
+        q = q.filter(History.published_at >= start, History.published_at < end)
+    elif month is not None:
+        # 연도 없이 월만 지정(매년 n월)은 범위 하나로 표현 불가 → extract 유지
         q = q.filter(History.published_at.isnot(None))
         q = q.filter(extract("month", History.published_at) == month)
 
-    # ✅ search (title/excerpt/content)
-    if search:
-        like = f"%{search}%"
-        q = q.filter(
-            or_(
-                History.title.ilike(like),
-                History.excerpt.ilike(like),
-                History.content.ilike(like),
-            )
-        )
+    # ✅ search (search_vector 전문 검색 + title/excerpt/content 부분 일치)
+    searcher = HistorySearch(search) if search and search.strip() else None
+    if searcher:
+        q = q.filter(searcher.filter())
 
-    # ✅ tag (Postgres ARRAY(TEXT) → any())
+    # ✅ tag (Postgres ARRAY → tags @> ARRAY[tag], GIN 인덱스 사용)
     if tag:
-        q = q.filter(History.tags.any(tag))
-
-    total = q.count()
-
-    q = q.order_by(desc(History.published_at), desc(History.created_at))
-    rows = q.offset((page - 1) * limit).limit(limit).all()
+        q = q.filter(History.tags.contains([tag]))
+
+    # ✅ total은 필터 조합별로 캐시 (history 변경 시 무효화)
+    count_key = (category, year, month, search, tag)
+    total = _history_counts.get(count_key)
+    if total is None:
+        total = q.count()
+        _history_counts.set(count_key, total)
+
+    # relevance 정렬은 keyset 불가 → page/limit(offset)만 지원
+    by_relevance = bool(searcher and sort == "relevance")
+    if by_relevance:
+        if cursor:
+            raise HTTPException(status_code=400, detail="cursor is not supported with sort=relevance")
+        q = q.order_by(desc(searcher.rank()), *HISTORY_ORDER)
+    else:
+        q = q.order_by(*HISTORY_ORDER)
+
+    with_highlight = bool(searcher and highlight)
+    if with_highlight:
+        q = q.add_columns(searcher.headline().label("highlight"))
+
+    # ✅ cursor 있으면 keyset, 없으면 기존 offset. 한 건 더 읽어서 다음 페이지 유무 판단
+    after = decode_cursor(cursor, ((datetime, type(None)), datetime, str))
+    if after:
+        q = q.filter(_history_after(*after))
+    else:
+        q = q.offset((page - 1) * limit)
+    rows = q.limit(limit + 1).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    if with_highlight:
+        rows, highlights = [r for r, _ in rows], [h for _, h in rows]
+    else:
+        highlights = [None] * len(rows)
 
     items = [
         HistoryListItemV2(
@@ -219,42 +336,135 @@ def get_published_history(
             tags=r.tags or [],
             publishedAt=r.published_at,
             viewCount=r.view_count or 0,
+            highlight=h,
         )
-        for r in rows
+        for r, h in zip(rows, highlights)
     ]
 
     total_pages = max(1, ceil(total / limit))
 
-    return PublicApiPageResponse(
+    next_cursor = None
+    if has_more and not by_relevance:
+        last = rows[-1]
+        next_cursor = encode_cursor([last.published_at, last.created_at, last.id])
+
+    return PublicApiPageResponse[HistoryListItemV2](
         success=True,
         data=items,
         total=total,
         page=page,
         limit=limit,
         total_pages=total_pages,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get(
+    "/history/archive",
+    response_model=PublicApiListResponse[HistoryArchiveItem],
+)
+async def get_history_archive(request: Request):
+    """월별 공개 글 수 (아카이브 사이드바용, 최신 월부터) - /history/{slug} 보다 먼저 선언"""
+    return await _cached_json(request, CACHE_NS_HISTORY, _build_history_archive, key="archive")
+
+
+def _build_history_archive(db: Session) -> PublicApiListResponse[HistoryArchiveItem]:
+    # ix_history_published_order (WHERE is_published) 범위에서만 집계
+    month_col = func.date_trunc("month", History.published_at).label("month")
+    rows = (
+        db.query(month_col, func.count().label("count"))
+        .filter(History.is_published, History.published_at.isnot(None))
+        .group_by(month_col)
+        .order_by(month_col.desc())
+        .all()
     )
+    items = [HistoryArchiveItem(year=m.year, month=m.month, count=c) for m, c in rows]
+    return PublicApiListResponse[HistoryArchiveItem](success=True, data=items)
+
+
+@router.get(
+    "/history/facets",
+    response_model=PublicApiResponse[HistoryFacets],
+)
+async def get_history_facets(
+    request: Request,
+    top: int = Query(20, ge=1, le=100, description="태그 상위 N개"),
+):
+    """카테고리별 / 태그 상위 N개 공개 글 수 - /history/{slug} 보다 먼저 선언"""
+    return await _cached_json(request, CACHE_NS_HISTORY, partial(_build_history_facets, top), key=f"facets:{top}")
+
+
+def _build_history_facets(top: int, db: Session) -> PublicApiResponse[HistoryFacets]:
+    # 카테고리 집계 + 태그(unnest) 상위 N개를 UNION ALL 한 번으로
+    published = select(History.category, History.tags).where(History.is_published).cte("published")
+
+    categories = select(
+        literal("category").label("facet"),
+        cast(published.c.category, String).label("value"),
+        func.count().label("count"),
+    ).group_by(published.c.category)
+
+    tag_values = select(func.unnest(published.c.tags).label("tag")).subquery("tag_values")
+    tag_count = func.count().label("count")
+    top_tags = (
+        select(tag_values.c.tag, tag_count)
+        .group_by(tag_values.c.tag)
+        .order_by(tag_count.desc(), tag_values.c.tag)
+        .limit(top)
+        .subquery("top_tags")
+    )
+    tags = select(literal("tag").label("facet"), top_tags.c.tag, top_tags.c.count)
+
+    rows = db.execute(union_all(categories, tags)).all()
+
+    # 글이 없는 카테고리도 0으로 내려줌 (Enum 순서)
+    category_counts = {c.value: 0 for c in HistoryCategory}
+    tag_items = []
+    for facet, value, count in rows:
+        if facet == "category":
+            category_counts[value] = count
+        else:
+            tag_items.append(FacetCount(value=value, count=count))
+
+    facets = HistoryFacets(
+        total=sum(category_counts.values()),
+        categories=[FacetCount(value=k, count=v) for k, v in category_counts.items()],
+        tags=tag_items,
+    )
+    return PublicApiResponse[HistoryFacets](success=True, data=facets)
 
 
 @router.get(
     "/history/{slug}",
     response_model=PublicApiResponse[HistoryDetailV2],
 )
-def get_history_post(slug: str, db: Session = Depends(get_db)):
+async def get_history_post(slug: str, request: Request):
+    entry = await _cached_entry(CACHE_NS_HISTORY, partial(_build_history_post, slug), key=f"detail:{slug}")
+
+    # ✅ 조회수 증가 (버퍼에만 쌓고 주기적으로 일괄 UPDATE → GET은 순수 read)
+    history_id = _history_slug_ids.get(slug)
+    if history_id is None:
+        # 다른 워커가 만든 L2(Redis) 캐시 hit 이면 id를 몰라서 body에서 꺼냄
+        history_id = json.loads(entry.body)["data"]["id"]
+        _history_slug_ids.set(slug, history_id)
+    await get_view_counter().record(history_id)
+
+    return conditional_response(request, entry.body, etag=entry.etag, policy=CACHE_POLICIES[CACHE_NS_HISTORY])
+
+
+def _build_history_post(slug: str, db: Session) -> PublicApiResponse[HistoryDetailV2]:
     r = (
         db.query(History)
         .filter(
             History.slug == slug,
-            History.is_published.is_(True),
+            History.is_published,
         )
         .first()
     )
     if not r:
         raise HTTPException(status_code=404, detail="Post not found")
 
-    # ✅ 조회수 증가
-    r.view_count = (r.view_count or 0) + 1
-    db.commit()
-    db.refresh(r)
+    _history_slug_ids.set(slug, r.id)
 
     detail = HistoryDetailV2(
         id=r.id,
@@ -269,7 +479,9 @@ def get_history_post(slug: str, db: Session = Depends(get_db)):
         viewCount=r.view_count or 0,
     )
 
-    return PublicApiResponse(success=True, data=detail)
+    return PublicApiResponse[HistoryDetailV2](success=True, data=detail)
+
+
 # -------------------------
 # Reviews (approved only)
 # -------------------------
@@ -277,7 +489,11 @@ def get_history_post(slug: str, db: Session = Depends(get_db)):
     "/reviews",
     response_model=PublicApiListResponse[ReviewItem],
 )
-def get_approved_reviews(db: Session = Depends(get_db)):
+async def get_approved_reviews(request: Request):
+    return await _cached_json(request, CACHE_NS_REVIEWS, _build_approved_reviews)
+
+
+def _build_approved_reviews(db: Session) -> PublicApiListResponse[ReviewItem]:
     rows = (
         db.query(PublicReview)
         .filter(PublicReview.approved.is_(True))
@@ -298,7 +514,7 @@ def get_approved_reviews(db: Session = Depends(get_db)):
         for r in rows
     ]
 
-    return PublicApiListResponse(success=True, data=items)
+    return PublicApiListResponse[ReviewItem](success=True, data=items)
 
 
 # -------------------------
@@ -308,7 +524,11 @@ def get_approved_reviews(db: Session = Depends(get_db)):
     "/services",
     response_model=PublicApiListResponse[ServiceItem],
 )
-def get_services(db: Session = Depends(get_db)):
+async def get_services(request: Request):
+    return await _cached_json(request, CACHE_NS_SERVICES, _build_services)
+
+
+def _build_services(db: Session) -> PublicApiListResponse[ServiceItem]:
     rows = (
         db.query(PublicService)
         .filter(PublicService.is_active.is_(True))
@@ -327,7 +547,7 @@ def get_services(db: Session = Depends(get_db)):
         for r in rows
     ]
 
-    return PublicApiListResponse(success=True, data=items)
+    return PublicApiListResponse[ServiceItem](success=True, data=items)
 
 
 # -------------------------
@@ -337,7 +557,11 @@ def get_services(db: Session = Depends(get_db)):
     "/differentiators",
     response_model=PublicApiListResponse[DifferentiatorItem],
 )
-def get_differentiators(db: Session = Depends(get_db)):
+async def get_differentiators(request: Request):
+    return await _cached_json(request, CACHE_NS_DIFFERENTIATORS, _build_differentiators)
+
+
+def _build_differentiators(db: Session) -> PublicApiListResponse[DifferentiatorItem]:
     rows = (
         db.query(PublicDifferentiator)
         .filter(PublicDifferentiator.is_active.is_(True))
@@ -355,7 +579,7 @@ def get_differentiators(db: Session = Depends(get_db)):
         for r in rows
     ]
 
-    return PublicApiListResponse(success=True, data=items)
+    return PublicApiListResponse[DifferentiatorItem](success=True, data=items)
 
 
 # -------------------------
@@ -365,7 +589,12 @@ def get_differentiators(db: Session = Depends(get_db)):
     "/info",
     response_model=PublicApiResponse[PublicInfoOut],
 )
-def get_public_info(db: Session = Depends(get_db)):
+async def get_public_info(request: Request):
+    return await _cached_json(request, CACHE_NS_INFO, _build_public_info)
+
+
+def _build_public_info(db: Session) -> PublicApiResponse[PublicInfoOut]:
+    # 404는 캐시되지 않음 (builder 예외는 그대로 전파)
     row = db.query(PublicInfo).filter(PublicInfo.id == 1).first()
     if not row:
         raise HTTPException(status_code=404, detail="Public info not configured")
@@ -378,4 +607,4 @@ def get_public_info(db: Session = Depends(get_db)):
         email=row.email,
     )
 
-    return PublicApiResponse(success=True, data=out)
+    return PublicApiResponse[PublicInfoOut](success=True, data=out)
@@ -1,12 +1,15 @@
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.security import get_current_user
-from app.models.resident import Resident
-from app.models.user import User
+from app.core.listing import ListParams, ListQuery, list_params
+from app.core.responses import api_json
+from app.core.security import Principal, get_current_user
+from app.models.resident import Resident, ResidentStatus
 from app.schemas.resident import ResidentCreate, ResidentUpdate, ResidentResponse
 from app.schemas.response import ApiResponse
 
@@ -16,21 +19,43 @@ def to_resident_dict(obj: Resident) -> dict:
     return ResidentResponse.model_validate(obj).model_dump()
 
 
+resident_list = ListQuery(
+    Resident,
+    ResidentResponse,
+    sorts={
+        "created_at": Resident.created_at,
+        "name": Resident.name,
+        "admission_date": Resident.admission_date,
+        "room_number": Resident.room_number,
+    },
+    # ✅ 관리자 입소자 테이블 화면용 (notes 제외)
+    presets={
+        "summary": (
+            "id", "name", "gender", "birth_date", "admission_date",
+            "room_number", "grade", "status", "created_at",
+        ),
+    },
+)
+
+
 @router.get("", response_model=ApiResponse)
 def list_residents(
+    params: ListParams = Depends(list_params),
+    status: Optional[ResidentStatus] = Query(None),
+    room_number: Optional[str] = Query(None),
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
-    residents = db.query(Resident).order_by(Resident.created_at.desc()).all()
-    data = [to_resident_dict(r) for r in residents]
-    return ApiResponse(success=True, data=data)
+    data, meta = resident_list.run(db, params, {Resident.status: status, Resident.room_number: room_number})
+    # ✅ ListQuery 결과는 이미 검증된 JSON 호환 값 → response_model 재검증 없이 bytes로 응답
+    return api_json(data, meta=meta)
 
 
 @router.post("", response_model=ApiResponse, status_code=status.HTTP_201_CREATED)
 def create_resident(
     payload: ResidentCreate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     resident = Resident(**payload.model_dump())
     db.add(resident)
@@ -43,7 +68,7 @@ def create_resident(
 def get_resident(
     resident_id: str,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     resident = db.query(Resident).filter(Resident.id == resident_id).first()
     if not resident:
@@ -56,7 +81,7 @@ def update_resident(
     resident_id: str,
     payload: ResidentUpdate,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     resident = db.query(Resident).filter(Resident.id == resident_id).first()
     if not resident:
@@ -78,7 +103,7 @@ def update_resident(
 def delete_resident(
     resident_id: str,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     resident = db.query(Resident).filter(Resident.id == resident_id).first()
     if not resident:
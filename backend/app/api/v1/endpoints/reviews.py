@@ -1,12 +1,14 @@
 from datetime import datetime
+from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
 
 from app.core.database import get_db
-from app.core.security import get_current_user
+from app.core.listing import ListParams, ListQuery, list_params
+from app.core.responses import api_json
+from app.core.security import Principal, get_current_user
 from app.models.review import Review
-from app.models.user import User
 from app.schemas.response import ApiResponse
 from app.schemas.review import ReviewResponse
 
@@ -16,22 +18,34 @@ def to_review_dict(obj: Review) -> dict:
     return ReviewResponse.model_validate(obj).model_dump()
 
 
+review_list = ListQuery(
+    Review,
+    ReviewResponse,
+    sorts={
+        "created_at": Review.created_at,
+        "rating": Review.rating,
+    },
+)
+
+
 @router.get("", response_model=ApiResponse)
 def list_reviews(
+    params: ListParams = Depends(list_params),
+    is_approved: Optional[bool] = Query(None),
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     """후기 목록 조회"""
-    rows = db.query(Review).order_by(Review.created_at.desc()).all()
-    data = [to_review_dict(r) for r in rows]
-    return ApiResponse(success=True, data=data)
+    data, meta = review_list.run(db, params, {Review.is_approved: is_approved})
+    # ✅ ListQuery 결과는 이미 검증된 JSON 호환 값 → response_model 재검증 없이 bytes로 응답
+    return api_json(data, meta=meta)
 
 
 @router.get("/{review_id}", response_model=ApiResponse)
 def get_review(
     review_id: str,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     """후기 상세 조회"""
     row = db.query(Review).filter(Review.id == review_id).first()
@@ -44,7 +58,7 @@ def get_review(
 def approve_review(
     review_id: str,
     db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_user),
 ):
     """후기 승인"""
     row = db.query(Review).filter(Review.id == review_id).first()
@@ -64,7 +78,7 @@ def approve_review(
 def reject_review(
     review_id: str,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     """후기 거부 (삭제)"""
     row = db.query(Review).filter(Review.id == review_id).first()
@@ -80,7 +94,7 @@ def reject_review(
 def delete_review(
     review_id: str,
     db: Session = Depends(get_db),
-    _: User = Depends(get_current_user),
+    _: Principal = Depends(get_current_user),
 ):
     """후기 삭제"""
     row = db.query(Review).filter(Review.id == review_id).first()
@@ -1,85 +1,31 @@
 """
 Simple Click Tracking API - 부정클릭 방지 + 팝업
 """
-from fastapi import APIRouter, Depends, Request
-from sqlalchemy.orm import Session
-from sqlalchemy import func, and_
+import csv
+import io
+import json
+import uuid
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, tuple_
 from datetime import datetime, timedelta
+from typing import Literal, Optional
 
-from app.core.database import get_db
+from app.core.client_ip import get_client_ip
+from app.core.database import get_async_db, SessionLocal
+from app.core.pagination import decode_cursor, encode_cursor
 from app.core.security import get_current_admin_user
 from app.models.click_event import ClickEvent
+from app.services.click_counter import get_click_counter
+from app.services.click_ingest import get_click_ingestor
+from app.services.click_rollup import get_click_stats, get_suspicious_ips as query_suspicious_ips
 
 router = APIRouter()
 
-
-def get_client_ip(request: Request) -> str:
-    """클라이언트 IP 추출"""
-    forwarded = request.headers.get("X-Forwarded-For")
-    if forwarded:
-        return forwarded.split(",")[0].strip()
-    
-    real_ip = request.headers.get("X-Real-IP")
-    if real_ip:
-        return real_ip
-    
-    if request.client:
-        return request.client.host
-    
-    return "unknown"
-
-
-def is_suspicious(ip_hash: str, db: Session) -> bool:
-    """부정클릭 감지"""
-    now = datetime.utcnow()
-    
-    # 1시간 내 5회 이상?
-    one_hour_ago = now - timedelta(hours=1)
-    recent_clicks = db.query(ClickEvent).filter(
-        and_(
-            ClickEvent.ip_hash == ip_hash,
-            ClickEvent.created_at >= one_hour_ago
-        )
-    ).count()
-    
-    if recent_clicks >= 5:
-        return True
-    
-    # 하루 내 10회 이상?
-    one_day_ago = now - timedelta(days=1)
-    daily_clicks = db.query(ClickEvent).filter(
-        and_(
-            ClickEvent.ip_hash == ip_hash,
-            ClickEvent.created_at >= one_day_ago
-        )
-    ).count()
-    
-    return daily_clicks >= 10
-
-
-def should_show_help_popup(ip_hash: str, event_type: str, db: Session) -> bool:
-    """
-    도움 팝업 표시 여부 판단
-    같은 페이지를 1시간 내 3회 방문하면 True (테스트용)
-    """
-    # 페이지뷰 이벤트만 체크
-    if not event_type.startswith('page_view_'):
-        return False
-    
-    now = datetime.utcnow()
-    one_hour_ago = now - timedelta(hours=1)
-    
-    # 같은 페이지 방문 횟수
-    same_page_visits = db.query(ClickEvent).filter(
-        and_(
-            ClickEvent.ip_hash == ip_hash,
-            ClickEvent.event_type == event_type,
-            ClickEvent.created_at >= one_hour_ago
-        )
-    ).count()
-    
-    # 3회 이상 방문 시 팝업 표시 (테스트용 - 원래는 10회)
-    return same_page_visits >= 3
+# /all 스트리밍: keyset 페이지 크기 / server-side cursor fetch 크기
+EXPORT_CHUNK_SIZE = 10_000
+EXPORT_YIELD_PER = 1_000
 
 
 # ========== Public API ==========
@@ -88,31 +34,24 @@ def should_show_help_popup(ip_hash: str, event_type: str, db: Session) -> bool:
 async def track_click(
     event_type: str,
     request: Request,
-    db: Session = Depends(get_db)
 ):
     """
     클릭 추적 (IP 자동 수집)
     + 반복 방문 감지
+    저장은 write-behind 큐에 넣고 바로 응답 (배치 INSERT)
     """
     # IP 추출 및 해싱
     client_ip = get_client_ip(request)
     ip_hash = ClickEvent.hash_ip(client_ip)
     
-    # 부정클릭 감지
-    suspicious = is_suspicious(ip_hash, db)
-    
-    # 도움 팝업 표시 여부
-    show_popup = should_show_help_popup(ip_hash, event_type, db)
-    
-    # 저장
-    click = ClickEvent(
-        ip_hash=ip_hash,
-        event_type=event_type,
-        is_suspicious=suspicious
-    )
+    # 부정클릭 감지 + 도움 팝업 표시 여부 (memory/redis 카운터, DB 조회 없음)
+    # 카운터 member와 click_events.id를 같게 → 재시작 warm-up 때 같은 클릭이 두 번 세지지 않음
+    event_id = str(uuid.uuid4())
+    suspicious, show_popup = await get_click_counter().check_and_record(ip_hash, event_type, event_id)
     
-    db.add(click)
-    db.commit()
+    # 저장 (큐에 넣기만 함)
+    ingestor = get_click_ingestor()
+    await ingestor.enqueue(ingestor.build_row(ip_hash, event_type, suspicious, event_id=event_id))
     
     # 디버깅용 로그
     print(f"[Track] {event_type} | IP: {ip_hash[:16]}... | Popup: {show_popup}")
@@ -131,33 +70,21 @@ async def track_click(
 async def get_stats(
     days: int = 7,
     current_user = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """클릭 통계 (Admin)"""
-    start_date = datetime.utcnow() - timedelta(days=days)
-    
-    # 전체 클릭
-    total = db.query(ClickEvent).filter(
-        ClickEvent.created_at >= start_date
-    ).count()
-    
-    # 의심 클릭
-    suspicious = db.query(ClickEvent).filter(
-        and_(
-            ClickEvent.created_at >= start_date,
-            ClickEvent.is_suspicious == True
-        )
-    ).count()
-    
-    # 고유 IP
-    unique_ips = db.query(func.count(func.distinct(ClickEvent.ip_hash))).filter(
-        ClickEvent.created_at >= start_date
-    ).scalar()
-    
+    """클릭 통계 (Admin) - 롤업 테이블 기반"""
+    now = datetime.utcnow()
+    start_date = now - timedelta(days=days)
+
+    # 동기 집계 함수를 async 세션 위에서 실행 (I/O는 async 드라이버)
+    stats = await db.run_sync(get_click_stats, start_date, now)
+    total = stats["total"]
+    suspicious = stats["suspicious"]
+
     return {
         "total_clicks": total,
         "suspicious_clicks": suspicious,
-        "unique_ips": unique_ips or 0,
+        "unique_ips": stats["unique_ips"],
         "suspicious_rate": f"{(suspicious/total*100):.1f}%" if total > 0 else "0%"
     }
 
@@ -165,52 +92,144 @@ async def get_stats(
 @router.get("/suspicious")
 async def get_suspicious_ips(
     current_user = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """의심스러운 IP 목록 (Admin)"""
-    # IP별 클릭 수 집계
-    result = db.query(
-        ClickEvent.ip_hash,
-        func.count(ClickEvent.id).label('count'),
-        func.max(ClickEvent.created_at).label('last_click')
-    ).group_by(ClickEvent.ip_hash).all()
-    
-    # 10회 이상 클릭한 IP만
-    suspicious = [
+    """의심스러운 IP 목록 (Admin) - 10회 이상 클릭한 IP, 클릭 수 내림차순"""
+    result = await db.run_sync(query_suspicious_ips, min_clicks=10)
+
+    return [
         {
             "ip_hash": ip_hash[:16] + "...",
             "click_count": count,
             "last_click": last_click.isoformat()
         }
         for ip_hash, count, last_click in result
-        if count >= 10
     ]
-    
-    # 클릭 수 기준 정렬
-    suspicious.sort(key=lambda x: x['click_count'], reverse=True)
-    
-    return suspicious
+
+
+def _event_to_dict(row) -> dict:
+    return {
+        "event_type": row.event_type,
+        "ip_hash": row.ip_hash,
+        "created_at": row.created_at.isoformat(),
+        "is_suspicious": row.is_suspicious
+    }
+
+
+def _select_events(start_date: datetime, after: Optional[list], limit: int):
+    """created_at >= start_date 이벤트를 (created_at, id) 오름차순 keyset으로 조회"""
+    q = select(
+        ClickEvent.id,
+        ClickEvent.event_type,
+        ClickEvent.ip_hash,
+        ClickEvent.created_at,
+        ClickEvent.is_suspicious,
+    ).where(ClickEvent.created_at >= start_date)
+
+    if after:
+        q = q.where(tuple_(ClickEvent.created_at, ClickEvent.id) > tuple_(*after))
+
+    return q.order_by(ClickEvent.created_at.asc(), ClickEvent.id.asc()).limit(limit)
+
+
+def _iter_events(start_date: datetime):
+    """
+    전체 구간을 EXPORT_CHUNK_SIZE 단위 keyset 페이지로 끊어 읽음.
+    각 페이지는 server-side cursor(yield_per)로 스트리밍 → 메모리 일정.
+    StreamingResponse가 threadpool에서 돌리므로 요청 세션 대신 별도 세션 사용.
+    """
+    db = SessionLocal()
+    try:
+        after = None
+        while True:
+            stmt = _select_events(start_date, after, EXPORT_CHUNK_SIZE)
+            result = db.execute(stmt.execution_options(yield_per=EXPORT_YIELD_PER))
+            fetched = 0
+            last = None
+            for row in result:
+                fetched += 1
+                last = row
+                yield row
+            if fetched < EXPORT_CHUNK_SIZE:
+                break
+            after = [last.created_at, last.id]
+    finally:
+        db.close()
+
+
+def _stream_json(start_date: datetime):
+    # 기존 /all 응답과 동일한 JSON 배열을 한 줄씩 흘려보냄
+    yield "["
+    first = True
+    for row in _iter_events(start_date):
+        yield ("" if first else ",") + json.dumps(_event_to_dict(row), ensure_ascii=False)
+        first = False
+    yield "]"
+
+
+def _stream_ndjson(start_date: datetime):
+    for row in _iter_events(start_date):
+        yield json.dumps(_event_to_dict(row), ensure_ascii=False) + "\n"
+
+
+def _stream_csv(start_date: datetime):
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["event_type", "ip_hash", "created_at", "is_suspicious"])
+    for i, row in enumerate(_iter_events(start_date), start=1):
+        writer.writerow([row.event_type, row.ip_hash, row.created_at.isoformat(), row.is_suspicious])
+        if i % EXPORT_YIELD_PER == 0:
+            yield buf.getvalue()
+            buf.seek(0)
+            buf.truncate(0)
+    yield buf.getvalue()
 
 
 @router.get("/all")
 async def get_all_events(
     days: int = 7,
+    format: Literal["json", "ndjson", "csv"] = "json",
     current_user = Depends(get_current_admin_user),
-    db: Session = Depends(get_db)
 ):
-    """전체 이벤트 조회 (Admin)"""
+    """
+    전체 이벤트 조회 (Admin) - 스트리밍 응답
+    - json  : 기존과 같은 JSON 배열
+    - ndjson: 한 줄에 이벤트 하나
+    - csv   : 파일 다운로드
+    """
     start_date = datetime.utcnow() - timedelta(days=days)
-    
-    events = db.query(ClickEvent).filter(
-        ClickEvent.created_at >= start_date
-    ).all()
-    
-    return [
-        {
-            "event_type": e.event_type,
-            "ip_hash": e.ip_hash,
-            "created_at": e.created_at.isoformat(),
-            "is_suspicious": e.is_suspicious
-        }
-        for e in events
-    ]
\ No newline at end of file
+
+    if format == "ndjson":
+        return StreamingResponse(_stream_ndjson(start_date), media_type="application/x-ndjson")
+
+    if format == "csv":
+        filename = f"click_events_{datetime.utcnow():%Y%m%d}.csv"
+        return StreamingResponse(
+            _stream_csv(start_date),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+        )
+
+    return StreamingResponse(_stream_json(start_date), media_type="application/json")
+
+
+@router.get("/events")
+async def get_events_page(
+    days: int = 7,
+    limit: int = Query(500, ge=1, le=5000),
+    cursor: Optional[str] = Query(None),
+    current_user = Depends(get_current_admin_user),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """이벤트 페이지 조회 (Admin) - cursor 기반, next_cursor가 null이면 마지막 페이지"""
+    start_date = datetime.utcnow() - timedelta(days=days)
+    after = decode_cursor(cursor, (datetime, str))
+
+    rows = (await db.execute(_select_events(start_date, after, limit + 1))).all()
+    has_more = len(rows) > limit
+    rows = rows[:limit]
+
+    return {
+        "items": [_event_to_dict(r) for r in rows],
+        "next_cursor": encode_cursor([rows[-1].created_at, rows[-1].id]) if has_more else None,
+    }
@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from app.api.v1.endpoints import auth, public, residents, staff, contacts, reviews, history, dashboard, tracking
+from app.api.v1.endpoints import auth, public, residents, staff, contacts, reviews, history, dashboard, tracking, metrics, outbox
 
 api_router = APIRouter()
 
@@ -58,4 +58,16 @@ api_router.include_router(
     tracking.router,
     prefix="/track",
     tags=["tracking"]
-)
\ No newline at end of file
+)
+
+api_router.include_router(
+    metrics.router,
+    prefix="/metrics",
+    tags=["metrics"]
+)
+
+api_router.include_router(
+    outbox.router,
+    prefix="/outbox",
+    tags=["outbox"]
+)
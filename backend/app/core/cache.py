@@ -0,0 +1,279 @@
+"""
+Cache - 프로세스 내 TTL/LRU 캐시 + 공개 API 응답 캐시
+
+- TTLCache: 스레드 안전 LRU + TTL (카운트/통계 등 작은 값 캐싱용)
+- ResponseCache: 직렬화된 JSON bytes 캐시 (L1 프로세스 LRU, 선택적으로 L2 Redis)
+
+무효화는 테이블 단위:
+ORM 세션이 commit될 때 flush된 테이블 이름을 모아 해당 namespace를 지움.
+캐시 키는 "<namespace>:<나머지>" 형태이고, namespace ↔ 테이블 매핑은 depends_on()으로 등록.
+"""
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Dict, Hashable, Iterable, NamedTuple, Optional, Set
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.core.http_cache import compute_etag
+
+logger = logging.getLogger(__name__)
+
+_MISSING = object()
+
+
+class TTLCache:
+    """스레드 안전 LRU + TTL 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING or item[0] < time.monotonic():
+                if item is not _MISSING:
+                    del self._data[key]
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return item[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def delete_prefix(self, prefix: str) -> int:
+        with self._lock:
+            keys = [k for k in self._data if isinstance(k, str) and k.startswith(prefix)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def delete_where(self, predicate: Callable[[Hashable, Any], bool]) -> int:
+        with self._lock:
+            keys = [k for k, (_, v) in self._data.items() if predicate(k, v)]
+            for k in keys:
+                del self._data[k]
+            return len(keys)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {"size": len(self._data), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# =========================================================
+# Table → namespace 무효화
+# =========================================================
+# table name → 그 테이블에 의존하는 cache namespace 들
+_dependencies: Dict[str, Set[str]] = {}
+# namespace 무효화 콜백 (ResponseCache, TTLCache 등)
+_invalidators: list = []
+
+
+def depends_on(namespace: str, *tables: str) -> str:
+    """namespace가 tables에 의존함을 등록 (해당 테이블 write 시 무효화)"""
+    for table in tables:
+        _dependencies.setdefault(table, set()).add(namespace)
+    return namespace
+
+
+def registered_namespaces() -> Set[str]:
+    return set().union(*_dependencies.values()) if _dependencies else set()
+
+
+def register_invalidator(fn: Callable[[str], None]) -> None:
+    _invalidators.append(fn)
+
+
+def invalidate_namespaces(namespaces: Iterable[str]) -> None:
+    for ns in namespaces:
+        for fn in _invalidators:
+            try:
+                fn(ns)
+            except Exception as e:
+                logger.warning(f"[Cache] invalidate {ns} failed: {e}")
+
+
+def invalidate_tables(*tables: str) -> None:
+    """테이블 변경을 명시적으로 알림 (ORM 밖에서 raw SQL로 바꿨을 때 등)"""
+    namespaces = set()
+    for table in tables:
+        namespaces |= _dependencies.get(table, set())
+    invalidate_namespaces(namespaces)
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_dirty_tables(session, flush_context):
+    tables = session.info.setdefault("cache_dirty_tables", set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        table = getattr(obj, "__tablename__", None)
+        if table:
+            tables.add(table)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _collect_bulk_tables(orm_execute_state):
+    # query.update()/delete(), session.execute(update(Model)) 같은 bulk 문은 flush를 안 거침
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete or orm_execute_state.is_insert):
+        return
+    mapper = orm_execute_state.bind_mapper
+    if mapper is not None:
+        orm_execute_state.session.info.setdefault("cache_dirty_tables", set()).add(mapper.local_table.name)
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_commit(session):
+    tables = session.info.pop("cache_dirty_tables", None)
+    if tables:
+        invalidate_tables(*tables)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_on_rollback(session):
+    session.info.pop("cache_dirty_tables", None)
+
+
+# =========================================================
+# Response cache (JSON bytes)
+# =========================================================
+class CachedBody(NamedTuple):
+    body: bytes
+    etag: str
+
+
+class ResponseCache:
+    """
+    직렬화된 응답 bytes 캐시
+    - L1: 프로세스 LRU
+    - L2: Redis (RESPONSE_CACHE_REDIS=True) - 워커 간 공유.
+      다른 워커의 L1은 무효화 신호를 못 받으므로 L1 TTL을 RESPONSE_CACHE_LOCAL_MAX_TTL로 제한
+    - namespace_prefix로 시작하는 namespace만 담당 (다른 namespace 무효화는 무시)
+
+    L2 무효화는 namespace별 세대 번호(rc:gen:<namespace>) INCR 한 번 (SCAN/DEL 없음):
+    값 앞에 저장 당시 세대를 붙여 두고, 조회 때 MGET(세대, 값) 한 번으로 세대가 다르면 miss 처리.
+    옛 세대 값은 TTL로 자연 만료.
+    """
+
+    redis_prefix = "rc:"
+    generation_prefix = "rc:gen:"
+
+    def __init__(self, maxsize: int, use_redis: bool, local_max_ttl: float, namespace_prefix: str = "public."):
+        self.local = TTLCache(maxsize=maxsize)
+        self.use_redis = use_redis
+        self.local_max_ttl = local_max_ttl
+        self.namespace_prefix = namespace_prefix
+        self._pending: Set[asyncio.Task] = set()
+        register_invalidator(self.invalidate)
+
+    def _local_ttl(self, ttl: float) -> float:
+        return min(ttl, self.local_max_ttl) if self.use_redis else ttl
+
+    async def get_or_build(self, key: str, ttl: float, builder: Callable[[], bytes]) -> CachedBody:
+        """캐시에 있으면 바로 반환, 없으면 builder를 threadpool에서 실행해 저장 (ETag도 함께 보관)"""
+        entry = self.local.get(key)
+        if entry is not None:
+            return entry
+
+        generation = b"0"
+        if self.use_redis:
+            namespace = key.split(":", 1)[0]
+            try:
+                from app.core.redis import get_redis
+
+                current, stored = await get_redis().mget(self.generation_prefix + namespace, self.redis_prefix + key)
+            except Exception as e:
+                logger.warning(f"[Cache] redis get failed: {e}")
+                current, stored = None, None
+            generation = _as_bytes(current) if current is not None else b"0"
+            if stored is not None:
+                stored_generation, _, body = _as_bytes(stored).partition(b":")
+                if stored_generation == generation:
+                    entry = CachedBody(body, compute_etag(body))
+                    self.local.set(key, entry, self._local_ttl(ttl))
+                    return entry
+
+        body = await run_in_threadpool(builder)
+        entry = CachedBody(body, compute_etag(body))
+        self.local.set(key, entry, self._local_ttl(ttl))
+
+        if self.use_redis:
+            # build 전에 읽은 세대로 저장 → build 중에 무효화되면 이 값은 바로 옛 세대가 됨
+            try:
+                from app.core.redis import get_redis
+
+                await get_redis().set(self.redis_prefix + key, generation + b":" + body, ex=int(ttl))
+            except Exception as e:
+                logger.warning(f"[Cache] redis set failed: {e}")
+        return entry
+
+    def invalidate(self, namespace: str) -> None:
+        if not namespace.startswith(self.namespace_prefix):
+            return
+        self.local.delete_prefix(f"{namespace}:")
+        if self.use_redis:
+            self._bump_generation(self.generation_prefix + namespace)
+
+    def _bump_generation(self, key: str) -> None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is None:
+            # threadpool의 동기 세션 commit → 동기 클라이언트로 INCR 한 번
+            from app.core.redis import get_sync_redis
+
+            get_sync_redis().incr(key)
+            return
+        # 이벤트 루프 스레드(AsyncSession commit 등) → 루프를 막지 않도록 비동기 INCR 예약
+        task = loop.create_task(self._incr(key))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    @staticmethod
+    async def _incr(key: str) -> None:
+        from app.core.redis import get_redis
+
+        try:
+            await get_redis().incr(key)
+        except Exception as e:
+            logger.warning(f"[Cache] redis invalidate {key} failed: {e}")
+
+    def stats(self) -> dict:
+        return {"redis": self.use_redis, **self.local.stats()}
+
+
+def _as_bytes(value) -> bytes:
+    # redis 클라이언트가 decode_responses=True 라서 str로 올 수 있음
+    return value.encode() if isinstance(value, str) else value
+
+
+response_cache = ResponseCache(
+    maxsize=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    use_redis=settings.RESPONSE_CACHE_REDIS,
+    local_max_ttl=settings.RESPONSE_CACHE_LOCAL_MAX_TTL,
+)
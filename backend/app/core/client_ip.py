@@ -0,0 +1,62 @@
+"""
+클라이언트 IP 추출 (Caddy 리버스 프록시 뒤 기준)
+
+tracking(부정클릭 판정), auth(로그인 시도 제한) 등에서 공용으로 사용
+
+X-Forwarded-For 맨 앞 값은 클라이언트가 마음대로 넣을 수 있으므로 쓰지 않는다.
+- 직접 연결한 상대(request.client)가 TRUSTED_PROXIES일 때만 프록시 헤더를 봄
+- X-Forwarded-For는 오른쪽(프록시가 붙인 쪽)부터 신뢰 프록시를 건너뛰고 처음 나오는 주소
+- 없으면 X-Real-IP (Caddy가 {remote_host}로 덮어씀), 그것도 없으면 request.client
+"""
+import ipaddress
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from fastapi import Request
+
+from app.core.config import settings
+
+
+@lru_cache(maxsize=1)
+def _trusted_networks() -> Tuple[ipaddress._BaseNetwork, ...]:
+    return tuple(
+        ipaddress.ip_network(item.strip(), strict=False)
+        for item in settings.TRUSTED_PROXIES.split(",")
+        if item.strip()
+    )
+
+
+def _parse_ip(value: str) -> Optional[ipaddress._BaseAddress]:
+    try:
+        return ipaddress.ip_address(value.strip())
+    except ValueError:
+        return None
+
+
+def _is_trusted(ip: ipaddress._BaseAddress) -> bool:
+    return any(ip in network for network in _trusted_networks())
+
+
+def get_client_ip(request: Request) -> str:
+    """클라이언트 IP 추출"""
+    peer = _parse_ip(request.client.host) if request.client else None
+    if peer is None:
+        return request.client.host if request.client else "unknown"
+    if not _is_trusted(peer):
+        # 프록시를 거치지 않은 직접 요청 → 헤더는 위조 가능
+        return str(peer)
+
+    forwarded = request.headers.get("X-Forwarded-For")
+    if forwarded:
+        hops = [_parse_ip(hop) for hop in forwarded.split(",")]
+        for hop in reversed(hops):
+            if hop is None:
+                break  # 형식이 깨진 값부터 왼쪽은 믿지 않음
+            if not _is_trusted(hop):
+                return str(hop)
+
+    real_ip = _parse_ip(request.headers.get("X-Real-IP", ""))
+    if real_ip is not None:
+        return str(real_ip)
+
+    return str(peer)
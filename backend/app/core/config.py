@@ -5,7 +5,11 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
     
-    # Redis
+    # Async DB 커넥션 풀 (동기 풀과 별도, app/core/database.py)
+    ASYNC_DB_POOL_SIZE: int = 10
+    ASYNC_DB_MAX_OVERFLOW: int = 10
+
+    # Redis ("fakeredis://" → 로컬/테스트용 인메모리 대체)
     REDIS_URL: str = "redis://localhost:6379/0"
     
     # Security
@@ -15,8 +19,20 @@ class Settings(BaseSettings):
     
     # CORS
     CORS_ORIGINS: str
+
+    # 리버스 프록시 (이 주소에서 온 요청만 X-Forwarded-For / X-Real-IP를 믿음, comma separated IP/CIDR)
+    # 기본값: localhost + 사설망 (docker 네트워크의 Caddy)
+    TRUSTED_PROXIES: str = "127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16"
     
     OPENAI_API_KEY: str = ""
+    OPENAI_BASE_URL: str = ""           # 비우면 공식 API (프록시/로컬 stub 서버 사용 시 지정)
+    OPENAI_MAX_CONCURRENCY: int = 4     # 프로세스 내 동시 OpenAI 호출 상한
+    OPENAI_MAX_RETRIES: int = 1         # SDK 자동 재시도 (전체 시간은 OPENAI_TIMEOUT deadline으로 제한)
+    AI_BACKLOG_BATCH_SIZE: int = 20     # backlog 분석 페이지 크기 (= bulk UPDATE 1회 건수)
+    AI_BACKLOG_JOB_BUDGET_RATIO: float = 0.75  # backlog outbox job 1건 시간 예산 = OUTBOX_JOB_TIMEOUT_SECONDS × 비율 (나머지는 저장/다음 job 등록 여유)
+    AI_CACHE_ENABLED: bool = True       # 같은 (문의유형, 내용, 모델, 프롬프트 버전) 분석 결과 재사용
+    AI_CACHE_TTL_SECONDS: int = 60 * 60 * 24 * 30
+    AI_CACHE_MAX_ENTRIES: int = 10000   # 초과분은 최근 사용(last_hit_at)이 오래된 것부터 삭제
     
     # =============================
     # Email Provider
@@ -52,6 +68,58 @@ class Settings(BaseSettings):
     SMTP_PORT: int = 587
     SMTP_USER: str = ""
     SMTP_PASSWORD: str = ""
+
+    # Click tracking (부정클릭/팝업 판정 카운터)
+    CLICK_COUNTER_BACKEND: Literal["memory", "redis"] = "memory"
+    CLICK_COUNTER_MAX_KEYS: int = 100_000
+
+    # Click ingest (ClickEvent write-behind 배치 적재)
+    CLICK_INGEST_BATCH_SIZE: int = 200
+    CLICK_INGEST_FLUSH_INTERVAL_MS: int = 500
+    CLICK_INGEST_QUEUE_SIZE: int = 10_000
+    CLICK_INGEST_ENQUEUE_TIMEOUT_MS: int = 100
+    CLICK_INGEST_FLUSH_RETRIES: int = 3     # 배치 INSERT 실패 시 재시도 횟수 (다 실패하면 버리고 건수 로그)
+
+    # click_events 월별 파티션 (scripts/click_partitions.py)
+    CLICK_PARTITIONS_AHEAD: int = 3
+    CLICK_EVENTS_RETENTION_DAYS: int = 180
+    CLICK_PARTITIONS_ARCHIVE: bool = False
+
+    # history 조회수 버퍼 (app/services/view_counter.py)
+    VIEW_COUNTER_BACKEND: Literal["memory", "redis"] = "memory"
+    VIEW_COUNT_FLUSH_INTERVAL_MS: int = 5000
+
+    # 관리자 대시보드 통계 캐시(초)
+    DASHBOARD_STATS_TTL: int = 5
+
+    # 공개 API 응답 캐시 (app/core/cache.py)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 512
+    RESPONSE_CACHE_REDIS: bool = False      # True면 Redis를 워커 간 공유 L2로 사용
+    RESPONSE_CACHE_LOCAL_MAX_TTL: int = 5   # Redis 사용 시 프로세스 L1 TTL 상한(초)
+
+    # 로그인 시도 제한 (app/services/login_limiter.py) - 비밀번호 해시 검증 전에 차단
+    LOGIN_LIMITER_BACKEND: Literal["memory", "redis"] = "memory"
+    LOGIN_ATTEMPT_WINDOW_SECONDS: int = 300
+    LOGIN_MAX_ATTEMPTS_PER_EMAIL: int = 5
+    LOGIN_MAX_ATTEMPTS_PER_IP: int = 30
+
+    # bcrypt 검증 전용 스레드 풀 (app/core/security.py)
+    PASSWORD_HASH_WORKERS: int = 2          # 동시에 해시 계산하는 스레드 수
+    PASSWORD_HASH_MAX_PENDING: int = 16     # 실행+대기 합계 상한, 넘으면 503
+
+    # Outbox 워커 (python -m app.worker)
+    OUTBOX_WORKER_CONCURRENCY: int = 4      # 동시에 실행하는 job 수
+    OUTBOX_POLL_INTERVAL_MS: int = 1000     # 대기 job이 없을 때 다시 조회하는 간격
+    OUTBOX_MAX_ATTEMPTS: int = 5
+    OUTBOX_BACKOFF_BASE_SECONDS: int = 10   # 재시도 간격 = base * 2^(attempts-1) (+jitter), 상한 MAX
+    OUTBOX_BACKOFF_MAX_SECONDS: int = 3600
+    OUTBOX_JOB_TIMEOUT_SECONDS: int = 120   # job 1건 실행 제한 시간
+    OUTBOX_LOCK_TIMEOUT_SECONDS: int = 600  # RUNNING으로 이보다 오래 남은 job은 워커가 죽은 것으로 보고 재대기
+    OUTBOX_DONE_RETENTION_DAYS: int = 7     # DONE job 보관 기간 (payload에 연락처/문의 내용 사본이 있으므로 오래 두지 않음)
+
+    # 인증 토큰 검증 캐시 (app/core/security.py) - 토큰 exp보다 오래 보관하지 않음
+    AUTH_TOKEN_CACHE_TTL: int = 60          # 다른 워커의 role 변경/로그아웃 반영 지연 상한(초)
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 1024
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,85 @@
+"""
+HTTP 캐시 헤더 - ETag / If-None-Match(304) / Cache-Control
+
+공개 GET 라우트에서 직렬화된 JSON bytes로 응답할 때 사용.
+- ETag: 응답 body 해시 (ResponseCache 엔트리에 같이 저장되므로 hit 시 재계산 없음)
+- If-None-Match 일치 → 304 Not Modified (body 없이)
+- Cache-Control: 라우트별 CachePolicy (max-age / s-maxage / stale-while-revalidate)
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Caddy `encode gzip zstd` 가 ETag 뒤에 붙이는 접미사 (브라우저가 그대로 되돌려 보냄)
+_ENCODING_SUFFIXES = ("-gzip", "-zstd", "-br")
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    라우트별 캐시 정책
+    - ttl: 서버 ResponseCache 보관 시간(초)
+    - max_age: 브라우저 캐시(초)
+    - s_maxage: 공유 캐시(Caddy/CDN, Next.js fetch) 캐시(초)
+    - stale_while_revalidate: 만료 후 백그라운드 재검증 동안 stale 응답 허용(초)
+    """
+
+    ttl: int = 60
+    max_age: int = 0
+    s_maxage: Optional[int] = None
+    stale_while_revalidate: Optional[int] = None
+
+    @property
+    def cache_control(self) -> str:
+        parts = ["public", f"max-age={self.max_age}"]
+        if self.s_maxage is not None:
+            parts.append(f"s-maxage={self.s_maxage}")
+        if self.stale_while_revalidate is not None:
+            parts.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(parts)
+
+
+def compute_etag(body: bytes) -> str:
+    """strong ETag (body 해시)"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def _opaque_tag(tag: str) -> str:
+    tag = tag.strip()
+    if tag.startswith("W/"):
+        tag = tag[2:]
+    tag = tag.strip('"')
+    for suffix in _ENCODING_SUFFIXES:
+        if tag.endswith(suffix):
+            return tag[: -len(suffix)]
+    return tag
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match는 weak 비교 (RFC 9110 13.1.2)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    target = _opaque_tag(etag)
+    return any(_opaque_tag(t) == target for t in if_none_match.split(","))
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: Optional[str] = None,
+    policy: Optional[CachePolicy] = None,
+    media_type: str = "application/json",
+) -> Response:
+    """ETag/Cache-Control을 붙여 응답, 클라이언트 캐시가 최신이면 304"""
+    etag = etag or compute_etag(body)
+    headers = {"ETag": etag}
+    if policy is not None:
+        headers["Cache-Control"] = policy.cache_control
+
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
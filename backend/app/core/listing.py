@@ -0,0 +1,178 @@
+"""
+관리자 목록 API 공용 헬퍼 - 페이징 / 필터 / 정렬
+
+- limit 미지정 + cursor 미지정: 기존처럼 전체 목록 (하위 호환)
+- limit 지정: offset 페이징 (meta.total 포함)
+- cursor 지정: keyset 페이징 (정렬 컬럼 + id), meta.next_cursor로 다음 페이지
+- sort: "created_at" / "-created_at" 처럼 라우터별 화이트리스트 키만 허용 ('-'는 내림차순)
+- fields: "id,name,status" 처럼 필요한 필드만 (또는 라우터가 정의한 preset 이름, 예: summary)
+
+DB에서는 yield_per로 나눠 읽고, 각 묶음을 TypeAdapter로 한 번에 검증+직렬화한다.
+(row마다 Model.model_validate(obj).model_dump() 하던 것 대체)
+fields 지정 시에는 해당 컬럼만 SELECT 하고 Pydantic 모델 없이 row mapping을 바로 JSON 호환 값으로 변환.
+"""
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Type
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.core.pagination import column_cursor_type, decode_cursor, encode_cursor
+
+MAX_LIMIT = 500
+YIELD_PER = 500
+
+
+@dataclass
+class ListParams:
+    limit: Optional[int] = None
+    offset: int = 0
+    cursor: Optional[str] = None
+    sort: Optional[str] = None
+    fields: Optional[str] = None
+
+
+def list_params(
+    limit: Optional[int] = Query(None, ge=1, le=MAX_LIMIT, description="지정하지 않으면 전체"),
+    offset: int = Query(0, ge=0),
+    cursor: Optional[str] = Query(None, description="이전 응답 meta.next_cursor"),
+    sort: Optional[str] = Query(None, description="정렬 키, '-' 접두사는 내림차순 (예: -created_at)"),
+    fields: Optional[str] = Query(None, description="쉼표로 구분한 필드 목록 또는 preset 이름 (예: summary)"),
+) -> ListParams:
+    """목록 라우트 공용 쿼리 파라미터 (Depends로 사용)"""
+    return ListParams(limit=limit, offset=offset, cursor=cursor, sort=sort, fields=fields)
+
+
+class ListQuery:
+    """
+    모델 하나에 대한 목록 조회 정의
+
+    sorts의 컬럼은 NOT NULL 이어야 함 (keyset 비교에 NULL이 끼면 row가 빠짐)
+
+    fields로 고를 수 있는 필드 = schema 필드 중 모델 컬럼인 것 + computed (이름 → SQL 표현식)
+    presets: {"summary": ("id", "name", ...)} - fields=summary 처럼 이름으로 지정
+    """
+
+    def __init__(
+        self,
+        model,
+        schema: Type[BaseModel],
+        sorts: Dict[str, Any],
+        default_sort: str = "-created_at",
+        computed: Optional[Dict[str, Any]] = None,
+        presets: Optional[Dict[str, Sequence[str]]] = None,
+    ):
+        self.model = model
+        self.sorts = sorts
+        self.default_sort = default_sort
+        self.adapter = TypeAdapter(List[schema])
+
+        columns = model.__table__.columns
+        self.fields: Dict[str, Any] = {
+            name: getattr(model, name) for name in schema.model_fields if name in columns
+        }
+        self.fields.update(computed or {})
+        self.presets = presets or {}
+
+    def _resolve_sort(self, sort: Optional[str]) -> Tuple[str, Any, bool]:
+        sort = sort or self.default_sort
+        desc = sort.startswith("-")
+        key = sort.lstrip("-")
+        if key not in self.sorts:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid sort key: {key} (allowed: {', '.join(sorted(self.sorts))})",
+            )
+        return sort, self.sorts[key], desc
+
+    def _resolve_fields(self, fields: Optional[str]) -> Optional[List[str]]:
+        """fields 파라미터 → 필드 이름 목록 (None이면 전체 모델)"""
+        if not fields:
+            return None
+        if fields in self.presets:
+            return list(self.presets[fields])
+        names = list(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+        unknown = [n for n in names if n not in self.fields]
+        if unknown or not names:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Invalid fields: {', '.join(unknown)} (allowed: {', '.join(sorted(self.fields))})",
+            )
+        return names
+
+    def run(self, db: Session, params: ListParams, filters: Optional[Dict[Any, Any]] = None) -> Tuple[list, dict]:
+        """(data, meta) 반환. filters: {컬럼: 값}, 값이 None이면 무시"""
+        sort, sort_col, desc = self._resolve_sort(params.sort)
+        id_col = self.model.id
+        names = self._resolve_fields(params.fields)
+
+        conditions = [col == value for col, value in (filters or {}).items() if value is not None]
+        if names is None:
+            stmt = select(self.model).where(*conditions)
+            page_key = lambda row: [getattr(row, sort_col.key), row.id]
+            dump = self._dump
+        else:
+            # ✅ 요청한 컬럼만 SELECT (cursor 계산용 id / 정렬 컬럼은 응답에 없어도 같이 읽음)
+            stmt = select(
+                *(self.fields[n].label(n) for n in names),
+                id_col.label("__id"),
+                sort_col.label("__sort"),
+            ).where(*conditions)
+            page_key = lambda row: [row["__sort"], row["__id"]]
+            dump = lambda rows: self._dump_mappings(rows, names)
+
+        meta: Dict[str, Any] = {"sort": sort}
+        if names is not None:
+            meta["fields"] = names
+
+        if params.limit is not None and not params.cursor:
+            meta["total"] = db.scalar(select(func.count()).select_from(self.model).where(*conditions)) or 0
+
+        after = decode_cursor(params.cursor, (str, column_cursor_type(sort_col), column_cursor_type(id_col)))
+        if after:
+            if after[0] != sort:
+                raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Cursor does not match sort")
+            key = tuple_(sort_col, id_col)
+            stmt = stmt.where(key < tuple_(after[1], after[2]) if desc else key > tuple_(after[1], after[2]))
+        elif params.offset:
+            stmt = stmt.offset(params.offset)
+
+        order = (sort_col.desc(), id_col.desc()) if desc else (sort_col.asc(), id_col.asc())
+        stmt = stmt.order_by(*order)
+
+        page_size = params.limit if params.limit is not None else (MAX_LIMIT if params.cursor else None)
+
+        if page_size is None:
+            # 전체 목록: yield_per 묶음 단위로 읽고 바로 직렬화 (ORM 객체를 한꺼번에 들고 있지 않음)
+            data: list = []
+            result = self._rows(db.execute(stmt.execution_options(yield_per=YIELD_PER)), names)
+            for chunk in result.partitions():
+                data.extend(dump(chunk))
+            return data, meta
+
+        # 한 페이지: 한 건 더 읽어서 다음 페이지 유무 판단
+        rows = self._rows(db.execute(stmt.limit(page_size + 1)), names).all()
+        has_more = len(rows) > page_size
+        rows = rows[:page_size]
+
+        meta["limit"] = page_size
+        meta["next_cursor"] = encode_cursor([sort, *page_key(rows[-1])]) if has_more else None
+        if params.offset and not params.cursor:
+            meta["offset"] = params.offset
+        return dump(rows), meta
+
+    @staticmethod
+    def _rows(result, names: Optional[List[str]]):
+        return result.scalars() if names is None else result.mappings()
+
+    def _dump(self, rows) -> list:
+        """ORM rows → JSON 호환 dict 목록 (검증+직렬화 한 번에)"""
+        return self.adapter.dump_python(self.adapter.validate_python(rows, from_attributes=True), mode="json")
+
+    @staticmethod
+    def _dump_mappings(rows, names: List[str]) -> list:
+        """projection rows → JSON 호환 dict 목록 (Pydantic 모델 생성 없이)"""
+        return to_jsonable_python([{n: row[n] for n in names} for row in rows])
@@ -0,0 +1,73 @@
+"""
+Keyset(cursor) 페이지네이션 공용 헬퍼
+
+cursor는 마지막 row의 정렬 키 값을 JSON → base64url 로 감싼 불투명 문자열.
+클라이언트는 응답의 next_cursor를 그대로 다음 요청에 넘기기만 하면 됨.
+
+decode 시 키 개수뿐 아니라 위치별 타입도 확인 → 조작된 cursor가 SQL까지 가서 500 나지 않고 400.
+"""
+import base64
+import enum
+import json
+from datetime import date, datetime
+from typing import Any, List, Optional, Sequence, Tuple, Type, Union
+
+from fastapi import HTTPException, status
+
+# 위치별 허용 타입 (isinstance 두 번째 인자)
+CursorType = Union[Type, Tuple[Type, ...]]
+
+
+def _encode_value(v: Any) -> Any:
+    if isinstance(v, datetime):
+        return {"dt": v.isoformat()}
+    if isinstance(v, date):
+        return {"d": v.isoformat()}
+    return v
+
+
+def _decode_value(v: Any) -> Any:
+    if isinstance(v, dict):
+        if "dt" in v:
+            return datetime.fromisoformat(v["dt"])
+        if "d" in v:
+            return date.fromisoformat(v["d"])
+    return v
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """정렬 키 값들 → cursor 문자열"""
+    raw = json.dumps([_encode_value(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def column_cursor_type(column) -> CursorType:
+    """정렬 컬럼 → cursor 값 허용 타입 (NULL 허용 / Enum은 JSON에서 str로 돌아옴)"""
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return object
+    if issubclass(python_type, enum.Enum):
+        return (str, int, type(None))
+    if python_type is float:
+        return (int, float, type(None))
+    return (python_type, type(None))
+
+
+def decode_cursor(cursor: Optional[str], types: Sequence[CursorType]) -> Optional[List[Any]]:
+    """cursor 문자열 → 정렬 키 값들 (개수/타입이 types와 다르면 400)"""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor size mismatch")
+        decoded = [_decode_value(v) for v in values]
+        for value, expected in zip(decoded, types):
+            # bool은 int의 하위 타입이라 따로 거름
+            if not isinstance(value, expected) or (isinstance(value, bool) and expected is not bool):
+                raise TypeError("cursor type mismatch")
+        return decoded
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
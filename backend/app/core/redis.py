@@ -0,0 +1,92 @@
+"""
+Redis 클라이언트 (redis.asyncio)
+
+- REDIS_URL 하나로 워커/컨테이너 간 공유 상태(카운터 등)를 관리
+- REDIS_URL="fakeredis://" 이면 fakeredis 인메모리 대체 구현 사용 (테스트/로컬용)
+"""
+import logging
+from typing import Optional
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+FAKE_REDIS_SCHEME = "fakeredis://"
+
+_redis = None
+_sync_redis = None
+# fakeredis 사용 시 async/sync 클라이언트가 같은 데이터를 보도록 서버 공유
+_fake_server = None
+
+
+def _get_fake_server():
+    global _fake_server
+    try:
+        import fakeredis
+    except ImportError:
+        raise RuntimeError("REDIS_URL=fakeredis:// requires the 'fakeredis' package")
+    if _fake_server is None:
+        logger.info("Using fakeredis in-memory stand-in for Redis")
+        _fake_server = fakeredis.FakeServer()
+    return _fake_server
+
+
+def _create_client():
+    url = settings.REDIS_URL
+    if url.startswith(FAKE_REDIS_SCHEME):
+        from fakeredis import aioredis as fake_aioredis
+
+        return fake_aioredis.FakeRedis(server=_get_fake_server(), decode_responses=True)
+
+    from redis import asyncio as aioredis
+
+    return aioredis.from_url(url, decode_responses=True, socket_timeout=1.0)
+
+
+def _create_sync_client():
+    url = settings.REDIS_URL
+    if url.startswith(FAKE_REDIS_SCHEME):
+        import fakeredis
+
+        return fakeredis.FakeRedis(server=_get_fake_server(), decode_responses=True)
+
+    import redis
+
+    return redis.Redis.from_url(url, decode_responses=True, socket_timeout=1.0)
+
+
+def get_redis():
+    """공용 Redis 클라이언트 가져오기 (lazy 싱글톤)"""
+    global _redis
+    if _redis is None:
+        _redis = _create_client()
+    return _redis
+
+
+def get_sync_redis():
+    """
+    동기 Redis 클라이언트 (lazy 싱글톤)
+    SQLAlchemy 세션 이벤트 등 이벤트 루프 밖(threadpool)에서 호출되는 곳 전용
+    """
+    global _sync_redis
+    if _sync_redis is None:
+        _sync_redis = _create_sync_client()
+    return _sync_redis
+
+
+async def close_redis() -> None:
+    """lifespan shutdown에서 호출"""
+    global _redis, _sync_redis
+    if _sync_redis is not None:
+        _sync_redis.close()
+        _sync_redis = None
+
+    client: Optional[object] = _redis
+    _redis = None
+    if client is None:
+        return
+    close = getattr(client, "aclose", None) or client.close
+    try:
+        await close()
+    except Exception as e:
+        logger.warning(f"Redis close failed: {e}")
@@ -0,0 +1,50 @@
+"""
+Responses - 빠른 JSON 응답 경로 (pydantic-core to_json)
+
+기본 경로: 라우트가 ApiResponse 반환 → FastAPI가 response_model로 한 번 더 검증
+→ jsonable_encoder → json.dumps (stdlib). 목록 API는 이 재검증/인코딩이 CPU 대부분을 차지.
+
+- FastJSONResponse: json.dumps 대신 pydantic_core.to_json (Rust) 으로 인코딩 (response_class로 opt-in)
+- api_json(): 이미 JSON 호환인(신뢰된) data로 ApiResponse 모양의 bytes를 바로 만들어 반환
+  → Response 인스턴스를 반환하면 FastAPI는 response_model 검증/인코딩을 건너뜀
+  (response_model은 OpenAPI 문서용으로 그대로 둠)
+
+orjson 대신 pydantic-core를 쓰는 이유: 이미 pydantic 의존성에 포함 + BaseModel/datetime/Enum/UUID 직접 지원
+"""
+from typing import Any, Optional
+
+from fastapi.responses import JSONResponse, Response
+from pydantic_core import to_json
+
+
+def dump_json(content: Any) -> bytes:
+    """BaseModel / dict / list → JSON bytes (FastAPI 기본 인코딩과 같은 by_alias 규칙)"""
+    return to_json(content)
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse와 같은 사용법, 인코딩만 pydantic-core"""
+
+    def render(self, content: Any) -> bytes:
+        return dump_json(content)
+
+
+class RawJSONResponse(Response):
+    """이미 직렬화된 JSON bytes 그대로 응답"""
+
+    media_type = "application/json"
+
+
+def api_json(
+    data: Any = None,
+    *,
+    meta: Optional[dict] = None,
+    message: Optional[str] = None,
+    status_code: int = 200,
+) -> RawJSONResponse:
+    """
+    ApiResponse(success=True, ...) 와 같은 JSON을 모델 생성/재검증 없이 만듦
+    data는 호출 쪽에서 이미 검증된 값이어야 함 (ListQuery 결과 등)
+    """
+    body = {"success": True, "data": data, "message": message, "error": None, "meta": meta}
+    return RawJSONResponse(content=dump_json(body), status_code=status_code)
@@ -1,14 +1,24 @@
+import asyncio
+import hashlib
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
-from sqlalchemy.orm import Session
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import TTLCache, depends_on, register_invalidator
 from app.core.config import settings
-from app.core.database import get_db
-from app.models.user import User
+from app.core.database import get_async_db
+from app.models.user import User, UserRole
+
+logger = logging.getLogger(__name__)
 
 # Password hashing
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -17,11 +27,105 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
+@dataclass(frozen=True)
+class Principal:
+    """
+    인증된 유저 정보 (get_current_user 반환값)
+    User ORM과 같은 속성 이름(id/email/name/role) → 라우트 코드는 그대로 사용
+    세션에 묶이지 않으므로 요청 간 캐시 가능
+    """
+
+    id: str
+    email: str
+    name: str
+    role: UserRole
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(id=user.id, email=user.email, name=user.name, role=user.role)
+
+
+# =========================================================
+# 토큰 검증 캐시: token → (Principal, exp)
+# - hit이면 JWT 서명 검증 + users 조회 둘 다 생략
+# - TTL = min(AUTH_TOKEN_CACHE_TTL, 토큰 exp까지 남은 시간)
+# - users 테이블 write(role 변경 등) commit 시 전체 비움 / 로그아웃 시 해당 토큰 제거 + 폐기 목록
+# =========================================================
+CACHE_NS_AUTH = depends_on("auth.principals", "users")
+
+_token_cache = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES, ttl=settings.AUTH_TOKEN_CACHE_TTL)
+# 로그아웃한 토큰 (exp까지 보관). 다른 워커는 Redis의 폐기 표시로 확인
+_revoked_tokens = TTLCache(maxsize=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES, ttl=settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60)
+_REVOKED_REDIS_PREFIX = "auth:revoked:"
+
+
+def _on_auth_invalidated(namespace: str) -> None:
+    if namespace == CACHE_NS_AUTH:
+        _token_cache.clear()
+
+
+register_invalidator(_on_auth_invalidated)
+
+
+def _token_digest(token: str) -> str:
+    return hashlib.sha256(token.encode()).hexdigest()
+
+
+def token_cache_stats() -> dict:
+    return {**_token_cache.stats(), "revoked": _revoked_tokens.stats()["size"]}
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """비밀번호 검증"""
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# =========================================================
+# bcrypt 검증 전용 스레드 풀
+# - bcrypt는 GIL을 풀고 계산하므로 스레드로 분리하면 이벤트 루프/다른 요청이 안 막힘
+# - 실행+대기 합계를 PASSWORD_HASH_MAX_PENDING으로 제한 → 넘치면 503 (무한 대기열 방지)
+# =========================================================
+class PasswordHasherBusy(Exception):
+    """검증 대기열이 가득 참"""
+
+
+_hash_executor = ThreadPoolExecutor(max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="bcrypt")
+_hash_pending = 0
+# import 시 한 번만 생성 (첫 "없는 이메일" 요청에서 만들면 hash + verify로 실제 검증보다 2배 느려 티가 남)
+_dummy_hash: str = pwd_context.hash("dummy-password-for-unknown-email")
+
+
+def _verify_or_dummy(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """없는 유저(None)도 더미 해시로 같은 비용의 검증을 거친 뒤 False (응답 시간으로 이메일 존재 여부 노출 방지)"""
+    if hashed_password is None:
+        verify_password(plain_password, _dummy_hash)
+        return False
+    return verify_password(plain_password, hashed_password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: Optional[str]) -> bool:
+    """
+    비밀번호 검증을 bcrypt 풀에서 실행 (hashed_password=None → 없는 유저, 항상 False)
+    """
+    global _hash_pending
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        raise PasswordHasherBusy()
+    _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_hash_executor, _verify_or_dummy, plain_password, hashed_password)
+    finally:
+        _hash_pending -= 1
+
+
+def password_hasher_stats() -> dict:
+    return {
+        "workers": settings.PASSWORD_HASH_WORKERS,
+        "pending": _hash_pending,
+        "max_pending": settings.PASSWORD_HASH_MAX_PENDING,
+    }
+
+
 def get_password_hash(password: str) -> str:
     """비밀번호 해싱"""
     return pwd_context.hash(password)
@@ -49,11 +153,42 @@ def decode_access_token(token: str) -> Optional[dict]:
         return None
 
 
+async def _is_revoked(token: str) -> bool:
+    if _revoked_tokens.get(token) is not None:
+        return True
+    try:
+        from app.core.redis import get_redis
+
+        return bool(await get_redis().exists(_REVOKED_REDIS_PREFIX + _token_digest(token)))
+    except Exception as e:
+        # Redis 장애 시 폐기 확인만 생략 (JWT 검증은 그대로)
+        logger.warning(f"[Auth] revoked check failed: {e}")
+        return False
+
+
+async def revoke_token(token: str) -> None:
+    """로그아웃: 캐시에서 제거 + exp까지 폐기 표시 (다른 워커는 Redis로 확인)"""
+    _token_cache.delete(token)
+    payload = decode_access_token(token)
+    if payload is None:
+        return
+    remaining = int(payload.get("exp", 0) - time.time())
+    if remaining <= 0:
+        return
+    _revoked_tokens.set(token, True, ttl=remaining)
+    try:
+        from app.core.redis import get_redis
+
+        await get_redis().set(_REVOKED_REDIS_PREFIX + _token_digest(token), 1, ex=remaining)
+    except Exception as e:
+        logger.warning(f"[Auth] revoke to redis failed: {e}")
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: Session = Depends(get_db)
-) -> User:
-    """현재 인증된 유저 가져오기"""
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """현재 인증된 유저 가져오기 (검증 결과는 토큰 단위로 캐시)"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -61,6 +196,12 @@ async def get_current_user(
     )
     
     token = credentials.credentials
+
+    # ✅ 캐시 hit: 서명 검증/DB 조회 생략 (exp 지나면 TTL로 이미 빠져 있음)
+    principal = _token_cache.get(token)
+    if principal is not None:
+        return principal
+
     payload = decode_access_token(token)
     
     if payload is None:
@@ -69,17 +210,26 @@ async def get_current_user(
     user_id: str = payload.get("sub")
     if user_id is None:
         raise credentials_exception
+
+    if await _is_revoked(token):
+        raise credentials_exception
     
-    user = db.query(User).filter(User.id == user_id).first()
+    # ✅ 모든 인증 요청이 거치므로 async 세션 (이벤트 루프 안 막음)
+    user = (await db.execute(select(User).where(User.id == user_id))).scalar_one_or_none()
     if user is None:
         raise credentials_exception
+
+    principal = Principal.from_user(user)
+    ttl = min(settings.AUTH_TOKEN_CACHE_TTL, payload.get("exp", 0) - time.time())
+    if ttl > 0:
+        _token_cache.set(token, principal, ttl=ttl)
     
-    return user
+    return principal
 
 
 async def get_current_admin_user(
-    current_user: User = Depends(get_current_user)
-) -> User:
+    current_user: Principal = Depends(get_current_user)
+) -> Principal:
     """관리자 권한 확인"""
     if current_user.role != "ADMIN":
         raise HTTPException(
@@ -2,10 +2,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import logging
 import os
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.core.database import async_engine
+from app.core.redis import close_redis
+from app.services.click_counter import warm_up_click_counter
+from app.services.click_partitions import ensure_click_partitions
+from app.services.click_ingest import get_click_ingestor
+from app.services.view_counter import get_view_counter
 import logging
 import sys
 
@@ -36,9 +43,26 @@ async def lifespan(app: FastAPI):
     logger.info("🚀 Starting Nursing Home Operations Backend")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"CORS Origins: {settings.CORS_ORIGINS_LIST}")
+
+    # click_events 이번 달~N개월 뒤 파티션 확보
+    await asyncio.to_thread(ensure_click_partitions)
+
+    # 부정클릭 카운터: 최근 24시간 click_events로 채우기 (재시작 직후에도 동일 판정)
+    await warm_up_click_counter()
+
+    # ClickEvent 배치 적재 루프
+    get_click_ingestor().start()
+
+    # history 조회수 일괄 반영 루프
+    get_view_counter().start()
+
     yield
     # Shutdown
     logger.info("🛑 Shutting down...")
+    await get_click_ingestor().stop()  # 큐에 남은 클릭 이벤트 flush
+    await get_view_counter().stop()    # 버퍼에 남은 조회수 flush
+    await close_redis()
+    await async_engine.dispose()
 
 app = FastAPI(
     title="Nursing Home Operations API",
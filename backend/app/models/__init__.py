@@ -23,6 +23,9 @@ from app.models.public import (
 )
 
 from app.models.click_event import ClickEvent
+from app.models.click_rollup import ClickRollupHourly, ClickRollupDaily
+from app.models.outbox import OutboxJob, OutboxStatus
+from app.models.ai_cache import AIAnalysisCache
 
 __all__ = [
     # Internal
@@ -39,6 +42,11 @@ __all__ = [
     "HistoryCategory",
     "Review",
     "ClickEvent",
+    "ClickRollupHourly",
+    "ClickRollupDaily",
+    "OutboxJob",
+    "OutboxStatus",
+    "AIAnalysisCache",
 
     # Public
     "ContactTicket",
@@ -0,0 +1,26 @@
+"""
+AI Analysis Cache Model - 상담문의 AI 분석 결과 캐시 (content-addressed)
+
+같은 템플릿 문의("입소 비용 문의드립니다" 등)가 반복되면 OpenAI를 다시 부르지 않고 재사용.
+key = sha256(정규화한 inquiry_type + message, model, PROMPT_VERSION)
+→ 모델/프롬프트가 바뀌면 키가 달라져 이전 결과는 자연히 안 쓰이고 prune에서 정리됨.
+"""
+from sqlalchemy import Column, String, DateTime, Integer
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+
+from app.core.database import Base
+
+
+class AIAnalysisCache(Base):
+    __tablename__ = "ai_analysis_cache"
+
+    key = Column(String(64), primary_key=True)                # sha256 hex
+    model = Column(String(64), nullable=False)
+    prompt_version = Column(String(16), nullable=False)
+    result = Column(JSONB, nullable=False)                    # AIAnalysisResult.model_dump()
+    hits = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    last_hit_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False, index=True)  # LRU 정리 기준
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)                             # TTL
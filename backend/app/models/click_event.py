@@ -1,7 +1,10 @@
 """
 Simple Click Event Model - 부정클릭 방지용
+
+click_events는 created_at 기준 월별 RANGE 파티션 테이블
+(파티션 생성/보관기간 정리: app/services/click_partitions.py)
 """
-from sqlalchemy import Column, String, DateTime, Boolean
+from sqlalchemy import Column, String, DateTime, Boolean, Index
 from sqlalchemy.sql import func
 import uuid
 import hashlib
@@ -16,7 +19,7 @@ class ClickEvent(Base):
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
     
     # IP (해시로 저장 - 개인정보 보호)
-    ip_hash = Column(String, nullable=False, index=True)
+    ip_hash = Column(String, nullable=False)
     
     # 클릭 타입 (phone_click, kakao_click)
     event_type = Column(String, nullable=False)
@@ -24,10 +27,20 @@ class ClickEvent(Base):
     # 의심 플래그
     is_suspicious = Column(Boolean, default=False)
     
-    # 시간
-    created_at = Column(DateTime, server_default=func.now(), index=True)
+    # 시간 (파티션 키 → PK에 포함되어야 함)
+    created_at = Column(DateTime, primary_key=True, server_default=func.now())
+
+    __table_args__ = (
+        # IP별 1시간/1일 윈도우, IP별 그룹 집계
+        Index("ix_click_events_ip_hash_created_at", "ip_hash", "created_at"),
+        # 같은 IP의 같은 페이지 1시간 윈도우
+        Index("ix_click_events_ip_hash_event_type_created_at", "ip_hash", "event_type", "created_at"),
+        # 기간 조회 + /track/all keyset 정렬
+        Index("ix_click_events_created_at_id", "created_at", "id"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     @staticmethod
     def hash_ip(ip: str) -> str:
         """IP를 SHA-256으로 해싱"""
-        return hashlib.sha256(ip.encode()).hexdigest()
\ No newline at end of file
+        return hashlib.sha256(ip.encode()).hexdigest()
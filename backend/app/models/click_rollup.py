@@ -0,0 +1,42 @@
+"""
+Click Rollup Models - click_events 사전 집계 테이블
+
+- click_rollups_hourly: (ip_hash, event_type, hour) 별 클릭 수
+- click_rollups_daily : (event_type, day) 별 클릭 수
+ClickIngestor가 INSERT와 같은 트랜잭션에서 upsert 하므로 현재 시간대까지 항상 최신.
+"""
+from sqlalchemy import Column, String, DateTime, Date, Integer, Index
+
+from app.core.database import Base
+
+
+class ClickRollupHourly(Base):
+    """IP/이벤트/시간대별 클릭 집계"""
+    __tablename__ = "click_rollups_hourly"
+
+    ip_hash = Column(String, primary_key=True)
+    event_type = Column(String, primary_key=True)
+    hour = Column(DateTime, primary_key=True)  # date_trunc('hour', created_at) - naive UTC
+
+    count = Column(Integer, nullable=False, default=0)
+    suspicious_count = Column(Integer, nullable=False, default=0)
+    last_click = Column(DateTime, nullable=False)
+
+    __table_args__ = (
+        Index("ix_click_rollups_hourly_hour", "hour"),
+    )
+
+
+class ClickRollupDaily(Base):
+    """이벤트/일별 클릭 집계"""
+    __tablename__ = "click_rollups_daily"
+
+    event_type = Column(String, primary_key=True)
+    day = Column(Date, primary_key=True)
+
+    count = Column(Integer, nullable=False, default=0)
+    suspicious_count = Column(Integer, nullable=False, default=0)
+
+    __table_args__ = (
+        Index("ix_click_rollups_daily_day", "day"),
+    )
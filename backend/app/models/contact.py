@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Text, Boolean
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Text, Boolean, false
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.sql import func
 import enum
@@ -37,6 +37,7 @@ class Contact(Base):
     ai_next_actions = Column(JSONB, nullable=True)
     ai_model = Column(String(32), nullable=True)
     ai_created_at = Column(DateTime(timezone=True), nullable=True)
+    ai_cached = Column(Boolean, nullable=False, default=False, server_default=false())  # ai_analysis_cache 재사용 결과
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
@@ -1,5 +1,6 @@
-from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Text, Boolean, Integer
-from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Text, Boolean, Integer, Computed, Index
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 import enum
 import uuid
@@ -14,6 +15,13 @@ class HistoryCategory(str, enum.Enum):
     VOLUNTEER = "VOLUNTEER"
 
 
+SEARCH_VECTOR_SQL = (
+    "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+    "setweight(to_tsvector('simple', coalesce(excerpt, '')), 'B') || "
+    "setweight(to_tsvector('simple', coalesce(content, '')), 'C')"
+)
+
+
 class History(Base):
     __tablename__ = "history"
     
@@ -30,4 +38,28 @@ class History(Base):
     image_url = Column(String, nullable=True)
     
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
-    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
\ No newline at end of file
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    # ✅ 전문 검색용 (DB generated column - 제목 A / 요약 B / 본문 C 가중치)
+    # 'simple' 설정: 한국어 형태소 분석 없이 공백 단위 토큰 → 검색 시 접두어(:*) 매칭으로 보완
+    # 평소 조회에는 필요 없으므로 deferred
+    search_vector = deferred(Column(
+        TSVECTOR,
+        Computed(SEARCH_VECTOR_SQL, persisted=True),
+    ))
+
+    __table_args__ = (
+        # 공개 목록 정렬/기간 필터/아카이브 집계 (공개 글만)
+        Index(
+            "ix_history_published_order",
+            published_at.desc(), created_at.desc(), id.desc(),
+            postgresql_where=is_published,
+        ),
+        # tag 필터(tags @> ARRAY[...]) / facet 집계
+        Index("ix_history_tags", "tags", postgresql_using="gin"),
+        Index("ix_history_search_vector", "search_vector", postgresql_using="gin"),
+        # 한국어 부분 문자열(ILIKE '%어%') 검색용 trigram 인덱스 (pg_trgm)
+        Index("ix_history_title_trgm", "title", postgresql_using="gin", postgresql_ops={"title": "gin_trgm_ops"}),
+        Index("ix_history_excerpt_trgm", "excerpt", postgresql_using="gin", postgresql_ops={"excerpt": "gin_trgm_ops"}),
+        Index("ix_history_content_trgm", "content", postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"}),
+    )
\ No newline at end of file
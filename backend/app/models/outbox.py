@@ -0,0 +1,47 @@
+"""
+Outbox Job Model - 트랜잭션 outbox (워커가 처리할 비동기 작업)
+
+웹 요청은 도메인 row(Contact 등)와 같은 commit에 job row만 INSERT 하고,
+별도 워커 프로세스(python -m app.worker)가 SELECT ... FOR UPDATE SKIP LOCKED 로 가져가 실행.
+→ 컨테이너 재시작에도 작업이 유실되지 않고, 웹 워커 이벤트 루프와 경쟁하지 않음.
+"""
+from sqlalchemy import Column, String, DateTime, Enum as SQLEnum, Integer, Text, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+import enum
+import uuid
+
+from app.core.database import Base
+
+
+class OutboxStatus(str, enum.Enum):
+    PENDING = "PENDING"    # 실행 대기 (run_after 이후 실행)
+    RUNNING = "RUNNING"    # 워커가 가져감
+    DONE = "DONE"
+    FAILED = "FAILED"      # max_attempts 초과 (수동 재시도 필요)
+
+
+class OutboxJob(Base):
+    __tablename__ = "outbox_jobs"
+
+    id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
+    kind = Column(String(64), nullable=False, index=True)  # 예: contact.analyze, email.admin_new_contact
+    payload = Column(JSONB, nullable=False, default=dict)
+
+    status = Column(SQLEnum(OutboxStatus), nullable=False, default=OutboxStatus.PENDING, index=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String(64), nullable=True)
+    last_error = Column(Text, nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+
+    __table_args__ = (
+        # 워커 claim 쿼리용: 대기 중인 job만 run_after 순으로
+        Index("ix_outbox_jobs_due", "run_after", postgresql_where=text("status = 'PENDING'")),
+    )
@@ -24,7 +24,7 @@ class Resident(Base):
     name = Column(String, nullable=False, index=True)
     birth_date = Column(Date, nullable=False)
     gender = Column(SQLEnum(Gender), nullable=False)
-    admission_date = Column(Date, nullable=False)
+    admission_date = Column(Date, nullable=False, index=True)
     room_number = Column(String, nullable=False, index=True)
     grade = Column(String, nullable=False)  # 1, 2, 3, 4, 5
     emergency_contact = Column(String, nullable=False)
@@ -1,6 +1,6 @@
 from datetime import datetime
 from typing import Optional, Any, List, Dict
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, computed_field
 
 from app.models.contact import ContactStatus  # ✅ SQLAlchemy Enum과 동일 Enum 사용
 
@@ -35,14 +35,12 @@ class ContactResponse(BaseModel):
     ai_next_actions: Optional[Any] = None   # JSONB라 Any가 가장 편함 (혹은 List[str])
     ai_model: Optional[str] = None
     ai_created_at: Optional[datetime] = None
+    ai_cached: bool = False
 
-    # ✅ 편의 필드
-    has_ai_analysis: bool = False
-
-    @classmethod
-    def model_validate(cls, obj, **kwargs):
-        m = super().model_validate(obj, **kwargs)
-        m.has_ai_analysis = bool(getattr(obj, "ai_summary", None))
-        return m
+    # ✅ 편의 필드 (computed_field → TypeAdapter 등 어떤 경로로 검증해도 채워짐)
+    @computed_field
+    @property
+    def has_ai_analysis(self) -> bool:
+        return bool(self.ai_summary)
 
     model_config = ConfigDict(from_attributes=True)
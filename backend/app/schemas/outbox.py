@@ -0,0 +1,23 @@
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel, ConfigDict
+
+from app.models.outbox import OutboxStatus
+
+
+class OutboxJobResponse(BaseModel):
+    id: str
+    kind: str
+    payload: Dict[str, Any]
+    status: OutboxStatus
+    attempts: int
+    max_attempts: int
+    run_after: datetime
+    locked_at: Optional[datetime] = None
+    locked_by: Optional[str] = None
+    last_error: Optional[str] = None
+    finished_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: Optional[datetime] = None
+
+    model_config = ConfigDict(from_attributes=True)
@@ -161,6 +161,28 @@ class HistoryListItemV2(BaseModel):
     publishedAt: Optional[datetime] = None
     viewCount: int = 0
 
+    # search + highlight=true 일 때만 채워짐 (본문 스니펫, 검색어는 <mark>로 감쌈)
+    highlight: Optional[str] = None
+
+
+class HistoryArchiveItem(BaseModel):
+    """GET /public/history/archive - 월별 공개 글 수"""
+    year: int
+    month: int
+    count: int
+
+
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+
+class HistoryFacets(BaseModel):
+    """GET /public/history/facets - 필터 칩용 카테고리/태그 글 수"""
+    total: int = 0
+    categories: List[FacetCount] = Field(default_factory=list)
+    tags: List[FacetCount] = Field(default_factory=list)
+
 
 class HistoryDetailV2(BaseModel):
     """
@@ -194,4 +216,7 @@ class PublicApiPageResponse(BaseModel, Generic[T]):
     total: int = 0
     page: int = 1
     limit: int = 12
-    total_pages: int = 1
\ No newline at end of file
+    total_pages: int = 1
+
+    # keyset 페이징: 다음 요청에 cursor=next_cursor 로 넘김 (마지막 페이지면 null)
+    next_cursor: Optional[str] = None
\ No newline at end of file
@@ -7,4 +7,6 @@ class ApiResponse(BaseModel):
     success: bool
     data: Optional[Any] = None
     message: Optional[str] = None
-    error: Optional[str] = None
\ No newline at end of file
+    error: Optional[str] = None
+    # 목록 페이징 정보 (limit/cursor 사용 시: total, limit, offset, next_cursor, sort)
+    meta: Optional[dict] = None
\ No newline at end of file
@@ -0,0 +1,149 @@
+"""
+AI Analysis Cache - 상담문의 분석 결과 재사용 (Postgres ai_analysis_cache)
+
+key = sha256(normalize(inquiry_type) | normalize(message) | model | PROMPT_VERSION)
+- 사용자 프롬프트에 들어가는 값(문의 유형/내용)만 키에 넣음 → 이름/연락처가 달라도 같은 결과
+- 정규화: NFKC, 소문자, 연속 공백 1칸, 끝의 문장부호/공백 제거
+- 조회는 UPDATE ... RETURNING 한 번 (hit 수 / last_hit_at 갱신 = LRU 기준)
+- 폴백(분석 실패) 결과는 저장하지 않음
+- TTL(AI_CACHE_TTL_SECONDS) 지난 것 + AI_CACHE_MAX_ENTRIES 초과분(LRU)은 워커가 주기적으로 prune
+
+Redis 대신 Postgres: 워커/웹이 이미 같은 DB를 쓰고, 재시작/Redis 장애에도 남아 있어야 비용 절감 효과가 유지됨
+"""
+import hashlib
+import logging
+import re
+import unicodedata
+from datetime import timedelta
+from typing import Dict, Iterable, Optional
+
+from pydantic import ValidationError
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.ai_cache import AIAnalysisCache
+from app.schemas.ai import AIAnalysisResult, ContactAnalysisRequest
+from app.services.openai import PROMPT_VERSION, get_openai_client
+
+logger = logging.getLogger(__name__)
+
+cache_table = AIAnalysisCache.__table__
+
+_WHITESPACE = re.compile(r"\s+")
+_TRAILING = re.compile(r"[\s.!?~,。…]+$")
+
+# metrics (프로세스 단위)
+_stats = {"hits_total": 0, "misses_total": 0, "stores_total": 0, "pruned_total": 0}
+
+
+def normalize_text(text: str) -> str:
+    text = unicodedata.normalize("NFKC", text or "").lower()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING.sub("", text)
+
+
+def cache_key(request: ContactAnalysisRequest, model: Optional[str] = None) -> str:
+    """요청 → 캐시 키 (model 기본값은 현재 OpenAIClient 모델)"""
+    raw = "\x1f".join(
+        (
+            normalize_text(request.inquiry_type),
+            normalize_text(request.message),
+            model or get_openai_client().model,
+            PROMPT_VERSION,
+        )
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+async def get_cached_many(db: AsyncSession, keys: Iterable[str]) -> Dict[str, AIAnalysisResult]:
+    """
+    유효한(만료 전) 캐시 조회 + hit 기록 (commit은 호출 쪽에서)
+    저장된 결과가 현재 스키마로 검증되지 않으면 miss 취급
+    """
+    keys = list(set(keys))
+    if not settings.AI_CACHE_ENABLED or not keys:
+        return {}
+
+    rows = (
+        await db.execute(
+            update(cache_table)
+            .where(cache_table.c.key.in_(keys), cache_table.c.expires_at > func.now())
+            .values(hits=cache_table.c.hits + 1, last_hit_at=func.now())
+            .returning(cache_table.c.key, cache_table.c.result)
+        )
+    ).all()
+
+    found: Dict[str, AIAnalysisResult] = {}
+    for key, result in rows:
+        try:
+            found[key] = AIAnalysisResult.model_validate(result)
+        except ValidationError:
+            logger.warning(f"[AI cache] invalid cached result ignored: key={key}")
+    _stats["hits_total"] += len(found)
+    _stats["misses_total"] += len(keys) - len(found)
+    return found
+
+
+async def get_cached(db: AsyncSession, key: str) -> Optional[AIAnalysisResult]:
+    return (await get_cached_many(db, [key])).get(key)
+
+
+async def store_many(db: AsyncSession, results: Dict[str, AIAnalysisResult]) -> None:
+    """분석 성공 결과 저장 (같은 키가 있으면 덮어쓰고 TTL 갱신, commit은 호출 쪽에서)"""
+    if not settings.AI_CACHE_ENABLED or not results:
+        return
+    expires_at = func.now() + timedelta(seconds=settings.AI_CACHE_TTL_SECONDS)
+    model = get_openai_client().model
+    stmt = insert(cache_table).values(
+        [
+            {
+                "key": key,
+                "model": model,
+                "prompt_version": PROMPT_VERSION,
+                "result": result.model_dump(mode="json"),
+                "hits": 0,
+                "expires_at": expires_at,
+            }
+            for key, result in results.items()
+        ]
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[cache_table.c.key],
+            set_={
+                "result": stmt.excluded.result,
+                "created_at": func.now(),
+                "last_hit_at": func.now(),
+                "expires_at": stmt.excluded.expires_at,
+            },
+        )
+    )
+    _stats["stores_total"] += len(results)
+
+
+async def prune(db: AsyncSession) -> int:
+    """만료된 항목 + AI_CACHE_MAX_ENTRIES 초과분(last_hit_at 오래된 순) 삭제"""
+    expired = await db.execute(delete(cache_table).where(cache_table.c.expires_at <= func.now()))
+    overflow = (
+        select(cache_table.c.key)
+        .order_by(cache_table.c.last_hit_at.desc())
+        .offset(settings.AI_CACHE_MAX_ENTRIES)
+        .scalar_subquery()
+    )
+    evicted = await db.execute(delete(cache_table).where(cache_table.c.key.in_(overflow)))
+    await db.commit()
+    removed = (expired.rowcount or 0) + (evicted.rowcount or 0)
+    _stats["pruned_total"] += removed
+    return removed
+
+
+def cache_stats() -> dict:
+    lookups = _stats["hits_total"] + _stats["misses_total"]
+    return {
+        "enabled": settings.AI_CACHE_ENABLED,
+        "prompt_version": PROMPT_VERSION,
+        **_stats,
+        "hit_rate": round(_stats["hits_total"] / lookups, 3) if lookups else None,
+    }
@@ -0,0 +1,331 @@
+"""
+Click Counter - 부정클릭/반복방문 판정용 인메모리 슬라이딩 윈도우 카운터
+
+tracking.py의 부정클릭 / 도움 팝업 판정은 원래 클릭마다 click_events 에
+COUNT(*) 를 3번 날렸음. 여기서는 ip_hash 별로 "최근 N개 클릭 시각"만 링 버퍼에
+보관해서 Postgres 없이 O(1)로 같은 결과를 낸다.
+
+- 1시간 내 5회 이상?  → 최근 5번째 클릭이 1시간 안인지
+- 하루 내 10회 이상?  → 최근 10번째 클릭이 24시간 안인지
+- 같은 페이지 1시간 내 3회 이상? → (ip_hash, event_type) 링의 3번째 클릭
+
+임계값만큼만 보관하므로 키당 메모리는 고정이고, 전체 키 수는
+CLICK_COUNTER_MAX_KEYS 로 제한(LRU 제거)한다.
+
+CLICK_COUNTER_BACKEND:
+- "memory": 프로세스 로컬 (uvicorn 워커마다 따로 셈)
+- "redis" : Redis sorted set 윈도우 - 워커/컨테이너 간 공유, 클릭당 1 round trip
+  (member = click_events.id → warm-up으로 같은 클릭을 다시 넣어도 ZADD가 덮어씀, 중복 카운트 없음)
+"""
+import asyncio
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from datetime import datetime, timedelta
+from typing import Deque, Hashable, Iterable, Optional, Tuple, Union
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# ✅ 판정 기준 (기존 SQL 쿼리와 동일)
+HOURLY_LIMIT = 5
+DAILY_LIMIT = 10
+POPUP_VISIT_LIMIT = 3  # 테스트용 - 원래는 10회
+
+HOUR = 60 * 60
+DAY = 24 * HOUR
+
+PAGE_VIEW_PREFIX = "page_view_"
+
+
+def is_page_view(event_type: str) -> bool:
+    return event_type.startswith(PAGE_VIEW_PREFIX)
+
+
+class _RingStore:
+    """키별 최근 타임스탬프 링 버퍼 (LRU로 키 수 제한)"""
+
+    def __init__(self, ring_size: int, ttl: int, max_keys: int):
+        self.ring_size = ring_size
+        self.ttl = ttl
+        self.max_keys = max_keys
+        self._rings: "OrderedDict[Hashable, Deque[float]]" = OrderedDict()
+
+    def get(self, key: Hashable, now: float) -> Optional[Deque[float]]:
+        ring = self._rings.get(key)
+        if ring is None:
+            return None
+        # 마지막 클릭이 윈도우 밖이면 더 이상 의미 없음
+        if ring[-1] < now - self.ttl:
+            del self._rings[key]
+            return None
+        return ring
+
+    def add(self, key: Hashable, ts: float) -> None:
+        ring = self._rings.get(key)
+        if ring is None:
+            ring = deque(maxlen=self.ring_size)
+            self._rings[key] = ring
+            if len(self._rings) > self.max_keys:
+                self._rings.popitem(last=False)
+        else:
+            self._rings.move_to_end(key)
+        ring.append(ts)
+
+    def clear(self) -> None:
+        self._rings.clear()
+
+    def __len__(self) -> int:
+        return len(self._rings)
+
+
+class MemoryClickCounter:
+    """ip_hash 별 슬라이딩 윈도우 카운터 (프로세스 로컬)"""
+
+    backend = "memory"
+
+    def __init__(self, max_keys: int = 100_000):
+        self._lock = threading.Lock()
+        self._ips = _RingStore(max(HOURLY_LIMIT, DAILY_LIMIT), DAY, max_keys)
+        self._pages = _RingStore(POPUP_VISIT_LIMIT, HOUR, max_keys)
+
+    @staticmethod
+    def _reached(ring: Optional[Deque[float]], limit: int, since: float) -> bool:
+        # ring에는 최신 클릭이 뒤에 쌓임 → 뒤에서 limit번째가 윈도우 안이면 limit회 이상
+        if ring is None or len(ring) < limit:
+            return False
+        return ring[-limit] >= since
+
+    def _evaluate(self, ip_hash: str, event_type: str, now: float) -> Tuple[bool, bool]:
+        ip_ring = self._ips.get(ip_hash, now)
+        suspicious = (
+            self._reached(ip_ring, HOURLY_LIMIT, now - HOUR)
+            or self._reached(ip_ring, DAILY_LIMIT, now - DAY)
+        )
+
+        show_popup = False
+        if is_page_view(event_type):
+            page_ring = self._pages.get((ip_hash, event_type), now)
+            show_popup = self._reached(page_ring, POPUP_VISIT_LIMIT, now - HOUR)
+
+        return suspicious, show_popup
+
+    def _record(self, ip_hash: str, event_type: str, ts: float) -> None:
+        self._ips.add(ip_hash, ts)
+        if is_page_view(event_type):
+            self._pages.add((ip_hash, event_type), ts)
+
+    def check_sync(self, ip_hash: str, event_type: str, now: Optional[float] = None) -> Tuple[bool, bool]:
+        now = time.time() if now is None else now
+        with self._lock:
+            return self._evaluate(ip_hash, event_type, now)
+
+    def check_and_record_sync(self, ip_hash: str, event_type: str, now: Optional[float] = None) -> Tuple[bool, bool]:
+        now = time.time() if now is None else now
+        with self._lock:
+            result = self._evaluate(ip_hash, event_type, now)
+            self._record(ip_hash, event_type, now)
+            return result
+
+    async def check(self, ip_hash: str, event_type: str) -> Tuple[bool, bool]:
+        """(부정클릭 여부, 도움 팝업 여부) - 기록하지 않음"""
+        return self.check_sync(ip_hash, event_type)
+
+    async def check_and_record(self, ip_hash: str, event_type: str, event_id: Optional[str] = None) -> Tuple[bool, bool]:
+        """
+        판정 후 이번 클릭을 기록.
+        기존 SQL처럼 "이번 클릭은 제외한" 과거 클릭 수로 판정한다.
+        event_id: 저장될 click_events.id (Redis 백엔드의 member, 메모리 백엔드는 사용 안 함)
+        """
+        return self.check_and_record_sync(ip_hash, event_type)
+
+    def load(self, events: Iterable[Tuple[str, str, str, datetime]]) -> int:
+        """
+        재시작 직후 최근 24시간 click_events로 링 채우기
+        events: (id, ip_hash, event_type, created_at) - created_at 오름차순
+        """
+        loaded = 0
+        with self._lock:
+            self._ips.clear()
+            self._pages.clear()
+            for _, ip_hash, event_type, created_at in events:
+                self._record(ip_hash, event_type, _to_epoch(created_at))
+                loaded += 1
+        return loaded
+
+    async def warm_up(self, events: Iterable[Tuple[str, str, str, datetime]]) -> int:
+        return self.load(events)
+
+    async def stats(self) -> dict:
+        with self._lock:
+            return {"backend": self.backend, "ip_keys": len(self._ips), "page_keys": len(self._pages)}
+
+
+class RedisClickCounter:
+    """
+    Redis sorted set 기반 슬라이딩 윈도우 카운터 (워커 간 공유)
+
+    - click:ip:{ip_hash}                : 최근 클릭 시각 (score=epoch), 최대 DAILY_LIMIT개, TTL 1일
+    - click:page:{ip_hash}:{event_type} : 페이지뷰 시각, 최대 POPUP_VISIT_LIMIT개, TTL 1시간
+    member는 click_events.id (live 기록 / warm-up 공통) → 같은 클릭은 한 번만 카운트
+    판정과 기록을 MULTI 파이프라인 하나로 처리 → 클릭당 1 round trip.
+    Redis 장애 시에는 로컬 MemoryClickCounter로 판정 (클릭 API는 실패시키지 않음).
+    """
+
+    backend = "redis"
+    prefix = "click"
+    warm_marker = "click:warm"
+
+    def __init__(self, redis, fallback: MemoryClickCounter):
+        self.redis = redis
+        self.fallback = fallback
+
+    def _ip_key(self, ip_hash: str) -> str:
+        return f"{self.prefix}:ip:{ip_hash}"
+
+    def _page_key(self, ip_hash: str, event_type: str) -> str:
+        return f"{self.prefix}:page:{ip_hash}:{event_type}"
+
+    async def _run(self, ip_hash: str, event_type: str, record: bool, event_id: Optional[str] = None) -> Tuple[bool, bool]:
+        now = time.time()
+        page_view = is_page_view(event_type)
+        ip_key = self._ip_key(ip_hash)
+        page_key = self._page_key(ip_hash, event_type)
+
+        pipe = self.redis.pipeline(transaction=True)
+        # 윈도우 밖 정리 후 (이번 클릭 제외) 개수 조회
+        pipe.zremrangebyscore(ip_key, "-inf", f"({now - DAY}")
+        pipe.zcount(ip_key, now - HOUR, "+inf")
+        pipe.zcard(ip_key)
+        if page_view:
+            pipe.zremrangebyscore(page_key, "-inf", f"({now - HOUR}")
+            pipe.zcard(page_key)
+        if record:
+            member = event_id or uuid.uuid4().hex
+            pipe.zadd(ip_key, {member: now})
+            # 판정에 필요한 최근 N개만 유지 → 키당 메모리 고정
+            pipe.zremrangebyrank(ip_key, 0, -(DAILY_LIMIT + 1))
+            pipe.expire(ip_key, DAY)
+            if page_view:
+                pipe.zadd(page_key, {member: now})
+                pipe.zremrangebyrank(page_key, 0, -(POPUP_VISIT_LIMIT + 1))
+                pipe.expire(page_key, HOUR)
+        results = await pipe.execute()
+
+        hourly, daily = results[1], results[2]
+        suspicious = hourly >= HOURLY_LIMIT or daily >= DAILY_LIMIT
+        show_popup = page_view and results[4] >= POPUP_VISIT_LIMIT
+        return suspicious, show_popup
+
+    async def check(self, ip_hash: str, event_type: str) -> Tuple[bool, bool]:
+        try:
+            return await self._run(ip_hash, event_type, record=False)
+        except Exception as e:
+            logger.warning(f"[ClickCounter] redis check failed, using local counter: {e}")
+            return self.fallback.check_sync(ip_hash, event_type)
+
+    async def check_and_record(self, ip_hash: str, event_type: str, event_id: Optional[str] = None) -> Tuple[bool, bool]:
+        try:
+            result = await self._run(ip_hash, event_type, record=True, event_id=event_id)
+        except Exception as e:
+            logger.warning(f"[ClickCounter] redis update failed, using local counter: {e}")
+            return self.fallback.check_and_record_sync(ip_hash, event_type)
+        # Redis가 잠깐 끊겨도 판정이 비지 않도록 로컬 링도 같이 유지
+        self.fallback.check_and_record_sync(ip_hash, event_type)
+        return result
+
+    async def warm_up(self, events: Iterable[Tuple[str, str, str, datetime]]) -> int:
+        """
+        재시작/flush 직후 한 워커가 최근 24시간 클릭으로 채움.
+        click:warm 마커를 SET NX로 잡은 워커만 로드한다 (동시 기동 시 중복 작업 방지).
+        member가 click_events.id 라서 마커가 만료된 뒤 다시 로드해도
+        이미 live로 기록된 클릭은 덮어써질 뿐 두 번 카운트되지 않는다.
+        """
+        events = list(events)
+        self.fallback.load(events)
+
+        if not await self.redis.set(self.warm_marker, "1", nx=True, ex=DAY):
+            return 0
+
+        pipe = self.redis.pipeline(transaction=False)
+        for i, (event_id, ip_hash, event_type, created_at) in enumerate(events):
+            ts = _to_epoch(created_at)
+            member = event_id
+            ip_key = self._ip_key(ip_hash)
+            pipe.zadd(ip_key, {member: ts})
+            pipe.zremrangebyrank(ip_key, 0, -(DAILY_LIMIT + 1))
+            pipe.expire(ip_key, DAY)
+            if is_page_view(event_type):
+                page_key = self._page_key(ip_hash, event_type)
+                pipe.zadd(page_key, {member: ts})
+                pipe.zremrangebyrank(page_key, 0, -(POPUP_VISIT_LIMIT + 1))
+                pipe.expire(page_key, HOUR)
+            if i % 1000 == 999:
+                await pipe.execute()
+        await pipe.execute()
+        return len(events)
+
+    async def stats(self) -> dict:
+        local = await self.fallback.stats()
+        return {"backend": self.backend, "local": local}
+
+
+def _to_epoch(dt: datetime) -> float:
+    # click_events.created_at은 naive UTC (tracking.py가 utcnow()로 비교)
+    return (dt - datetime(1970, 1, 1)).total_seconds() if dt.tzinfo is None else dt.timestamp()
+
+
+def load_recent_events(db) -> Iterable[Tuple[str, str, str, datetime]]:
+    """최근 24시간 click_events (id, ip_hash, event_type, created_at) 오름차순"""
+    from app.models.click_event import ClickEvent
+
+    since = datetime.utcnow() - timedelta(days=1)
+    return (
+        db.query(ClickEvent.id, ClickEvent.ip_hash, ClickEvent.event_type, ClickEvent.created_at)
+        .filter(ClickEvent.created_at >= since)
+        .order_by(ClickEvent.created_at.asc())
+        .yield_per(5000)
+    )
+
+
+ClickCounter = Union[MemoryClickCounter, RedisClickCounter]
+
+# 싱글톤 인스턴스
+_click_counter: Optional[ClickCounter] = None
+
+
+def get_click_counter() -> ClickCounter:
+    """설정된 백엔드의 ClickCounter 인스턴스 가져오기"""
+    global _click_counter
+    if _click_counter is None:
+        memory = MemoryClickCounter(max_keys=settings.CLICK_COUNTER_MAX_KEYS)
+        if settings.CLICK_COUNTER_BACKEND == "redis":
+            from app.core.redis import get_redis
+
+            _click_counter = RedisClickCounter(get_redis(), fallback=memory)
+        else:
+            _click_counter = memory
+    return _click_counter
+
+
+def _read_recent_events() -> list:
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        return list(load_recent_events(db))
+    finally:
+        db.close()
+
+
+async def warm_up_click_counter() -> None:
+    """lifespan startup에서 호출 - DB/Redis 장애가 있어도 서버 기동은 막지 않음"""
+    try:
+        events = await asyncio.to_thread(_read_recent_events)
+        loaded = await get_click_counter().warm_up(events)
+        logger.info(f"[ClickCounter] warmed up ({settings.CLICK_COUNTER_BACKEND}) with {loaded} events from last 24h")
+    except Exception as e:
+        logger.exception(f"[ClickCounter] warm-up failed: {e}")
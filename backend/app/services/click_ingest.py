@@ -0,0 +1,234 @@
+"""
+Click Ingest - ClickEvent write-behind 적재 파이프라인
+
+track_click 요청마다 INSERT + commit(fsync) 하던 것을
+프로세스 내 asyncio.Queue에 넣고 바로 응답한 뒤,
+백그라운드 태스크가 N건 또는 T ms 마다 multi-row INSERT 한 번으로 저장한다.
+(click_rollups_hourly / click_rollups_daily 도 같은 트랜잭션에서 갱신)
+
+- 큐가 가득 차면 enqueue가 최대 CLICK_INGEST_ENQUEUE_TIMEOUT_MS 만큼 대기(backpressure),
+  그래도 자리가 없으면 이벤트를 버리고 dropped 카운트만 올린다 (클릭 API는 실패시키지 않음)
+- 배치 INSERT가 실패하면 CLICK_INGEST_FLUSH_RETRIES번까지 backoff 후 같은 배치를 재시도,
+  그래도 실패하면 버리고 버린 건수를 로그/failed_total에 남김 (중복 키 오류는 재시도 안 함)
+- lifespan shutdown에서 stop() → 남은 이벤트 모두 flush
+"""
+import asyncio
+import logging
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.click_event import ClickEvent
+from app.services.click_rollup import apply_rollups
+
+logger = logging.getLogger(__name__)
+
+# 종료 신호 (큐 sentinel)
+_STOP = object()
+
+# flush 재시도 backoff (초): 0.2, 0.4, 0.8 ...
+_RETRY_BASE_DELAY = 0.2
+
+
+class ClickIngestor:
+    """ClickEvent 배치 적재기"""
+
+    def __init__(
+        self,
+        batch_size: int = 200,
+        flush_interval_ms: int = 500,
+        max_queue: int = 10_000,
+        enqueue_timeout_ms: int = 100,
+        flush_retries: int = 3,
+    ):
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_queue = max_queue
+        self.enqueue_timeout = enqueue_timeout_ms / 1000
+        self.flush_retries = flush_retries
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+        # metrics
+        self.enqueued_total = 0
+        self.dropped_total = 0
+        self.flushed_total = 0
+        self.failed_total = 0
+        self.retried_total = 0
+        self.flush_count = 0
+        self.last_flush_ms = 0.0
+        self.max_flush_ms = 0.0
+        self._flush_ms_sum = 0.0
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._task = asyncio.create_task(self._run(), name="click-ingestor")
+        logger.info(
+            f"[ClickIngest] started (batch={self.batch_size}, interval={self.flush_interval}s, queue={self.max_queue})"
+        )
+
+    async def stop(self) -> None:
+        """종료 신호를 큐 맨 뒤에 넣고, 그 앞의 이벤트가 모두 flush될 때까지 대기"""
+        if self._task is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        logger.info(f"[ClickIngest] stopped (flushed_total={self.flushed_total}, dropped_total={self.dropped_total})")
+
+    # -------------------------
+    # producer
+    # -------------------------
+    @staticmethod
+    def build_row(ip_hash: str, event_type: str, is_suspicious: bool, event_id: Optional[str] = None) -> Dict[str, Any]:
+        # 배치로 늦게 저장되므로 id/created_at은 요청 시점에 확정
+        # (event_id: 클릭 카운터에 먼저 기록한 id - click_events.id와 같아야 warm-up 시 중복 카운트 안 됨)
+        return {
+            "id": event_id or str(uuid.uuid4()),
+            "ip_hash": ip_hash,
+            "event_type": event_type,
+            "is_suspicious": is_suspicious,
+            "created_at": datetime.utcnow(),
+        }
+
+    async def enqueue(self, row: Dict[str, Any]) -> bool:
+        """큐에 넣고 바로 리턴. 적재 루프가 없으면(스크립트 등) 즉시 저장"""
+        if self._task is None:
+            await self._flush([row])
+            return True
+
+        try:
+            self._queue.put_nowait(row)
+        except asyncio.QueueFull:
+            try:
+                await asyncio.wait_for(self._queue.put(row), timeout=self.enqueue_timeout)
+            except asyncio.TimeoutError:
+                self.dropped_total += 1
+                logger.warning(f"[ClickIngest] queue full, event dropped (dropped_total={self.dropped_total})")
+                return False
+
+        self.enqueued_total += 1
+        return True
+
+    # -------------------------
+    # consumer
+    # -------------------------
+    async def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            # 첫 이벤트가 올 때까지 대기 → 이후 interval 동안 batch_size까지 모음
+            first = await self._queue.get()
+            if first is _STOP:
+                break
+            batch = [first]
+            deadline = time.monotonic() + self.flush_interval
+
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(self._queue.get(), timeout=timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+
+            await self._flush(batch)
+
+    async def _flush(self, rows: List[Dict[str, Any]]) -> None:
+        if not rows:
+            return
+        started = time.perf_counter()
+        try:
+            for attempt in range(self.flush_retries + 1):
+                try:
+                    await asyncio.to_thread(self._write, rows)
+                    self.flushed_total += len(rows)
+                    return
+                except IntegrityError as e:
+                    # 제약 조건 위반(중복 키 - commit 후 연결 끊김 등, 파티션 없음) - 재시도해도 같은 오류
+                    logger.error(f"[ClickIngest] flush failed with integrity error, {len(rows)} rows not retried: {e}")
+                    break
+                except Exception as e:
+                    if attempt == self.flush_retries:
+                        logger.exception(f"[ClickIngest] flush failed after {attempt + 1} attempts: {e}")
+                        break
+                    self.retried_total += 1
+                    delay = _RETRY_BASE_DELAY * 2 ** attempt
+                    logger.warning(f"[ClickIngest] flush failed ({len(rows)} rows), retry in {delay}s: {e}")
+                    await asyncio.sleep(delay)
+            self.failed_total += len(rows)
+            logger.error(f"[ClickIngest] {len(rows)} click events lost (failed_total={self.failed_total})")
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.flush_count += 1
+            self.last_flush_ms = elapsed_ms
+            self.max_flush_ms = max(self.max_flush_ms, elapsed_ms)
+            self._flush_ms_sum += elapsed_ms
+
+    @staticmethod
+    def _write(rows: List[Dict[str, Any]]) -> None:
+        db = SessionLocal()
+        try:
+            # executemany → SQLAlchemy insertmanyvalues로 multi-row INSERT
+            db.execute(insert(ClickEvent), rows)
+            # 같은 트랜잭션에서 시간/일 롤업 증분 반영
+            apply_rollups(db, rows)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # -------------------------
+    # metrics
+    # -------------------------
+    def metrics(self) -> dict:
+        return {
+            "running": self._task is not None,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "queue_capacity": self.max_queue,
+            "enqueued_total": self.enqueued_total,
+            "flushed_total": self.flushed_total,
+            "dropped_total": self.dropped_total,
+            "failed_total": self.failed_total,
+            "retried_total": self.retried_total,
+            "flush_count": self.flush_count,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+            "avg_flush_ms": round(self._flush_ms_sum / self.flush_count, 2) if self.flush_count else 0.0,
+            "max_flush_ms": round(self.max_flush_ms, 2),
+        }
+
+
+# 싱글톤 인스턴스
+_click_ingestor: Optional[ClickIngestor] = None
+
+
+def get_click_ingestor() -> ClickIngestor:
+    """ClickIngestor 인스턴스 가져오기"""
+    global _click_ingestor
+    if _click_ingestor is None:
+        _click_ingestor = ClickIngestor(
+            batch_size=settings.CLICK_INGEST_BATCH_SIZE,
+            flush_interval_ms=settings.CLICK_INGEST_FLUSH_INTERVAL_MS,
+            max_queue=settings.CLICK_INGEST_QUEUE_SIZE,
+            enqueue_timeout_ms=settings.CLICK_INGEST_ENQUEUE_TIMEOUT_MS,
+            flush_retries=settings.CLICK_INGEST_FLUSH_RETRIES,
+        )
+    return _click_ingestor
@@ -0,0 +1,121 @@
+"""
+Click Partitions - click_events 월별 파티션 관리
+
+- ensure_partitions(): 이번 달 ~ N개월 뒤 파티션 미리 생성 (서버 기동 시 + 유지보수 커맨드)
+- prune_partitions(): 보관기간(CLICK_EVENTS_RETENTION_DAYS)이 지난 파티션 DROP 또는 archive 스키마로 이동
+
+파티션 이름: click_events_pYYYYMM, 범위 밖 row는 click_events_default 로 들어감.
+집계는 click_rollups_* 에 남아 있으므로 원본 파티션을 지워도 통계는 유지된다.
+"""
+import logging
+import re
+from datetime import date, datetime, timedelta
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "click_events"
+DEFAULT_PARTITION = "click_events_default"
+ARCHIVE_SCHEMA = "click_archive"
+
+_PARTITION_RE = re.compile(r"^click_events_p(\d{4})(\d{2})$")
+
+
+def partition_name(month_start: date) -> str:
+    return f"{PARENT_TABLE}_p{month_start:%Y%m}"
+
+
+def month_start(d: date) -> date:
+    return d.replace(day=1)
+
+
+def add_months(d: date, months: int) -> date:
+    y, m = divmod(d.month - 1 + months, 12)
+    return date(d.year + y, m + 1, 1)
+
+
+def create_partition_sql(start: date) -> str:
+    end = add_months(start, 1)
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(start)} PARTITION OF {PARENT_TABLE} "
+        f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+    )
+
+
+def list_partitions(db: Session) -> List[str]:
+    rows = db.execute(text("""
+        SELECT c.relname
+        FROM pg_inherits i
+        JOIN pg_class c ON c.oid = i.inhrelid
+        JOIN pg_class p ON p.oid = i.inhparent
+        WHERE p.relname = :parent
+        ORDER BY c.relname
+    """), {"parent": PARENT_TABLE}).scalars().all()
+    return list(rows)
+
+
+def ensure_partitions(db: Session, months_ahead: int = 3) -> List[str]:
+    """이번 달부터 months_ahead개월 뒤까지 파티션 생성 (commit은 호출부)"""
+    existing = set(list_partitions(db))
+    created = []
+    current = month_start(datetime.utcnow().date())
+    for i in range(months_ahead + 1):
+        start = add_months(current, i)
+        name = partition_name(start)
+        if name in existing:
+            continue
+        db.execute(text(create_partition_sql(start)))
+        created.append(name)
+    if DEFAULT_PARTITION not in existing:
+        db.execute(text(f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF {PARENT_TABLE} DEFAULT"))
+        created.append(DEFAULT_PARTITION)
+    return created
+
+
+def prune_partitions(db: Session, retention_days: int, archive: bool = False, dry_run: bool = False) -> List[str]:
+    """
+    파티션 전체 범위가 보관기간 밖이면 정리 (commit은 호출부)
+    archive=True 면 DETACH 후 click_archive 스키마로 이동 (pg_dump 등으로 별도 보관)
+    """
+    cutoff = datetime.utcnow().date() - timedelta(days=retention_days)
+    pruned = []
+    for name in list_partitions(db):
+        m = _PARTITION_RE.match(name)
+        if not m:
+            continue
+        upper = add_months(date(int(m.group(1)), int(m.group(2)), 1), 1)
+        if upper > cutoff:
+            continue
+
+        pruned.append(name)
+        if dry_run:
+            continue
+
+        db.execute(text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {name}"))
+        if archive:
+            db.execute(text(f"CREATE SCHEMA IF NOT EXISTS {ARCHIVE_SCHEMA}"))
+            db.execute(text(f"ALTER TABLE {name} SET SCHEMA {ARCHIVE_SCHEMA}"))
+        else:
+            db.execute(text(f"DROP TABLE {name}"))
+    return pruned
+
+
+def ensure_click_partitions() -> None:
+    """lifespan startup에서 호출 - 실패해도 서버 기동은 막지 않음 (default 파티션이 받아줌)"""
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+
+    db = SessionLocal()
+    try:
+        created = ensure_partitions(db, settings.CLICK_PARTITIONS_AHEAD)
+        db.commit()
+        if created:
+            logger.info(f"[ClickPartitions] created: {', '.join(created)}")
+    except Exception as e:
+        db.rollback()
+        logger.exception(f"[ClickPartitions] ensure failed: {e}")
+    finally:
+        db.close()
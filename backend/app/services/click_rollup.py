@@ -0,0 +1,201 @@
+"""
+Click Rollup - click_events 시간/일 단위 사전 집계
+
+- apply_rollups(): ClickIngestor가 배치 INSERT와 같은 트랜잭션에서 호출 (증분 upsert)
+- rebuild_rollups(): 원본 click_events로 특정 구간 재계산 (백필/복구용 compactor)
+- get_click_stats() / get_suspicious_ips(): /track/stats, /track/suspicious 조회
+
+/track/stats 의 기간 시작점(now - days)은 보통 정시가 아니므로,
+시작 시각 ~ 다음 정시 구간만 원본 click_events에서 읽고 나머지는 롤업에서 읽는다.
+"""
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List
+
+from sqlalchemy import and_, delete, func, not_, select, union
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.click_event import ClickEvent
+from app.models.click_rollup import ClickRollupDaily, ClickRollupHourly
+
+
+def _floor_hour(dt: datetime) -> datetime:
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil_hour(dt: datetime) -> datetime:
+    floored = _floor_hour(dt)
+    return floored if floored == dt else floored + timedelta(hours=1)
+
+
+def _floor_day(dt: datetime) -> datetime:
+    return dt.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _ceil_day(dt: datetime) -> datetime:
+    floored = _floor_day(dt)
+    return floored if floored == dt else floored + timedelta(days=1)
+
+
+# -------------------------
+# Write path
+# -------------------------
+def apply_rollups(db: Session, rows: Iterable[Dict[str, Any]]) -> None:
+    """
+    ClickEvent row(dict) 배치를 롤업 테이블에 더함 (commit은 호출부)
+    키 정렬 후 upsert → 워커 간 동시 upsert 시 데드락 방지
+    """
+    hourly: Dict[tuple, Dict[str, Any]] = {}
+    daily: Dict[tuple, Dict[str, int]] = defaultdict(lambda: {"count": 0, "suspicious_count": 0})
+
+    for r in rows:
+        created_at = r["created_at"]
+        suspicious = 1 if r.get("is_suspicious") else 0
+
+        hkey = (r["ip_hash"], r["event_type"], _floor_hour(created_at))
+        h = hourly.get(hkey)
+        if h is None:
+            hourly[hkey] = {"count": 1, "suspicious_count": suspicious, "last_click": created_at}
+        else:
+            h["count"] += 1
+            h["suspicious_count"] += suspicious
+            h["last_click"] = max(h["last_click"], created_at)
+
+        d = daily[(r["event_type"], created_at.date())]
+        d["count"] += 1
+        d["suspicious_count"] += suspicious
+
+    if hourly:
+        stmt = pg_insert(ClickRollupHourly).values([
+            {"ip_hash": k[0], "event_type": k[1], "hour": k[2], **v}
+            for k, v in sorted(hourly.items())
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["ip_hash", "event_type", "hour"],
+            set_={
+                "count": ClickRollupHourly.count + stmt.excluded.count,
+                "suspicious_count": ClickRollupHourly.suspicious_count + stmt.excluded.suspicious_count,
+                "last_click": func.greatest(ClickRollupHourly.last_click, stmt.excluded.last_click),
+            },
+        )
+        db.execute(stmt)
+
+    if daily:
+        stmt = pg_insert(ClickRollupDaily).values([
+            {"event_type": k[0], "day": k[1], **v}
+            for k, v in sorted(daily.items())
+        ])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["event_type", "day"],
+            set_={
+                "count": ClickRollupDaily.count + stmt.excluded.count,
+                "suspicious_count": ClickRollupDaily.suspicious_count + stmt.excluded.suspicious_count,
+            },
+        )
+        db.execute(stmt)
+
+
+def rebuild_rollups(db: Session, since: datetime) -> None:
+    """
+    since가 속한 날짜부터 현재까지 롤업을 원본 click_events로 다시 계산 (commit은 호출부)
+    롤업이 어긋났을 때(수동 INSERT, 장애 등) 복구용
+    """
+    day_start = _floor_day(since)
+
+    db.execute(delete(ClickRollupHourly).where(ClickRollupHourly.hour >= day_start))
+    db.execute(delete(ClickRollupDaily).where(ClickRollupDaily.day >= day_start.date()))
+
+    hour_col = func.date_trunc("hour", ClickEvent.created_at)
+    suspicious_col = func.count().filter(ClickEvent.is_suspicious.is_(True))
+    db.execute(
+        pg_insert(ClickRollupHourly).from_select(
+            ["ip_hash", "event_type", "hour", "count", "suspicious_count", "last_click"],
+            select(
+                ClickEvent.ip_hash,
+                ClickEvent.event_type,
+                hour_col,
+                func.count(),
+                suspicious_col,
+                func.max(ClickEvent.created_at),
+            )
+            .where(ClickEvent.created_at >= day_start)
+            .group_by(ClickEvent.ip_hash, ClickEvent.event_type, hour_col),
+        )
+    )
+
+    day_col = func.date(ClickEvent.created_at)
+    db.execute(
+        pg_insert(ClickRollupDaily).from_select(
+            ["event_type", "day", "count", "suspicious_count"],
+            select(ClickEvent.event_type, day_col, func.count(), suspicious_col)
+            .where(ClickEvent.created_at >= day_start)
+            .group_by(ClickEvent.event_type, day_col),
+        )
+    )
+
+
+# -------------------------
+# Read path
+# -------------------------
+def get_click_stats(db: Session, start: datetime, now: datetime) -> Dict[str, int]:
+    """
+    [start, now] 구간 total/suspicious/unique_ips
+
+    - [start, 다음 정시)           : 원본 click_events
+    - [다음 정시, 다음 자정)        : hourly 롤업
+    - [다음 자정, 오늘 0시)         : daily 롤업 (전체 일자)
+    - [오늘 0시, now]              : hourly 롤업
+    """
+    head_end = min(_ceil_hour(start), _ceil_hour(now))
+    day_start = _ceil_day(head_end)
+    today = _floor_day(now)
+
+    raw_total, raw_suspicious = db.execute(
+        select(func.count(), func.count().filter(ClickEvent.is_suspicious.is_(True)))
+        .where(ClickEvent.created_at >= start, ClickEvent.created_at < head_end)
+    ).one()
+
+    hourly_filter = [ClickRollupHourly.hour >= head_end]
+    if day_start < today:
+        hourly_filter.append(
+            not_(and_(ClickRollupHourly.hour >= day_start, ClickRollupHourly.hour < today))
+        )
+        daily_total, daily_suspicious = db.execute(
+            select(
+                func.coalesce(func.sum(ClickRollupDaily.count), 0),
+                func.coalesce(func.sum(ClickRollupDaily.suspicious_count), 0),
+            ).where(ClickRollupDaily.day >= day_start.date(), ClickRollupDaily.day < today.date())
+        ).one()
+    else:
+        daily_total, daily_suspicious = 0, 0
+
+    hourly_total, hourly_suspicious = db.execute(
+        select(
+            func.coalesce(func.sum(ClickRollupHourly.count), 0),
+            func.coalesce(func.sum(ClickRollupHourly.suspicious_count), 0),
+        ).where(*hourly_filter)
+    ).one()
+
+    ips = union(
+        select(ClickEvent.ip_hash).where(ClickEvent.created_at >= start, ClickEvent.created_at < head_end),
+        select(ClickRollupHourly.ip_hash).where(ClickRollupHourly.hour >= head_end),
+    ).subquery()
+    unique_ips = db.execute(select(func.count()).select_from(ips)).scalar() or 0
+
+    return {
+        "total": int(raw_total + hourly_total + daily_total),
+        "suspicious": int(raw_suspicious + hourly_suspicious + daily_suspicious),
+        "unique_ips": int(unique_ips),
+    }
+
+
+def get_suspicious_ips(db: Session, min_clicks: int = 10) -> List[tuple]:
+    """(ip_hash, click_count, last_click) - 누적 클릭 min_clicks 이상, 클릭 수 내림차순"""
+    total = func.sum(ClickRollupHourly.count).label("count")
+    return db.execute(
+        select(ClickRollupHourly.ip_hash, total, func.max(ClickRollupHourly.last_click))
+        .group_by(ClickRollupHourly.ip_hash)
+        .having(func.sum(ClickRollupHourly.count) >= min_clicks)
+        .order_by(total.desc())
+    ).all()
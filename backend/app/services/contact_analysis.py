@@ -0,0 +1,342 @@
+"""
+Contact Analysis - 상담문의 AI 분석 후 contacts 테이블에 저장
+
+outbox job(contact.analyze)으로 워커(app/worker.py)에서 실행.
+(이전에는 public.submit_contact_form의 BackgroundTasks → 재시작 시 유실)
+
+DB 오류 / OpenAI 실패(timeout, API 에러, JSON 파싱 실패)는 예외로 올려서 워커가 backoff 후 재시도하게 함.
+재시도를 다 쓰고 job이 FAILED가 될 때만 save_fallback_analysis()가 폴백 요약 + 규칙 분류를
+ai_model=FALLBACK_MODEL 로 저장 (OpenAI 결과와 구분, backlog 재분석 대상).
+
+AI 분석 캐시(app/services/ai_cache.py):
+- 접수 시점(fill_from_cache)에 hit이면 바로 ai_* 채우고 분석 job을 등록하지 않음 (ai_cached=True)
+- 워커/backlog에서도 OpenAI 호출 전 조회, 성공 결과는 저장
+
+Backlog (미분석 contact 일괄 분석 - 과거 데이터 import / OpenAI 장애 복구 후):
+- 대상: ai_summary IS NULL 또는 ai_model = FALLBACK_MODEL (장애 중 최종 실패로 폴백이 저장된 건)
+- id 순 keyset 페이지(AI_BACKLOG_BATCH_SIZE건)씩 조회 → 페이지 안에서 동시 분석
+  (동시 호출 수는 OpenAIClient 세마포어 OPENAI_MAX_CONCURRENCY가 제한)
+- 페이지 결과는 ORM bulk UPDATE(executemany) 한 번으로 저장
+- 실패한 contact는 기존 값(NULL / 폴백) 그대로 → 다음 실행에서 다시 대상
+- 진행 위치(cursor = 마지막 id)만 있으면 어디서든 이어서 실행 가능
+- 워커 job은 시간 예산(job timeout 기준) 안에서만 페이지를 진행하고 다음 job으로 넘김
+- 페이지 안의 같은 캐시 키(템플릿 문의)는 OpenAI를 한 번만 호출
+    scripts/analyze_backlog.py          : CLI (진행률/처리량 출력)
+    POST /api/v1/contacts/ai-backlog    : outbox job(contact.analyze_backlog)으로 워커에서 실행
+"""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Callable, List, Optional
+
+from sqlalchemy import func, or_, select, update
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal
+from app.models.contact import Contact
+from app.schemas.ai import ContactAnalysisRequest
+from app.services import ai_cache
+from app.services.openai import analyze_contact_inquiry, get_fallback_result, get_openai_client
+from app.services.outbox import JOB_CONTACT_ANALYZE_BACKLOG, FollowUp
+from app.services.triage import TRIAGE_MODEL, classify
+
+logger = logging.getLogger(__name__)
+
+# 분석 실패 폴백 결과 표시 (ai_summary는 채워지지만 AI 분석 결과는 아님)
+FALLBACK_MODEL = "fallback"
+
+
+class AnalysisFailed(Exception):
+    """OpenAI 분석 실패 - 워커가 backoff 후 재시도"""
+
+
+def _to_request(contact) -> ContactAnalysisRequest:
+    """Contact (또는 같은 컬럼을 가진 row) → 분석 요청"""
+    return ContactAnalysisRequest(
+        name=contact.name,
+        inquiry_type=contact.inquiry_type,
+        message=contact.message,
+        phone=contact.phone,
+        email=contact.email,
+    )
+
+
+def _ai_values(ai_result, analyzed_at: datetime, cached: bool = False, model: str = "openai") -> dict:
+    return {
+        "ai_summary": ai_result.summary,
+        "ai_category": ai_result.category,
+        "ai_urgency": ai_result.urgency,
+        "ai_next_actions": ai_result.next_actions,
+        "ai_model": model,
+        "ai_created_at": analyzed_at,
+        "ai_cached": cached,
+    }
+
+
+async def fill_from_cache(db, contact: Contact) -> bool:
+    """접수 시점 캐시 조회 - hit이면 contact의 ai_* 를 채우고 True (commit은 호출 쪽에서)"""
+    cached = await ai_cache.get_cached(db, ai_cache.cache_key(_to_request(contact)))
+    if cached is None:
+        return False
+    for column, value in _ai_values(cached, datetime.utcnow(), cached=True).items():
+        setattr(contact, column, value)
+    return True
+
+
+async def analyze_and_save_contact(contact_id: str) -> None:
+    """
+    contact 1건 AI 분석 → ai_* 컬럼 저장 (없는 contact / API 키 없음은 조용히 종료)
+    OpenAI 실패 시 AnalysisFailed (저장하지 않음 → 워커 재시도)
+    """
+    # OpenAI 응답 대기 동안 DB 커넥션을 잡고 있지 않도록 조회/저장 세션을 분리
+    async with AsyncSessionLocal() as db:
+        contact = (await db.execute(select(Contact).where(Contact.id == contact_id))).scalar_one_or_none()
+        if not contact:
+            logger.warning(f"[AI] contact not found: id={contact_id}")
+            return
+        ai_request = _to_request(contact)
+        key = ai_cache.cache_key(ai_request)
+        ai_result = await ai_cache.get_cached(db, key)
+        await db.commit()  # hit 기록
+
+    cached = ai_result is not None
+    if not cached:
+        if get_openai_client().client is None:
+            logger.info(f"[AI] analysis skipped (no API key): id={contact_id}")
+            return
+        ai_result = await analyze_contact_inquiry(ai_request, fallback=False)
+        if ai_result is None:
+            raise AnalysisFailed(f"OpenAI analysis failed: id={contact_id}")
+
+    # AI 결과 저장 (+ 성공 결과 캐시)
+    async with AsyncSessionLocal() as db:
+        await db.execute(
+            update(Contact)
+            .where(Contact.id == contact_id)
+            .values(**_ai_values(ai_result, datetime.utcnow(), cached=cached))
+        )
+        if not cached:
+            await ai_cache.store_many(db, {key: ai_result})
+        await db.commit()
+    logger.info(
+        f"[AI] saved: id={contact_id}, category={ai_result.category}, urgency={ai_result.urgency}, cached={cached}"
+    )
+
+
+async def save_fallback_analysis(contact_id: str) -> None:
+    """
+    contact.analyze job 최종 실패(FAILED) 시 워커가 호출
+    폴백 요약 + 규칙 분류 카테고리/긴급도(접수 시점 triage, 없으면 지금 계산)를 ai_model=FALLBACK_MODEL 로 저장
+    (그 사이 다른 경로로 분석된 contact는 건드리지 않음)
+    """
+    async with AsyncSessionLocal() as db:
+        contact = (await db.execute(select(Contact).where(Contact.id == contact_id))).scalar_one_or_none()
+        if not contact:
+            return
+        if contact.ai_model == TRIAGE_MODEL and contact.ai_category:
+            category, urgency = contact.ai_category, contact.ai_urgency
+        else:
+            triage = classify(contact.inquiry_type, contact.message)
+            category, urgency = triage.category, triage.urgency
+        fallback = get_fallback_result(_to_request(contact)).model_copy(
+            update={"category": category, "urgency": urgency}
+        )
+        await db.execute(
+            update(Contact)
+            .where(Contact.id == contact_id, Contact.ai_summary.is_(None))
+            .values(**_ai_values(fallback, datetime.utcnow(), model=FALLBACK_MODEL))
+        )
+        await db.commit()
+    logger.warning(f"[AI] analysis failed permanently, fallback saved: id={contact_id}")
+
+
+# ---------------------------------------------------------------------------
+# Backlog 일괄 분석
+# ---------------------------------------------------------------------------
+
+# 분석에 필요한 컬럼만 조회 (ai_*, reply 등 제외)
+_BACKLOG_COLUMNS = (Contact.id, Contact.name, Contact.inquiry_type, Contact.message, Contact.phone, Contact.email)
+
+
+def _unanalyzed():
+    """AI 분석 결과가 없는 contact 조건 (미분석 + 최종 실패 폴백)"""
+    return or_(Contact.ai_summary.is_(None), Contact.ai_model == FALLBACK_MODEL)
+
+
+async def count_unanalyzed(db) -> int:
+    """AI 분석 결과가 없는 contact 수 (ai_summary 없음 / 폴백 저장)"""
+    return await db.scalar(select(func.count()).select_from(Contact).where(_unanalyzed())) or 0
+
+
+async def analyze_backlog(
+    batch_size: int,
+    max_contacts: Optional[int] = None,
+    cursor: Optional[str] = None,
+    on_batch: Optional[Callable[[dict], None]] = None,
+    time_budget: Optional[float] = None,
+) -> dict:
+    """
+    AI 분석 결과가 없는 contact(ai_summary IS NULL / 폴백)를 cursor(id) 다음부터 분석
+
+    Args:
+        batch_size: 페이지(= bulk UPDATE 1회) 크기
+        max_contacts: 이번 실행에서 처리할 최대 건수 (None이면 끝까지)
+        cursor: 이어서 실행할 마지막 id (None이면 처음부터)
+        on_batch: 페이지마다 진행 상황 dict를 받는 콜백
+        time_budget: 이번 실행 시간 예산(초, None이면 제한 없음)
+            - 페이지마다 남은 시간에 OpenAI 호출 몇 라운드(OPENAI_TIMEOUT)가 들어가는지 보고 페이지 크기를 줄임
+            - 한 라운드도 안 남으면 중단 (has_more=True, cursor부터 이어서)
+            - 그래도 넘기면 남은 호출은 취소하고 끝난 contact까지만 저장 / cursor 이동
+
+    Returns:
+        {"processed", "analyzed", "failed", "cached", "cursor", "has_more", "aborted", "elapsed_seconds", "per_second"}
+        - 한 페이지가 전부 실패하면(OpenAI 장애 등) 더 진행하지 않고 aborted=True
+    """
+    client = get_openai_client()
+    if client.client is None:
+        raise RuntimeError("OpenAI API key not configured")
+
+    started = time.perf_counter()
+    deadline = None if time_budget is None else started + time_budget
+    progress = {
+        "processed": 0,
+        "analyzed": 0,
+        "failed": 0,
+        "cached": 0,
+        "cursor": cursor,
+        "has_more": True,
+        "aborted": False,
+    }
+
+    while max_contacts is None or progress["processed"] < max_contacts:
+        size = batch_size if max_contacts is None else min(batch_size, max_contacts - progress["processed"])
+        if deadline is not None:
+            # 호출 1건은 세마포어 안에서 최대 client.timeout → 라운드당 OPENAI_MAX_CONCURRENCY건
+            rounds = int((deadline - time.perf_counter()) // client.timeout)
+            if rounds < 1:
+                if progress["processed"]:
+                    break
+                rounds = 1  # 예산 < OPENAI_TIMEOUT 이어도 첫 페이지는 진행 (아래 wait timeout으로 제한)
+            size = min(size, settings.OPENAI_MAX_CONCURRENCY * rounds)
+
+        query = select(*_BACKLOG_COLUMNS).where(_unanalyzed())
+        if progress["cursor"] is not None:
+            query = query.where(Contact.id > progress["cursor"])
+        async with AsyncSessionLocal() as db:
+            rows = (await db.execute(query.order_by(Contact.id).limit(size))).all()
+        if not rows:
+            progress["has_more"] = False
+            break
+
+        requests = {row.id: _to_request(row) for row in rows}
+        keys = {row.id: ai_cache.cache_key(requests[row.id]) for row in rows}
+        async with AsyncSessionLocal() as db:
+            cached = await ai_cache.get_cached_many(db, keys.values())
+            await db.commit()
+
+        # 캐시 miss인 키만 (같은 키는 한 번) 분석 - OpenAI 응답 대기 중에는 세션 없음
+        tasks = {}
+        for row in rows:
+            key = keys[row.id]
+            if key not in cached and key not in tasks:
+                tasks[key] = asyncio.create_task(analyze_contact_inquiry(requests[row.id], fallback=False))
+        unfinished = set()
+        if tasks:
+            timeout = None if deadline is None else max(deadline - time.perf_counter(), 0)
+            _, not_done = await asyncio.wait(tasks.values(), timeout=timeout)
+            for task in not_done:
+                task.cancel()
+            await asyncio.gather(*not_done, return_exceptions=True)
+            unfinished = {key for key, task in tasks.items() if task in not_done}
+        fresh = {
+            key: task.result()
+            for key, task in tasks.items()
+            if key not in unfinished and task.result() is not None
+        }
+
+        # 시간 초과로 취소된 contact부터는 이번 실행에서 처리하지 않음 (cursor를 그 앞까지만 이동)
+        if unfinished:
+            rows = rows[: next(i for i, row in enumerate(rows) if keys[row.id] in unfinished)]
+
+        analyzed_at = datetime.utcnow()
+        values = []
+        for row in rows:
+            key = keys[row.id]
+            if key in cached:
+                values.append({"id": row.id, **_ai_values(cached[key], analyzed_at, cached=True)})
+            elif key in fresh:
+                values.append({"id": row.id, **_ai_values(fresh[key], analyzed_at)})
+        if values:
+            # ORM bulk UPDATE by primary key → 한 번의 executemany
+            async with AsyncSessionLocal() as db:
+                await db.execute(update(Contact), values)
+                await ai_cache.store_many(db, fresh)
+                await db.commit()
+
+        progress["processed"] += len(rows)
+        progress["analyzed"] += len(values)
+        progress["failed"] += len(rows) - len(values)
+        progress["cached"] += sum(1 for row in rows if keys[row.id] in cached)
+        if rows:
+            progress["cursor"] = rows[-1].id
+        elapsed = time.perf_counter() - started
+        progress["elapsed_seconds"] = round(elapsed, 2)
+        progress["per_second"] = round(progress["processed"] / elapsed, 2) if elapsed else 0.0
+        logger.info(
+            f"[AI backlog] processed={progress['processed']} analyzed={progress['analyzed']} "
+            f"failed={progress['failed']} ({progress['per_second']}/s) cursor={progress['cursor']}"
+            + (f" (time budget reached, {len(unfinished)} calls cancelled)" if unfinished else "")
+        )
+        if on_batch:
+            on_batch(progress)
+
+        if unfinished:
+            # 예산 초과 - 한 건도 못 끝냈으면 진행이 안 되므로 실패로 처리 (job은 backoff 후 재시도)
+            progress["aborted"] = not progress["processed"]
+            break
+        if not values:
+            progress["aborted"] = True
+            break
+        if len(rows) < size:
+            progress["has_more"] = False
+            break
+
+    elapsed = time.perf_counter() - started
+    progress["elapsed_seconds"] = round(elapsed, 2)
+    progress["per_second"] = round(progress["processed"] / elapsed, 2) if elapsed else 0.0
+    return progress
+
+
+async def analyze_backlog_job(payload: dict) -> Optional[List[FollowUp]]:
+    """
+    outbox job(contact.analyze_backlog) - OUTBOX_JOB_TIMEOUT_SECONDS × AI_BACKLOG_JOB_BUDGET_RATIO 시간만큼 실행
+    (job timeout 전에 페이지 사이에서 멈춤) 남은 게 있으면 cursor/누적 집계를 넣은 다음 job을 돌려줌
+    → 워커가 이 job DONE과 같은 트랜잭션으로 등록 (크래시 후 재실행돼도 체인이 둘로 갈라지지 않음)
+
+    payload: {"batch_size", "cursor", "totals": {"processed", "analyzed", "failed", "cached"}, "started_at"}
+    """
+    if get_openai_client().client is None:
+        logger.warning("[AI backlog] OpenAI API key not configured - job skipped")
+        return
+
+    result = await analyze_backlog(
+        batch_size=payload.get("batch_size") or settings.AI_BACKLOG_BATCH_SIZE,
+        time_budget=settings.OUTBOX_JOB_TIMEOUT_SECONDS * settings.AI_BACKLOG_JOB_BUDGET_RATIO,
+        cursor=payload.get("cursor"),
+    )
+    if result["aborted"]:
+        # 같은 cursor로 워커 backoff 후 재시도 (이미 저장된 건은 OpenAI 결과가 채워져 다시 대상이 안 됨)
+        raise RuntimeError(f"AI backlog batch failed entirely at cursor={payload.get('cursor')}")
+
+    totals = dict(payload.get("totals") or {})
+    for key in ("processed", "analyzed", "failed", "cached"):
+        totals[key] = totals.get(key, 0) + result[key]
+
+    if result["has_more"]:
+        return [(JOB_CONTACT_ANALYZE_BACKLOG, {**payload, "cursor": result["cursor"], "totals": totals})]
+
+    logger.info(
+        f"[AI backlog] finished: processed={totals['processed']} analyzed={totals['analyzed']} "
+        f"failed={totals['failed']} (started_at={payload.get('started_at')})"
+    )
@@ -188,7 +188,7 @@ async def send_email(
 # =========================
 def render_admin_new_contact(contact: Dict[str, Any]) -> Dict[str, str]:
     """
-    contact: dict 권장 (BackgroundTasks 안전)
+    contact: dict 권장 (outbox job payload(JSON)로 안전)
     required keys: id, ticket_id, name, phone, email, inquiry_type, message
     """
     detail_url_raw = _build_admin_contact_url(contact.get("id")) or ""
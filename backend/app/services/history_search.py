@@ -0,0 +1,68 @@
+"""
+History Search - 공개 history 목록 검색 (Postgres 전문 검색 + trigram)
+
+- history.search_vector (generated tsvector, 제목 A / 요약 B / 본문 C, GIN 인덱스)
+- title/excerpt/content trigram GIN 인덱스 (pg_trgm) → 기존 ILIKE '%검색어%' 도 인덱스 사용
+
+'simple' 설정은 한국어 조사를 떼지 않으므로("프로그램을") 검색어 각 단어를
+접두어 매칭(프로그램:*)으로 묶고, 단어 중간 부분 일치는 ILIKE(trigram)로 보완한다.
+"""
+import re
+from typing import Optional
+
+from sqlalchemy import case, func, literal, literal_column, or_
+from sqlalchemy.sql.elements import ColumnElement
+
+from app.models.history import History
+
+# bind 파라미터(varchar)로 넘기면 드라이버에 따라 regconfig 캐스팅이 안 되므로 리터럴로 고정
+TS_CONFIG = literal_column("'simple'::regconfig")
+
+# ts_headline 옵션 (본문 HTML 태그는 미리 제거)
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=30, MinWords=10, FragmentDelimiter= … "
+
+# 제목에 검색어가 그대로 들어 있으면 가산점 (ts_rank_cd 값은 보통 0~1)
+TITLE_MATCH_BOOST = 1.0
+
+_TERM_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def build_tsquery(search: str) -> Optional[str]:
+    """'노인 프로그램' → '노인:* & 프로그램:*' (to_tsquery 문법 문자 제거)"""
+    terms = _TERM_RE.findall(search.lower())
+    if not terms:
+        return None
+    return " & ".join(f"{t}:*" for t in terms)
+
+
+class HistorySearch:
+    """검색어 하나에 대한 filter / rank / headline 표현식 묶음"""
+
+    def __init__(self, search: str):
+        self.search = search.strip()
+        self.like = f"%{self.search}%"
+        raw = build_tsquery(self.search)
+        self.tsquery = func.to_tsquery(TS_CONFIG, raw) if raw else None
+
+    def filter(self) -> ColumnElement:
+        conditions = [
+            History.title.ilike(self.like),
+            History.excerpt.ilike(self.like),
+            History.content.ilike(self.like),
+        ]
+        if self.tsquery is not None:
+            conditions.insert(0, History.search_vector.op("@@")(self.tsquery))
+        return or_(*conditions)
+
+    def rank(self) -> ColumnElement:
+        title_boost = case((History.title.ilike(self.like), TITLE_MATCH_BOOST), else_=0.0)
+        if self.tsquery is None:
+            return title_boost
+        return func.ts_rank_cd(History.search_vector, self.tsquery) + title_boost
+
+    def headline(self) -> ColumnElement:
+        """본문 기준 하이라이트 스니펫 (<mark>…</mark>)"""
+        if self.tsquery is None:
+            return literal(None)
+        plain = func.regexp_replace(History.content, "<[^>]+>", " ", "g")
+        return func.ts_headline(TS_CONFIG, plain, self.tsquery, HEADLINE_OPTIONS)
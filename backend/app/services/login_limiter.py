@@ -0,0 +1,156 @@
+"""
+Login Limiter - 로그인 시도 횟수 제한 (이메일별 / IP별 고정 윈도우)
+
+credential stuffing 때 요청마다 bcrypt(100~300ms CPU)를 돌리면 워커가 포화되므로
+비밀번호 검증 "전에" 시도 횟수로 먼저 거른다.
+
+- login:email:{email} : LOGIN_ATTEMPT_WINDOW_SECONDS 동안 LOGIN_MAX_ATTEMPTS_PER_EMAIL 회
+- login:ip:{ip}       : 같은 윈도우 동안 LOGIN_MAX_ATTEMPTS_PER_IP 회
+- 로그인 성공 시 해당 이메일 카운터는 초기화
+
+slowapi 대신 직접 구현한 이유: slowapi key_func는 Request만 받아서 JSON body의 email로 키를 못 만듦.
+(click_counter와 같은 memory/redis 백엔드 구조)
+
+LOGIN_LIMITER_BACKEND:
+- "memory": 프로세스 로컬 (uvicorn 워커마다 따로 셈 → 실제 허용 횟수는 워커 수 배)
+- "redis" : INCR + EXPIRE - 워커/컨테이너 간 공유. Redis 장애 시 memory로 판정
+"""
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryAttemptCounter:
+    """키별 (시도 횟수, 윈도우 끝 시각) - LRU로 키 수 제한"""
+
+    backend = "memory"
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._windows: "OrderedDict[str, list]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def incr(self, key: str, window: int) -> Tuple[int, int]:
+        """시도 1회 기록 → (윈도우 내 횟수, 윈도우 남은 초)"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._windows.get(key)
+            if entry is None or entry[1] <= now:
+                entry = [0, now + window]
+                self._windows[key] = entry
+                if len(self._windows) > self.max_keys:
+                    self._windows.popitem(last=False)
+            else:
+                self._windows.move_to_end(key)
+            entry[0] += 1
+            return entry[0], max(1, int(entry[1] - now))
+
+    async def reset(self, key: str) -> None:
+        with self._lock:
+            self._windows.pop(key, None)
+
+
+class RedisAttemptCounter:
+    """INCR + EXPIRE NX 파이프라인 (시도당 1 round trip)"""
+
+    backend = "redis"
+    prefix = "login"
+
+    def __init__(self, redis, fallback: MemoryAttemptCounter):
+        self.redis = redis
+        self.fallback = fallback
+
+    async def incr(self, key: str, window: int) -> Tuple[int, int]:
+        redis_key = f"{self.prefix}:{key}"
+        try:
+            pipe = self.redis.pipeline(transaction=True)
+            pipe.incr(redis_key)
+            pipe.expire(redis_key, window, nx=True)
+            pipe.ttl(redis_key)
+            count, _, ttl = await pipe.execute()
+            return int(count), max(1, int(ttl))
+        except Exception as e:
+            logger.warning(f"[LoginLimiter] redis failed, using memory: {e}")
+            return await self.fallback.incr(key, window)
+
+    async def reset(self, key: str) -> None:
+        try:
+            await self.redis.delete(f"{self.prefix}:{key}")
+        except Exception as e:
+            logger.warning(f"[LoginLimiter] redis reset failed: {e}")
+        await self.fallback.reset(key)
+
+
+class LoginLimiter:
+    """이메일/IP 시도 제한 판정"""
+
+    def __init__(self, counter, window: int, max_per_email: int, max_per_ip: int):
+        self.counter = counter
+        self.window = window
+        self.max_per_email = max_per_email
+        self.max_per_ip = max_per_ip
+
+        # metrics
+        self.checked_total = 0
+        self.blocked_total = 0
+
+    @staticmethod
+    def _email_key(email: str) -> str:
+        return f"email:{email.strip().lower()}"
+
+    async def hit(self, email: str, ip: str) -> Optional[int]:
+        """
+        시도 1회 기록. 제한을 넘으면 Retry-After(초), 아니면 None
+        (IP 먼저 확인 → 한 IP가 여러 이메일을 돌려도 이메일 카운터를 오염시키지 않음)
+        """
+        self.checked_total += 1
+        count, ttl = await self.counter.incr(f"ip:{ip}", self.window)
+        if count > self.max_per_ip:
+            self.blocked_total += 1
+            return ttl
+        count, ttl = await self.counter.incr(self._email_key(email), self.window)
+        if count > self.max_per_email:
+            self.blocked_total += 1
+            return ttl
+        return None
+
+    async def reset(self, email: str) -> None:
+        """로그인 성공 → 이메일 카운터 초기화 (IP 카운터는 유지)"""
+        await self.counter.reset(self._email_key(email))
+
+    def metrics(self) -> dict:
+        return {
+            "backend": self.counter.backend,
+            "checked_total": self.checked_total,
+            "blocked_total": self.blocked_total,
+        }
+
+
+# 싱글톤 인스턴스
+_login_limiter: Optional[LoginLimiter] = None
+
+
+def get_login_limiter() -> LoginLimiter:
+    """설정된 백엔드의 LoginLimiter 인스턴스 가져오기"""
+    global _login_limiter
+    if _login_limiter is None:
+        memory = MemoryAttemptCounter()
+        if settings.LOGIN_LIMITER_BACKEND == "redis":
+            from app.core.redis import get_redis
+
+            counter = RedisAttemptCounter(get_redis(), fallback=memory)
+        else:
+            counter = memory
+        _login_limiter = LoginLimiter(
+            counter,
+            window=settings.LOGIN_ATTEMPT_WINDOW_SECONDS,
+            max_per_email=settings.LOGIN_MAX_ATTEMPTS_PER_EMAIL,
+            max_per_ip=settings.LOGIN_MAX_ATTEMPTS_PER_IP,
+        )
+    return _login_limiter
@@ -1,5 +1,7 @@
 import os
 import json
+import time
+import asyncio
 import logging
 from typing import Optional
 from datetime import datetime
@@ -9,19 +11,44 @@ from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# 프롬프트(시스템/사용자)를 바꾸면 올릴 것 - AI 분석 캐시 키에 포함 (이전 프롬프트 결과 재사용 방지)
+# 2: 카테고리 "입소비용" → "요금" (AIAnalysisResult 스키마와 일치)
+PROMPT_VERSION = "2"
+
 
 class OpenAIClient:
-    """OpenAI API 클라이언트"""
+    """
+    OpenAI API 클라이언트 (AsyncOpenAI)
+
+    - 호출 대기 중에도 이벤트 루프를 막지 않음 (동기 OpenAI 클라이언트는 응답까지 워커 전체가 멈췄음)
+    - 동시 호출은 OPENAI_MAX_CONCURRENCY로 제한 (초과분은 세마포어 대기)
+    - 슬롯을 잡은 뒤 API 호출(SDK 재시도 포함)을 OPENAI_TIMEOUT 초 deadline으로 제한
+      (세마포어 대기 시간은 제외 - 대기열이 길다고 정상 호출이 폴백 처리되지 않도록)
+    - deadline 초과/에러 시 기존과 같은 폴백 결과
+    """
     
     def __init__(self):
         self.api_key = settings.OPENAI_API_KEY
         self.model = os.getenv("OPENAI_MODEL", "gpt-4o-mini")  # 기본값: gpt-4o-mini (비용 효율적)
         self.timeout = int(os.getenv("OPENAI_TIMEOUT", "30"))
+        self._semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENCY)
+
+        # metrics
+        self.calls_total = 0
+        self.in_flight = 0
+        self.timeouts_total = 0
+        self.errors_total = 0
+        self.last_latency_ms = 0.0
         
         # OpenAI 클라이언트가 설치되어 있는지 확인
         try:
-            from openai import OpenAI
-            self.client = OpenAI(api_key=self.api_key, timeout=self.timeout) if self.api_key else None
+            from openai import AsyncOpenAI
+            self.client = AsyncOpenAI(
+                api_key=self.api_key,
+                base_url=settings.OPENAI_BASE_URL or None,
+                timeout=self.timeout,
+                max_retries=settings.OPENAI_MAX_RETRIES,
+            ) if self.api_key else None
         except ImportError:
             logger.warning("OpenAI package not installed. AI analysis will be disabled.")
             self.client = None
@@ -38,7 +65,7 @@ class OpenAIClient:
 **응답 형식:**
 {
   "summary": "2~3줄의 핵심 요약",
-  "category": "입소 또는 입소비용 또는 면회 또는 의료간호 또는 프로그램 또는 기타 중 하나",
+  "category": "입소 또는 요금 또는 면회 또는 의료간호 또는 프로그램 또는 기타 중 하나",
   "urgency": "HIGH 또는 MEDIUM 또는 LOW 중 하나",
   "next_actions": ["액션1", "액션2", ...],  // 최대 5개
   "red_flags": ["경고사항1", ...]  // 선택적, 긴급한 문제가 있을 경우만
@@ -46,7 +73,7 @@ class OpenAIClient:
 
 **카테고리 가이드:**
 - 입소: 입소 상담, 입소 절차, 입소 가능 여부
-- 입소비용: 비용 문의, 보험 적용, 결제 방법
+- 요금: 입소 비용 문의, 보험 적용, 결제 방법
 - 면회: 면회 시간, 면회 규정, 방문 예약
 - 의료간호: 건강 상태, 의료 서비스, 간호 케어
 - 프로그램: 활동 프로그램, 재활 프로그램
@@ -87,13 +114,15 @@ class OpenAIClient:
     
     async def analyze_contact_inquiry(
         self, 
-        request: ContactAnalysisRequest
+        request: ContactAnalysisRequest,
+        fallback: bool = True,
     ) -> Optional[AIAnalysisResult]:
         """
         상담 내용 분석
         
         Args:
             request: 상담 분석 요청
+            fallback: False면 실패 시 폴백 결과 대신 None (배치 분석 - 다음 실행에서 재시도)
             
         Returns:
             AI 분석 결과 또는 None (API 키 없음/에러)
@@ -103,19 +132,13 @@ class OpenAIClient:
             logger.warning("OpenAI API key not configured. Skipping AI analysis.")
             return None
         
+        started = time.perf_counter()
+        self.calls_total += 1
         try:
             logger.info(f"Analyzing contact inquiry with OpenAI ({self.model})...")
             
             # OpenAI API 호출
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {"role": "system", "content": self._create_system_prompt()},
-                    {"role": "user", "content": self._create_user_prompt(request)}
-                ],
-                temperature=0.3,  # 일관성 있는 분석
-                response_format={"type": "json_object"}  # JSON 모드 강제
-            )
+            response = await self._create_completion(request)
             
             # 응답 파싱
             content = response.choices[0].message.content
@@ -130,13 +153,54 @@ class OpenAIClient:
             logger.info(f"AI analysis completed: category={result.category}, urgency={result.urgency}")
             return result
             
+        except asyncio.TimeoutError:
+            self.timeouts_total += 1
+            logger.error(f"OpenAI API deadline exceeded ({self.timeout}s)")
+            return self._get_fallback_result(request) if fallback else None
+
         except json.JSONDecodeError as e:
+            self.errors_total += 1
             logger.error(f"Failed to parse OpenAI response as JSON: {e}")
-            return self._get_fallback_result(request)
+            return self._get_fallback_result(request) if fallback else None
             
         except Exception as e:
+            self.errors_total += 1
             logger.error(f"OpenAI API error: {e}")
-            return self._get_fallback_result(request)
+            return self._get_fallback_result(request) if fallback else None
+
+        finally:
+            self.last_latency_ms = (time.perf_counter() - started) * 1000
+
+    async def _create_completion(self, request: ContactAnalysisRequest):
+        async with self._semaphore:
+            self.in_flight += 1
+            try:
+                return await asyncio.wait_for(
+                    self.client.chat.completions.create(
+                        model=self.model,
+                        messages=[
+                            {"role": "system", "content": self._create_system_prompt()},
+                            {"role": "user", "content": self._create_user_prompt(request)}
+                        ],
+                        temperature=0.3,  # 일관성 있는 분석
+                        response_format={"type": "json_object"}  # JSON 모드 강제
+                    ),
+                    timeout=self.timeout,
+                )
+            finally:
+                self.in_flight -= 1
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.client is not None,
+            "model": self.model,
+            "max_concurrency": settings.OPENAI_MAX_CONCURRENCY,
+            "in_flight": self.in_flight,
+            "calls_total": self.calls_total,
+            "timeouts_total": self.timeouts_total,
+            "errors_total": self.errors_total,
+            "last_latency_ms": round(self.last_latency_ms, 1),
+        }
 
 
 # 싱글톤 인스턴스
@@ -151,15 +215,21 @@ def get_openai_client() -> OpenAIClient:
     return _openai_client
 
 
-async def analyze_contact_inquiry(request: ContactAnalysisRequest) -> Optional[AIAnalysisResult]:
+def get_fallback_result(request: ContactAnalysisRequest) -> AIAnalysisResult:
+    """분석 실패 시 저장할 폴백 결과 (캐시에는 넣지 않음)"""
+    return get_openai_client()._get_fallback_result(request)
+
+
+async def analyze_contact_inquiry(request: ContactAnalysisRequest, fallback: bool = True) -> Optional[AIAnalysisResult]:
     """
     상담 내용 분석 (편의 함수)
     
     Args:
         request: 상담 분석 요청
+        fallback: False면 실패 시 None
         
     Returns:
         AI 분석 결과 또는 None
     """
     client = get_openai_client()
-    return await client.analyze_contact_inquiry(request)
\ No newline at end of file
+    return await client.analyze_contact_inquiry(request, fallback=fallback)
\ No newline at end of file
@@ -0,0 +1,223 @@
+"""
+Outbox - 트랜잭션 outbox job 등록 / claim / 결과 기록
+
+웹 요청:
+    enqueue(db, JOB_CONTACT_ANALYZE, {"contact_id": row.id})
+    await db.commit()   # 도메인 row와 job이 같은 commit → 둘 다 저장되거나 둘 다 안 됨
+
+워커(app/worker.py):
+    claim_jobs()  : PENDING + run_after 지난 job을 FOR UPDATE SKIP LOCKED로 가져가 RUNNING 표시
+    complete_job(): DONE (+ handler가 돌려준 후속 job 등록을 같은 트랜잭션에서)
+    fail_job()    : 재시도 가능하면 지수 backoff 후 PENDING, 아니면 FAILED
+    recover_stale_jobs(): RUNNING인 채로 오래된 job(워커 크래시) 재대기
+    prune_done_jobs()   : OUTBOX_DONE_RETENTION_DAYS 지난 DONE job 삭제 (메일 job payload의 개인정보 사본 정리)
+
+job 상태 UPDATE는 Table 기준(core) → ORM 캐시 무효화 대상 아님
+"""
+import logging
+import random
+from datetime import timedelta
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import case, cast, delete, func, select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.outbox import OutboxJob, OutboxStatus
+
+logger = logging.getLogger(__name__)
+
+# job 종류
+JOB_CONTACT_ANALYZE = "contact.analyze"
+JOB_CONTACT_ANALYZE_BACKLOG = "contact.analyze_backlog"
+JOB_EMAIL_ADMIN_NEW_CONTACT = "email.admin_new_contact"
+JOB_EMAIL_CUSTOMER_REPLY = "email.customer_reply"
+
+# 후속 job (kind, payload) - handler가 돌려주면 워커가 현재 job DONE과 같은 commit으로 등록
+FollowUp = Tuple[str, Dict[str, Any]]
+
+jobs = OutboxJob.__table__
+
+# ix_outbox_jobs_due partial index 조건과 같은 문자열 (bind 파라미터면 generic plan에서 index 못 씀)
+_IS_PENDING = text("outbox_jobs.status = 'PENDING'")
+
+_LAST_ERROR_MAX = 2000
+
+
+def enqueue(db, kind: str, payload: Dict[str, Any], delay_seconds: int = 0, max_attempts: Optional[int] = None) -> OutboxJob:
+    """
+    job 등록 (commit은 호출 쪽에서 - 도메인 변경과 같은 트랜잭션)
+    Session / AsyncSession 둘 다 사용 가능
+    """
+    job = OutboxJob(
+        kind=kind,
+        payload=payload,
+        status=OutboxStatus.PENDING,
+        attempts=0,
+        max_attempts=max_attempts or settings.OUTBOX_MAX_ATTEMPTS,
+    )
+    if delay_seconds:
+        job.run_after = func.now() + timedelta(seconds=delay_seconds)
+    db.add(job)
+    return job
+
+
+def backoff_seconds(attempts: int) -> float:
+    """attempts번 실패 후 다음 실행까지 대기 (지수 backoff + 최대 20% jitter)"""
+    delay = min(settings.OUTBOX_BACKOFF_BASE_SECONDS * 2 ** max(attempts - 1, 0), settings.OUTBOX_BACKOFF_MAX_SECONDS)
+    return delay * (1 + random.random() * 0.2)
+
+
+async def claim_jobs(db: AsyncSession, worker_id: str, limit: int) -> List[dict]:
+    """실행할 job을 최대 limit개 가져와 RUNNING 표시 (다른 워커가 잡은 row는 건너뜀)"""
+    due = (
+        select(jobs.c.id)
+        .where(_IS_PENDING, jobs.c.run_after <= func.now())
+        .order_by(jobs.c.run_after)
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    stmt = (
+        update(jobs)
+        .where(jobs.c.id.in_(due))
+        .values(
+            status=OutboxStatus.RUNNING,
+            attempts=jobs.c.attempts + 1,
+            locked_at=func.now(),
+            locked_by=worker_id,
+            updated_at=func.now(),
+        )
+        .returning(jobs.c.id, jobs.c.kind, jobs.c.payload, jobs.c.attempts, jobs.c.max_attempts)
+    )
+    rows = (await db.execute(stmt)).mappings().all()
+    await db.commit()
+    return [dict(r) for r in rows]
+
+
+async def complete_job(db: AsyncSession, job: dict, follow_ups: Sequence[FollowUp] = ()) -> bool:
+    """
+    DONE 표시 + 후속 job 등록을 한 트랜잭션으로
+    (그 사이 워커가 죽으면 둘 다 안 됨 → recover 후 재실행돼도 후속 job은 하나)
+    이번 실행이 이미 recover로 넘어갔으면(RUNNING이 아니거나 다시 claim돼 attempts가 다름) 아무것도 안 하고 False
+    """
+    result = await db.execute(
+        update(jobs)
+        .where(
+            jobs.c.id == job["id"],
+            jobs.c.status == OutboxStatus.RUNNING,
+            jobs.c.attempts == job["attempts"],
+        )
+        .values(
+            status=OutboxStatus.DONE,
+            finished_at=func.now(),
+            locked_at=None,
+            locked_by=None,
+            last_error=None,
+            updated_at=func.now(),
+        )
+    )
+    if not result.rowcount:
+        await db.rollback()
+        return False
+    for kind, payload in follow_ups:
+        enqueue(db, kind, payload)
+    await db.commit()
+    return True
+
+
+async def fail_job(db: AsyncSession, job: dict, error: str) -> bool:
+    """실패 기록. 재시도 예약되면 True, 최종 실패(FAILED)면 False"""
+    retry = job["attempts"] < job["max_attempts"]
+    values: Dict[str, Any] = {
+        "last_error": error[:_LAST_ERROR_MAX],
+        "locked_at": None,
+        "locked_by": None,
+        "updated_at": func.now(),
+    }
+    if retry:
+        values["status"] = OutboxStatus.PENDING
+        values["run_after"] = func.now() + timedelta(seconds=backoff_seconds(job["attempts"]))
+    else:
+        values["status"] = OutboxStatus.FAILED
+        values["finished_at"] = func.now()
+    await db.execute(update(jobs).where(jobs.c.id == job["id"]).values(**values))
+    await db.commit()
+    return retry
+
+
+async def recover_stale_jobs(db: AsyncSession) -> int:
+    """RUNNING으로 OUTBOX_LOCK_TIMEOUT_SECONDS 넘게 남은 job → 재대기 (시도 횟수 다 썼으면 FAILED)"""
+    stale_before = func.now() - timedelta(seconds=settings.OUTBOX_LOCK_TIMEOUT_SECONDS)
+    result = await db.execute(
+        update(jobs)
+        .where(jobs.c.status == OutboxStatus.RUNNING, jobs.c.locked_at < stale_before)
+        .values(
+            # CASE 결과가 text로 추론되지 않도록 enum 타입으로 cast
+            status=cast(
+                case((jobs.c.attempts >= jobs.c.max_attempts, OutboxStatus.FAILED.value), else_=OutboxStatus.PENDING.value),
+                jobs.c.status.type,
+            ),
+            last_error="worker lock timeout",
+            locked_at=None,
+            locked_by=None,
+            updated_at=func.now(),
+        )
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def prune_done_jobs(db: AsyncSession) -> int:
+    """완료 후 OUTBOX_DONE_RETENTION_DAYS 지난 DONE job 삭제"""
+    result = await db.execute(
+        delete(jobs).where(
+            jobs.c.status == OutboxStatus.DONE,
+            jobs.c.finished_at < func.now() - timedelta(days=settings.OUTBOX_DONE_RETENTION_DAYS),
+        )
+    )
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def retry_job(db: AsyncSession, job_id: str) -> bool:
+    """FAILED(또는 대기 중) job을 즉시 다시 실행 대기로 (시도 횟수 초기화)"""
+    result = await db.execute(
+        update(jobs)
+        .where(jobs.c.id == job_id, jobs.c.status.in_([OutboxStatus.FAILED, OutboxStatus.PENDING]))
+        .values(
+            status=OutboxStatus.PENDING,
+            attempts=0,
+            run_after=func.now(),
+            finished_at=None,
+            updated_at=func.now(),
+        )
+    )
+    await db.commit()
+    return bool(result.rowcount)
+
+
+async def job_stats(db: AsyncSession) -> dict:
+    """kind/status별 개수 + 가장 오래 기다린 PENDING job 대기 시간(초)"""
+    rows = (
+        await db.execute(
+            select(jobs.c.kind, jobs.c.status, func.count()).group_by(jobs.c.kind, jobs.c.status)
+        )
+    ).all()
+    by_kind: Dict[str, Dict[str, int]] = {}
+    totals = {s.value: 0 for s in OutboxStatus}
+    for kind, status, count in rows:
+        status = status.value if isinstance(status, OutboxStatus) else status
+        by_kind.setdefault(kind, {})[status] = count
+        totals[status] += count
+
+    oldest_wait = await db.scalar(
+        select(func.extract("epoch", func.now() - func.min(jobs.c.run_after))).where(
+            _IS_PENDING, jobs.c.run_after <= func.now()
+        )
+    )
+    return {
+        "totals": totals,
+        "by_kind": by_kind,
+        "oldest_pending_seconds": round(float(oldest_wait), 1) if oldest_wait is not None else None,
+    }
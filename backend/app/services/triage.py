@@ -0,0 +1,147 @@
+"""
+Triage - 상담문의 규칙 기반 1차 분류 (카테고리 / 긴급도)
+
+OpenAI 분석은 워커에서 수 초 뒤(또는 API 키가 없으면 영영) 채워지므로
+접수 시점(submit_contact_form)에 키워드/정규식 점수로 임시 ai_category / ai_urgency를 먼저 넣는다.
+- 외부 의존성 없음, 문의 1건 수십 µs (scripts/bench_triage.py)
+- ai_model = TRIAGE_MODEL 로 표시 → LLM 결과가 오면 덮어씀
+  (LLM이 실패해 폴백 결과가 저장될 때는 triage 카테고리/긴급도를 유지)
+
+카테고리/긴급도 기준은 OpenAIClient._create_system_prompt 가이드와 같게 유지할 것.
+"""
+import re
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+TRIAGE_MODEL = "rules"
+
+CATEGORIES = ("입소", "요금", "면회", "의료간호", "프로그램", "기타")
+
+# 긴 본문은 앞부분만 봄 (핵심 내용은 대부분 앞에 있음, 최악 지연 제한)
+_MAX_SCAN_CHARS = 2000
+# 같은 규칙이 여러 번 나오면 최대 이 횟수까지 가중 (예: "콧줄 ... 석션")
+_MAX_HITS_PER_RULE = 2
+
+# 문의 유형(폼 선택값) → 카테고리 사전 점수
+_INQUIRY_TYPE_PRIOR: Dict[str, Tuple[str, float]] = {
+    "입소상담": ("입소", 1.5),
+    "비용문의": ("요금", 1.5),
+    "시설견학": ("면회", 1.5),
+    "프로그램문의": ("프로그램", 1.5),
+}
+
+# 카테고리별 (패턴, 가중치)
+_CATEGORY_RULES: Dict[str, Tuple[Tuple[str, float], ...]] = {
+    "입소": (
+        (r"입소", 1.0),
+        (r"입원|모시(고|려)|모셔", 1.0),
+        (r"대기|빈\s*(자리|방|침대)|자리\s*(있|나)", 1.0),
+        (r"(장기요양|요양)\s*등급|등급\s*(판정|받)", 1.0),
+        (r"절차|서류|준비물|계약", 0.5),
+    ),
+    "요금": (
+        (r"비용|요금|금액|가격|얼마", 1.5),
+        (r"본인\s*부담|부담금|감경|비급여|식대|간식비", 1.5),
+        (r"결제|납부|카드|계좌|영수증|환불|청구", 1.5),
+        (r"보험|급여|수급|기초생활", 0.5),
+    ),
+    "면회": (
+        (r"면회", 2.0),
+        (r"방문|찾아\s*뵙|뵈러|외출|외박", 1.0),
+        (r"견학|둘러\s*보|구경", 1.0),
+    ),
+    "의료간호": (
+        (r"간호|의료|진료|촉탁의|병원|약\s*(복용|처방)|투약", 1.5),
+        (r"치매|파킨슨|당뇨|혈압|뇌졸중|중풍|욕창|콧줄|석션|소변줄|기저귀|인슐린", 1.5),
+        (r"건강|아프|통증|열이|기침|식사\S*\s*(잘\s*)?(못|안)|삼키", 1.0),
+        (r"낙상|넘어지|쓰러|다치|상처|멍", 1.5),
+    ),
+    "프로그램": (
+        (r"프로그램|(?<!봉사)활동|여가|레크|레크리에이션", 2.0),
+        (r"재활|물리\s*치료|운동|인지\s*(훈련|활동)", 1.0),
+        (r"미술|음악|노래|원예|공예|체조|나들이", 1.0),
+    ),
+}
+
+# 긴급도 신호
+_HIGH_RULES = (
+    (r"응급|위급|위독|119|구급", 3.0),
+    (r"쓰러|의식\s*(이\s*)?(없|잃)|숨\s*(을\s*)?(못|가쁘)|호흡\s*곤란|피\s*를?\s*(흘|토)|골절", 3.0),
+    (r"학대|폭행|폭언|방치|사망|돌아가", 3.0),
+    (r"낙상|넘어지|다치|욕창", 1.5),
+    (r"급(합니다|해요|하게|히)|긴급", 1.5),
+    (r"당장|즉시|오늘\s*(중|안)|빨리|바로", 1.5),
+    (r"항의|민원|신고|고소|소송", 3.0),
+    (r"화가|불만|실망|어이없|불친절", 1.5),
+    (r"책임(자|지)", 1.5),
+)
+# 구체적 요청/상담 (프롬프트 가이드의 MEDIUM: 일반 상담, 구체적 문의)
+_MEDIUM_RULES = (
+    r"부탁|주세요|주십시오|바랍니다|요청|신청|예약",
+    r"상담\s*(을\s*)?(받|가능|원|드리)",
+    r"입소\S*\s*(가능|하려|시키|희망|예정|해야|하고\s*싶)",
+    r"연락|회신|전화",
+    r"비용|얼마|금액",
+    r"자리\s*(있|나)|대기",
+    r"(관리|케어|돌봄)\S*\s*(가능|되)",
+    r"필요합니다|필요해요|걱정|하려고|모시려",
+)
+# 요청 없는 단순 질문 (LOW: 정보성 문의, 일반적인 질문)
+_LOW_RULES = (
+    r"\?|나요|까요|궁금|알고\s*싶|여쭤|문의\s*드(립|려)",
+)
+
+_HIGH_THRESHOLD = 3.0
+
+
+def _compile_weighted(rules):
+    return tuple((re.compile(pattern), weight) for pattern, weight in rules)
+
+
+_CATEGORY_PATTERNS = {category: _compile_weighted(rules) for category, rules in _CATEGORY_RULES.items()}
+_HIGH_PATTERNS = _compile_weighted(_HIGH_RULES)
+_MEDIUM_PATTERN = re.compile("|".join(f"(?:{p})" for p in _MEDIUM_RULES))
+_LOW_PATTERN = re.compile("|".join(f"(?:{p})" for p in _LOW_RULES))
+
+
+@dataclass(frozen=True)
+class TriageResult:
+    category: str
+    urgency: str            # HIGH / MEDIUM / LOW
+    confidence: float       # 1위 카테고리 점수 비중 (0~1, 참고용)
+
+
+def classify(inquiry_type: Optional[str], message: Optional[str]) -> TriageResult:
+    """문의 유형 + 내용 → 임시 카테고리/긴급도"""
+    text = (message or "")[:_MAX_SCAN_CHARS]
+
+    scores = {category: 0.0 for category in _CATEGORY_PATTERNS}
+    prior = _INQUIRY_TYPE_PRIOR.get((inquiry_type or "").replace(" ", ""))
+    if prior:
+        scores[prior[0]] += prior[1]
+    for category, patterns in _CATEGORY_PATTERNS.items():
+        for pattern, weight in patterns:
+            hits = 0
+            for _ in pattern.finditer(text):
+                hits += 1
+                if hits == _MAX_HITS_PER_RULE:
+                    break
+            scores[category] += weight * hits
+
+    category, best = max(scores.items(), key=lambda item: item[1])
+    total = sum(scores.values())
+    if best <= 0:
+        category = "기타"
+    confidence = round(best / total, 2) if total else 0.0
+
+    high = sum(weight for pattern, weight in _HIGH_PATTERNS if pattern.search(text))
+    if high >= _HIGH_THRESHOLD:
+        urgency = "HIGH"
+    elif _MEDIUM_PATTERN.search(text):
+        urgency = "MEDIUM"
+    elif _LOW_PATTERN.search(text) and high == 0:
+        urgency = "LOW"
+    else:
+        urgency = "MEDIUM"
+
+    return TriageResult(category=category, urgency=urgency, confidence=confidence)
@@ -0,0 +1,285 @@
+"""
+View Counter - history 조회수 버퍼링 + 주기적 일괄 반영
+
+GET 요청마다 `view_count + 1` → commit → refresh 하던 것을
+history id별 증가분(delta)만 버퍼에 쌓고, 백그라운드 루프가
+VIEW_COUNT_FLUSH_INTERVAL_MS 마다 UPDATE 한 번으로 반영한다.
+
+    UPDATE history SET view_count = view_count + v.delta
+    FROM (VALUES (:id, :delta), ...) AS v(id, delta)
+    WHERE history.id = v.id
+
+- 원자적 증가(view_count + delta)라 동시 요청에도 카운트가 유실되지 않음
+- GET 경로는 순수 read (응답 캐시 가능). 화면의 조회수는 최대 flush 주기만큼 늦게 반영됨
+
+VIEW_COUNTER_BACKEND:
+- "memory": 프로세스 로컬 dict (워커별로 따로 모아서 각자 flush - 합산은 DB가 함)
+- "redis" : Redis hash HINCRBY - 워커 재시작/크래시에도 버퍼 유지
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+from sqlalchemy import Integer, String, column, update, values
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.history import History
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryViewBuffer:
+    """프로세스 로컬 증가분 버퍼"""
+
+    def __init__(self):
+        self._pending: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    async def incr(self, key: str, n: int = 1) -> None:
+        with self._lock:
+            self._pending[key] = self._pending.get(key, 0) + n
+
+    async def drain(self) -> Dict[str, int]:
+        with self._lock:
+            pending, self._pending = self._pending, {}
+        return pending
+
+    async def ack(self) -> None:
+        """DB 반영 완료 (drain 때 이미 비웠으므로 할 일 없음)"""
+
+    async def restore(self, deltas: Dict[str, int]) -> None:
+        """flush 실패 시 다음 주기에 다시 반영되도록 되돌림"""
+        with self._lock:
+            for key, n in deltas.items():
+                self._pending[key] = self._pending.get(key, 0) + n
+
+    async def size(self) -> int:
+        return len(self._pending)
+
+
+class RedisViewBuffer:
+    """
+    Redis hash 증가분 버퍼
+    drain은 RENAME으로 hash를 통째로 작업 키(views:history:flushing)로 떼어낸 뒤 읽음
+    → 그 사이 들어온 HINCRBY는 새 hash로 감
+
+    - 작업 키 이름은 고정 + 락(SET NX EX)을 잡은 워커만 flush
+      → 어느 워커/프로세스가 죽어도 락이 만료되면 다음 워커가 남은 작업 키를 이어서 처리
+    - 작업 키는 DB UPDATE commit 후(ack)에만 삭제, 실패하면 그대로 두고 다음 주기에 재시도
+      (commit 직후 ack 전에 죽으면 그 배치가 한 번 더 더해질 수 있음 - 유실보다 과대 집계 쪽을 택함)
+    """
+
+    # flush 1회(UPDATE 포함) 최대 소요 시간보다 충분히 길게
+    lock_ttl = 60
+
+    def __init__(self, redis, key: str = "views:history"):
+        self.redis = redis
+        self.key = key
+        self.flushing_key = f"{key}:flushing"
+        self.lock_key = f"{key}:flushing:lock"
+        self._token = f"{os.getpid()}:{id(self)}"
+        self._legacy_checked = False
+
+    async def incr(self, key: str, n: int = 1) -> None:
+        await self.redis.hincrby(self.key, key, n)
+
+    async def drain(self) -> Dict[str, int]:
+        if not await self.redis.set(self.lock_key, self._token, nx=True, ex=self.lock_ttl):
+            return {}  # 다른 워커가 flush 중
+        if not self._legacy_checked:
+            await self._adopt_legacy_keys()
+            self._legacy_checked = True
+        # 이전 flush가 ack 전에 죽었거나 실패했으면 남은 작업 키부터 처리
+        if not await self.redis.exists(self.flushing_key):
+            try:
+                await self.redis.rename(self.key, self.flushing_key)
+            except Exception:
+                # 키가 없으면(증가분 없음) ResponseError
+                await self._unlock()
+                return {}
+        raw = await self.redis.hgetall(self.flushing_key)
+        if not raw:
+            await self._unlock()
+        return {k: int(v) for k, v in raw.items()}
+
+    async def _adopt_legacy_keys(self) -> None:
+        """이전 버전의 워커별 작업 키(views:history:flushing:{pid})가 남아 있으면 본 hash로 합침"""
+        async for legacy in self.redis.scan_iter(match=f"{self.flushing_key}:*", count=100):
+            if legacy == self.lock_key:
+                continue
+            raw = await self.redis.hgetall(legacy)
+            pipe = self.redis.pipeline(transaction=True)
+            for key, n in raw.items():
+                pipe.hincrby(self.key, key, int(n))
+            pipe.delete(legacy)
+            await pipe.execute()
+            logger.warning(f"[ViewCounter] adopted orphaned flush key {legacy} ({len(raw)} posts)")
+
+    async def ack(self) -> None:
+        """DB 반영 완료 → 작업 키 삭제 + 락 해제"""
+        await self.redis.delete(self.flushing_key)
+        await self._unlock()
+
+    async def restore(self, deltas: Dict[str, int]) -> None:
+        """DB 반영 실패 → 작업 키는 그대로 두고 락만 해제 (다음 주기에 같은 증가분 재시도)"""
+        await self._unlock()
+
+    async def _unlock(self) -> None:
+        if await self.redis.get(self.lock_key) == self._token:
+            await self.redis.delete(self.lock_key)
+
+    async def size(self) -> int:
+        return await self.redis.hlen(self.key)
+
+
+class ViewCounter:
+    """history 조회수 증가분 버퍼 + flush 루프"""
+
+    def __init__(self, buffer, flush_interval_ms: int = 5000):
+        self.buffer = buffer
+        self.flush_interval = flush_interval_ms / 1000
+        self._task: Optional[asyncio.Task] = None
+        self._stopping: Optional[asyncio.Event] = None
+
+        # metrics
+        self.recorded_total = 0
+        self.flushed_total = 0
+        self.flush_count = 0
+        self.failed_count = 0
+        self.last_flush_ms = 0.0
+
+    # -------------------------
+    # lifecycle
+    # -------------------------
+    def start(self) -> None:
+        if self._task is not None:
+            return
+        self._stopping = asyncio.Event()
+        self._task = asyncio.create_task(self._run(), name="view-counter")
+        logger.info(f"[ViewCounter] started (interval={self.flush_interval}s)")
+
+    async def stop(self) -> None:
+        """루프 종료 + 남은 증가분 flush"""
+        if self._task is None:
+            return
+        self._stopping.set()
+        await self._task
+        self._task = None
+        await self.flush()
+        logger.info(f"[ViewCounter] stopped (flushed_total={self.flushed_total})")
+
+    async def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                await asyncio.wait_for(self._stopping.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            if not self._stopping.is_set():
+                await self.flush()
+
+    # -------------------------
+    # record / flush
+    # -------------------------
+    async def record(self, history_id: str) -> None:
+        """조회 1회 기록 (실패해도 조회 자체는 막지 않음)"""
+        try:
+            await self.buffer.incr(history_id)
+            self.recorded_total += 1
+        except Exception as e:
+            logger.warning(f"[ViewCounter] record failed: id={history_id}, err={e}")
+
+    async def flush(self) -> int:
+        try:
+            deltas = await self.buffer.drain()
+        except Exception as e:
+            logger.warning(f"[ViewCounter] drain failed: {e}")
+            return 0
+        if not deltas:
+            return 0
+
+        started = time.perf_counter()
+        try:
+            await asyncio.to_thread(self._write, deltas)
+        except Exception as e:
+            self.failed_count += 1
+            logger.exception(f"[ViewCounter] flush failed ({len(deltas)} posts): {e}")
+            try:
+                await self.buffer.restore(deltas)
+            except Exception as restore_err:
+                logger.error(f"[ViewCounter] restore failed, views lost: {deltas} ({restore_err})")
+            return 0
+
+        try:
+            await self.buffer.ack()
+        except Exception as e:
+            # 작업 키가 남으면 락 만료 후 같은 증가분이 한 번 더 반영될 수 있음
+            logger.error(f"[ViewCounter] ack failed after flush: {e}")
+
+        n = sum(deltas.values())
+        self.flushed_total += n
+        self.flush_count += 1
+        self.last_flush_ms = (time.perf_counter() - started) * 1000
+        return n
+
+    @staticmethod
+    def _write(deltas: Dict[str, int]) -> None:
+        table = History.__table__
+        v = values(column("id", String), column("delta", Integer), name="v").data(sorted(deltas.items()))
+        # ✅ ORM 엔티티가 아닌 Table 기준 UPDATE → 응답 캐시(public.history) 무효화 대상 아님
+        #    (조회수 때문에 목록 캐시가 매 주기 날아가지 않도록. 조회수는 캐시 TTL만큼 늦게 보임)
+        stmt = (
+            update(table)
+            .where(table.c.id == v.c.id)
+            # updated_at onupdate 자동 갱신 방지 (조회는 글 수정이 아님)
+            .values(view_count=table.c.view_count + v.c.delta, updated_at=table.c.updated_at)
+        )
+        db = SessionLocal()
+        try:
+            db.execute(stmt)
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    # -------------------------
+    # metrics
+    # -------------------------
+    async def metrics(self) -> dict:
+        try:
+            pending = await self.buffer.size()
+        except Exception:
+            pending = None
+        return {
+            "backend": type(self.buffer).__name__,
+            "running": self._task is not None,
+            "pending_posts": pending,
+            "recorded_total": self.recorded_total,
+            "flushed_total": self.flushed_total,
+            "flush_count": self.flush_count,
+            "failed_count": self.failed_count,
+            "last_flush_ms": round(self.last_flush_ms, 2),
+        }
+
+
+# 싱글톤 인스턴스
+_view_counter: Optional[ViewCounter] = None
+
+
+def get_view_counter() -> ViewCounter:
+    """설정된 백엔드의 ViewCounter 인스턴스 가져오기"""
+    global _view_counter
+    if _view_counter is None:
+        if settings.VIEW_COUNTER_BACKEND == "redis":
+            from app.core.redis import get_redis
+
+            buffer = RedisViewBuffer(get_redis())
+        else:
+            buffer = MemoryViewBuffer()
+        _view_counter = ViewCounter(buffer, flush_interval_ms=settings.VIEW_COUNT_FLUSH_INTERVAL_MS)
+    return _view_counter
@@ -0,0 +1,222 @@
+"""
+Outbox Worker - outbox_jobs 처리 프로세스
+
+    python -m app.worker
+
+- claim: SELECT ... FOR UPDATE SKIP LOCKED (워커 여러 개를 띄워도 같은 job을 두 번 잡지 않음)
+- 동시 실행 OUTBOX_WORKER_CONCURRENCY개, job마다 OUTBOX_JOB_TIMEOUT_SECONDS 제한
+- 실패 시 지수 backoff 후 재시도, max_attempts 넘으면 FAILED (관리자 API에서 재시도)
+  FAILED가 되는 순간 FAILURE_HANDLERS의 kind별 후처리 실행 (예: AI 분석 폴백 저장)
+- SIGTERM/SIGINT: 새 job은 안 가져오고 실행 중인 job은 끝까지 처리 후 종료
+- 주기 정리: 멈춘 job 재대기(1분), 보관 기간 지난 DONE job 삭제 / AI 분석 캐시 TTL·LRU 정리(1시간)
+"""
+import asyncio
+import logging
+import os
+import signal
+import socket
+import sys
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Set
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine
+from app.core.redis import close_redis
+from app.services import ai_cache, outbox
+from app.services.contact_analysis import analyze_and_save_contact, analyze_backlog_job, save_fallback_analysis
+from app.services.email_service import notify_admins_new_contact, send_customer_reply
+
+logger = logging.getLogger("app.worker")
+
+Handler = Callable[[dict], Awaitable[Optional[List[outbox.FollowUp]]]]
+
+# job kind → 실행 함수 (payload dict를 받음, 후속 job 목록을 돌려주면 DONE과 같은 트랜잭션으로 등록)
+HANDLERS: Dict[str, Handler] = {
+    outbox.JOB_CONTACT_ANALYZE: lambda p: analyze_and_save_contact(p["contact_id"]),
+    outbox.JOB_CONTACT_ANALYZE_BACKLOG: analyze_backlog_job,
+    outbox.JOB_EMAIL_ADMIN_NEW_CONTACT: lambda p: notify_admins_new_contact(p["contact"]),
+    outbox.JOB_EMAIL_CUSTOMER_REPLY: lambda p: send_customer_reply(p["contact"], p["reply"]),
+}
+
+# job kind → 최종 실패(FAILED) 시 후처리 (payload dict를 받음)
+FAILURE_HANDLERS: Dict[str, Handler] = {
+    outbox.JOB_CONTACT_ANALYZE: lambda p: save_fallback_analysis(p["contact_id"]),
+}
+
+# RUNNING인 채 멈춘 job 정리 주기(초)
+RECOVER_INTERVAL = 60
+# 오래된 DONE job / ai_analysis_cache 만료·LRU 초과분 정리 주기(초)
+PRUNE_INTERVAL = 3600
+
+
+class OutboxWorker:
+    def __init__(
+        self,
+        handlers: Dict[str, Handler],
+        failure_handlers: Optional[Dict[str, Handler]] = None,
+        concurrency: int = 4,
+        poll_interval_ms: int = 1000,
+        job_timeout: float = 120,
+    ):
+        self.handlers = handlers
+        self.failure_handlers = failure_handlers or {}
+        self.concurrency = concurrency
+        self.poll_interval = poll_interval_ms / 1000
+        self.job_timeout = job_timeout
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._tasks: Set[asyncio.Task] = set()
+        self._stopping = asyncio.Event()
+        self._last_recover = 0.0
+        self._last_prune = 0.0
+
+        # metrics
+        self.done_total = 0
+        self.retried_total = 0
+        self.failed_total = 0
+
+    def stop(self) -> None:
+        logger.info(f"[Worker] stopping (in-flight={len(self._tasks)})")
+        self._stopping.set()
+
+    async def run(self) -> None:
+        logger.info(f"[Worker] started id={self.worker_id} concurrency={self.concurrency}")
+        while not self._stopping.is_set():
+            await self._maybe_recover()
+            await self._maybe_prune()
+
+            free = self.concurrency - len(self._tasks)
+            if free <= 0:
+                # 슬롯이 빌 때까지 대기
+                await asyncio.wait(self._tasks, return_when=asyncio.FIRST_COMPLETED)
+                continue
+
+            try:
+                async with AsyncSessionLocal() as db:
+                    claimed = await outbox.claim_jobs(db, self.worker_id, free)
+            except Exception as e:
+                logger.exception(f"[Worker] claim failed: {e}")
+                claimed = []
+
+            for job in claimed:
+                task = asyncio.create_task(self._execute(job), name=f"outbox-{job['kind']}-{job['id']}")
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+
+            if len(claimed) < free:
+                # 대기 job이 더 없음 → poll 간격만큼 쉼 (stop 신호 오면 바로 깸)
+                try:
+                    await asyncio.wait_for(self._stopping.wait(), timeout=self.poll_interval)
+                except asyncio.TimeoutError:
+                    pass
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        logger.info(
+            f"[Worker] stopped (done={self.done_total}, retried={self.retried_total}, failed={self.failed_total})"
+        )
+
+    async def _on_failed(self, job: dict) -> None:
+        on_failed = self.failure_handlers.get(job["kind"])
+        if on_failed is None:
+            return
+        try:
+            await asyncio.wait_for(on_failed(job["payload"]), timeout=self.job_timeout)
+        except Exception as e:
+            logger.exception(f"[Worker] failure handler failed: id={job['id']} err={e}")
+
+    async def _maybe_recover(self) -> None:
+        now = time.monotonic()
+        if now - self._last_recover < RECOVER_INTERVAL:
+            return
+        self._last_recover = now
+        try:
+            async with AsyncSessionLocal() as db:
+                recovered = await outbox.recover_stale_jobs(db)
+            if recovered:
+                logger.warning(f"[Worker] recovered {recovered} stale job(s)")
+        except Exception as e:
+            logger.exception(f"[Worker] recover failed: {e}")
+
+    async def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        try:
+            async with AsyncSessionLocal() as db:
+                removed = await outbox.prune_done_jobs(db)
+            if removed:
+                logger.info(f"[Worker] pruned {removed} done job(s)")
+        except Exception as e:
+            logger.exception(f"[Worker] done job prune failed: {e}")
+        try:
+            async with AsyncSessionLocal() as db:
+                removed = await ai_cache.prune(db)
+            if removed:
+                logger.info(f"[Worker] pruned {removed} AI cache entr(ies)")
+        except Exception as e:
+            logger.exception(f"[Worker] AI cache prune failed: {e}")
+
+    async def _execute(self, job: dict) -> None:
+        started = time.perf_counter()
+        handler: Optional[Handler] = self.handlers.get(job["kind"])
+        try:
+            if handler is None:
+                raise LookupError(f"no handler for job kind '{job['kind']}'")
+            follow_ups = await asyncio.wait_for(handler(job["payload"]), timeout=self.job_timeout)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            try:
+                async with AsyncSessionLocal() as db:
+                    retry = await outbox.fail_job(db, job, error)
+            except Exception as db_err:
+                # 상태 기록 실패 → RUNNING으로 남고 lock timeout 후 recover에서 재대기
+                logger.exception(f"[Worker] fail_job failed: id={job['id']} err={db_err}")
+                return
+            if retry:
+                self.retried_total += 1
+                logger.warning(f"[Worker] {job['kind']} failed, will retry: id={job['id']} attempt={job['attempts']} err={error}")
+            else:
+                self.failed_total += 1
+                logger.error(f"[Worker] {job['kind']} failed permanently: id={job['id']} err={error}")
+                await self._on_failed(job)
+            return
+
+        try:
+            async with AsyncSessionLocal() as db:
+                completed = await outbox.complete_job(db, job, follow_ups or ())
+        except Exception as e:
+            logger.exception(f"[Worker] complete_job failed: id={job['id']} err={e}")
+            return
+        if not completed:
+            logger.warning(f"[Worker] {job['kind']} finished after its lock was recovered, result ignored: id={job['id']}")
+            return
+        self.done_total += 1
+        logger.info(f"[Worker] {job['kind']} done: id={job['id']} ({(time.perf_counter() - started) * 1000:.0f}ms)")
+
+
+async def main() -> None:
+    worker = OutboxWorker(
+        HANDLERS,
+        failure_handlers=FAILURE_HANDLERS,
+        concurrency=settings.OUTBOX_WORKER_CONCURRENCY,
+        poll_interval_ms=settings.OUTBOX_POLL_INTERVAL_MS,
+        job_timeout=settings.OUTBOX_JOB_TIMEOUT_SECONDS,
+    )
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGTERM, signal.SIGINT):
+        loop.add_signal_handler(sig, worker.stop)
+    try:
+        await worker.run()
+    finally:
+        await close_redis()
+        await async_engine.dispose()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        handlers=[logging.StreamHandler(sys.stdout)],
+    )
+    asyncio.run(main())
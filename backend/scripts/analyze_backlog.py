@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+AI 분석 안 된 상담문의(ai_summary IS NULL 또는 ai_model="fallback") 일괄 분석
+
+과거 문의 import 후 / OpenAI 장애 복구 후 실행.
+페이지마다 진행률과 처리량을 출력하고, 중단되면 마지막 cursor로 이어서 실행할 수 있음.
+(cursor 없이 다시 실행해도 이미 분석된 건은 대상에서 빠짐)
+
+    python scripts/analyze_backlog.py --batch-size 20
+    python scripts/analyze_backlog.py --limit 200 --after <마지막 cursor>
+
+워커에서 돌리려면 관리자 API: POST /api/v1/contacts/ai-backlog
+"""
+import argparse
+import asyncio
+import sys
+
+sys.path.append('/app')
+
+from app.core.config import settings
+from app.core.database import AsyncSessionLocal, async_engine
+from app.services.contact_analysis import analyze_backlog, count_unanalyzed
+
+
+async def run(args) -> int:
+    async with AsyncSessionLocal() as db:
+        total = await count_unanalyzed(db)
+    target = min(total, args.limit) if args.limit else total
+    print(f"unanalyzed={total}, target={target}, batch={args.batch_size}, concurrency={settings.OPENAI_MAX_CONCURRENCY}")
+    if not target:
+        return 0
+
+    def on_batch(progress: dict) -> None:
+        pct = progress["processed"] / target * 100
+        print(
+            f"  {progress['processed']}/{target} ({pct:.0f}%) analyzed={progress['analyzed']} "
+            f"failed={progress['failed']} {progress['per_second']}/s cursor={progress['cursor']}",
+            flush=True,
+        )
+
+    try:
+        result = await analyze_backlog(
+            batch_size=args.batch_size,
+            max_contacts=args.limit,
+            cursor=args.after,
+            on_batch=on_batch,
+        )
+    finally:
+        await async_engine.dispose()
+
+    print(
+        f"✅ processed={result['processed']} analyzed={result['analyzed']} failed={result['failed']} "
+        f"in {result['elapsed_seconds']}s ({result['per_second']}/s)"
+    )
+    if result["aborted"]:
+        print(f"⚠️  a whole batch failed (OpenAI down?) - resume with --after {result['cursor']}")
+        return 1
+    if result["has_more"]:
+        print(f"more remaining - resume with --after {result['cursor']}")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyze contacts without AI analysis")
+    parser.add_argument("--batch-size", type=int, default=settings.AI_BACKLOG_BATCH_SIZE, help="페이지 크기 (= bulk UPDATE 1회)")
+    parser.add_argument("--limit", type=int, default=None, help="이번 실행 최대 처리 건수")
+    parser.add_argument("--after", default=None, help="이 id 다음부터 (이전 실행의 cursor)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(run(args)))
+
+
+if __name__ == "__main__":
+    main()
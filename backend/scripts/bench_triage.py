@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+규칙 기반 triage(app/services/triage.py) 정확도 / 지연 측정
+
+라벨은 OpenAI 시스템 프롬프트의 카테고리/긴급도 가이드 기준으로 사람이 붙인 것.
+- FIXTURE : 규칙을 만들 때 보면서 맞춘 세트 (회귀 확인용 - 여기 정확도는 낙관적)
+- HOLDOUT : 규칙 조정에 쓰지 않은 세트 (실제 기대 정확도에 가까움, 규칙을 고칠 때 이걸 보고 맞추지 말 것)
+
+    python scripts/bench_triage.py            # 정확도 + 오분류 목록 + 지연
+    python scripts/bench_triage.py -n 20000   # 지연 측정 반복 수
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+from collections import Counter
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from app.services.triage import classify
+
+# (문의 유형, 문의 내용, 카테고리, 긴급도)
+FIXTURE = [
+    ("입소상담", "어머니 입소 절차가 궁금합니다. 필요한 서류가 무엇인지 알려주세요.", "입소", "MEDIUM"),
+    ("입소상담", "아버지가 장기요양 3등급 받으셨는데 입소 가능한지 상담 받고 싶습니다.", "입소", "MEDIUM"),
+    ("입소상담", "현재 빈 자리 있나요? 대기가 얼마나 걸리는지 알고 싶어요.", "입소", "MEDIUM"),
+    ("입소상담", "다음 달쯤 어머니 모시려고 하는데 연락 부탁드립니다.", "입소", "MEDIUM"),
+    ("입소상담", "치매 초기 어르신도 입소가 가능한지 궁금합니다.", "입소", "MEDIUM"),
+    ("기타", "요양원 입소 시 계약서 작성은 보호자가 꼭 와야 하나요?", "입소", "LOW"),
+    ("입소상담", "병원 퇴원 후 바로 입소해야 합니다. 급하게 자리 있는지 오늘 중 연락 주세요.", "입소", "HIGH"),
+    ("입소상담", "등급 판정 전인데 미리 상담 가능할까요?", "입소", "MEDIUM"),
+    ("비용문의", "입소 비용 문의드립니다.", "요금", "MEDIUM"),
+    ("비용문의", "2등급 본인부담금이 한 달에 얼마인가요?", "요금", "MEDIUM"),
+    ("비용문의", "기초생활수급자 감경 적용되는지 궁금합니다.", "요금", "LOW"),
+    ("비용문의", "식대와 간식비는 별도인가요? 비급여 항목 안내 부탁드립니다.", "요금", "MEDIUM"),
+    ("기타", "이번 달 청구 금액이 지난달과 다른데 확인 부탁드립니다.", "요금", "MEDIUM"),
+    ("기타", "카드 결제도 되나요 아니면 계좌이체만 되나요?", "요금", "LOW"),
+    ("비용문의", "퇴소했는데 환불이 아직 안 됐습니다. 너무 늦어져서 화가 납니다. 당장 처리해 주세요.", "요금", "HIGH"),
+    ("비용문의", "연말정산용 영수증 발급 가능한가요?", "요금", "LOW"),
+    ("시설견학", "이번 주말에 시설 견학 예약하고 싶습니다.", "면회", "MEDIUM"),
+    ("기타", "면회 시간이 어떻게 되나요?", "면회", "LOW"),
+    ("기타", "주말에도 면회 가능한지 궁금해요.", "면회", "LOW"),
+    ("기타", "명절에 어머니 외박이 가능한가요?", "면회", "LOW"),
+    ("시설견학", "입소 전에 한번 둘러보고 싶은데 방문 가능한 시간 알려주세요.", "면회", "MEDIUM"),
+    ("기타", "다음 주 화요일 아버지 면회 예약 신청합니다.", "면회", "MEDIUM"),
+    ("기타", "면회 갔는데 직원분이 불친절하게 응대해서 너무 실망했습니다. 책임자 연락 바랍니다.", "면회", "HIGH"),
+    ("기타", "어머니가 어제부터 열이 나고 기침을 하신다고 들었어요. 병원 진료 받으셨는지 확인 부탁드립니다.", "의료간호", "MEDIUM"),
+    ("기타", "아버지가 방금 쓰러지셨다는 연락을 받았습니다. 지금 상태가 어떤지 즉시 연락 주세요!", "의료간호", "HIGH"),
+    ("기타", "어머니 팔에 멍이 들어 있었습니다. 학대가 의심되니 경위를 설명해 주세요.", "의료간호", "HIGH"),
+    ("기타", "당뇨가 있으신데 인슐린 투약 관리가 가능한가요?", "의료간호", "MEDIUM"),
+    ("입소상담", "콧줄로 식사하시는 분도 입소 가능한가요? 석션도 필요합니다.", "의료간호", "MEDIUM"),
+    ("기타", "욕창이 생겼다고 하는데 치료는 어떻게 하고 있나요? 급합니다.", "의료간호", "HIGH"),
+    ("기타", "촉탁의 진료는 한 달에 몇 번 있나요?", "의료간호", "LOW"),
+    ("기타", "어머니가 낙상하셔서 골절이 의심된다고 합니다. 119 불렀나요?", "의료간호", "HIGH"),
+    ("기타", "요즘 식사를 잘 못 하신다고 하는데 걱정됩니다. 상담 요청드립니다.", "의료간호", "MEDIUM"),
+    ("프로그램문의", "어떤 프로그램이 있는지 궁금합니다.", "프로그램", "LOW"),
+    ("프로그램문의", "인지 활동 프로그램은 일주일에 몇 번 하나요?", "프로그램", "LOW"),
+    ("프로그램문의", "물리치료나 재활 운동도 하나요?", "프로그램", "LOW"),
+    ("기타", "음악 활동이나 미술 시간에 보호자도 참여할 수 있나요?", "프로그램", "LOW"),
+    ("프로그램문의", "아버지가 재활 프로그램을 꼭 받으셔야 해서 상담 신청합니다.", "프로그램", "MEDIUM"),
+    ("기타", "주차 공간이 있나요?", "기타", "LOW"),
+    ("기타", "채용 공고 보고 연락드립니다. 요양보호사 지원하고 싶어요.", "기타", "MEDIUM"),
+    ("기타", "홈페이지 사진 외에 시설 소식은 어디서 볼 수 있나요?", "기타", "LOW"),
+    ("기타", "봉사활동 가능한지 문의드립니다.", "기타", "LOW"),
+    ("기타", "전화 연결이 안 돼서 글 남깁니다. 회신 부탁드립니다.", "기타", "MEDIUM"),
+]
+
+HOLDOUT = [
+    ("입소상담", "할머니께서 거동이 불편하셔서 요양원 알아보고 있습니다. 상담 원합니다.", "입소", "MEDIUM"),
+    ("입소상담", "입소 대기자 명단에 올리려면 어떻게 해야 하나요?", "입소", "MEDIUM"),
+    ("비용문의", "1등급이면 월 비용이 대략 어느 정도인가요?", "요금", "MEDIUM"),
+    ("기타", "장기요양보험 적용 후 실제 내는 금액을 알고 싶습니다.", "요금", "MEDIUM"),
+    ("기타", "면회 올 때 음식 가져가도 되나요?", "면회", "LOW"),
+    ("시설견학", "평일 오후에 견학 가능할까요? 가능한 날짜 알려주세요.", "면회", "MEDIUM"),
+    ("기타", "아버지가 식사 중 사레가 걸려 숨을 못 쉬셨다고 합니다. 지금 괜찮으신지 바로 연락 주세요.", "의료간호", "HIGH"),
+    ("기타", "어머니 혈압약 복용은 누가 챙겨 주시나요?", "의료간호", "LOW"),
+    ("기타", "요즘 아버지가 밤에 잠을 못 주무신다고 하셔서 걱정입니다.", "의료간호", "MEDIUM"),
+    ("프로그램문의", "노래 교실 같은 활동도 있나요?", "프로그램", "LOW"),
+    ("기타", "외부 강사 공연 프로그램 제안드리고 싶습니다. 담당자 연락처 부탁드려요.", "프로그램", "MEDIUM"),
+    ("기타", "어머니 옷이 자꾸 없어집니다. 몇 번을 말씀드렸는데 개선이 안 되네요. 민원 넣겠습니다.", "기타", "HIGH"),
+    ("기타", "택배를 시설로 보내도 되나요?", "기타", "LOW"),
+    ("기타", "어르신 생신 파티를 시설에서 해도 될까요?", "기타", "LOW"),
+]
+
+
+def evaluate(name: str, dataset) -> None:
+    category_ok = urgency_ok = both_ok = 0
+    misses = []
+    confusion = Counter()
+    for inquiry_type, message, category, urgency in dataset:
+        result = classify(inquiry_type, message)
+        c_ok = result.category == category
+        u_ok = result.urgency == urgency
+        category_ok += c_ok
+        urgency_ok += u_ok
+        both_ok += c_ok and u_ok
+        if not c_ok:
+            confusion[(category, result.category)] += 1
+        if not (c_ok and u_ok):
+            misses.append((message, f"{category}/{urgency}", f"{result.category}/{result.urgency}"))
+
+    total = len(dataset)
+    print(f"{name}: {total} labeled inquiries")
+    print(f"  category accuracy : {category_ok / total:.1%} ({category_ok}/{total})")
+    print(f"  urgency accuracy  : {urgency_ok / total:.1%} ({urgency_ok}/{total})")
+    print(f"  both correct      : {both_ok / total:.1%}")
+    if confusion:
+        print("  category confusion (label → predicted):")
+        for (label, predicted), count in confusion.most_common():
+            print(f"    {label} → {predicted}: {count}")
+    if misses:
+        print("  misses (label vs predicted):")
+        for message, label, predicted in misses:
+            print(f"    [{label} vs {predicted}] {message[:50]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Triage accuracy / latency benchmark")
+    parser.add_argument("-n", "--iterations", type=int, default=5000, help="지연 측정 반복 수 (fixture 전체 기준)")
+    args = parser.parse_args()
+
+    evaluate("fixture", FIXTURE)
+    evaluate("holdout", HOLDOUT)
+
+    # 지연 (1건 단위)
+    total = len(FIXTURE)
+    samples = []
+    for _ in range(args.iterations // total or 1):
+        for inquiry_type, message, _, _ in FIXTURE:
+            started = time.perf_counter_ns()
+            classify(inquiry_type, message)
+            samples.append(time.perf_counter_ns() - started)
+    samples.sort()
+    p = lambda q: samples[min(len(samples) - 1, int(len(samples) * q))] / 1000
+    print(f"latency per inquiry ({len(samples)} calls): "
+          f"mean={statistics.fmean(samples) / 1000:.1f}µs p50={p(0.5):.1f}µs p99={p(0.99):.1f}µs max={samples[-1] / 1000:.1f}µs")
+
+    long_message = FIXTURE[0][1] * 500
+    started = time.perf_counter_ns()
+    classify("입소상담", long_message)
+    print(f"long message ({len(long_message)} chars, scan capped): {(time.perf_counter_ns() - started) / 1000:.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""
+click_events 파티션 유지보수 (cron 등으로 하루 1회 실행 권장)
+
+    python scripts/click_partitions.py                 # 미래 파티션 생성 + 보관기간 지난 파티션 DROP
+    python scripts/click_partitions.py --archive       # DROP 대신 click_archive 스키마로 이동
+    python scripts/click_partitions.py --dry-run       # 정리 대상만 출력
+"""
+import argparse
+import sys
+
+sys.path.append('/app')
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.services.click_partitions import ensure_partitions, prune_partitions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Maintain click_events partitions")
+    parser.add_argument("--ahead", type=int, default=settings.CLICK_PARTITIONS_AHEAD, help="미리 만들 개월 수")
+    parser.add_argument("--retention-days", type=int, default=settings.CLICK_EVENTS_RETENTION_DAYS, help="원본 보관 일수")
+    parser.add_argument("--archive", action="store_true", default=settings.CLICK_PARTITIONS_ARCHIVE, help="DROP 대신 archive 스키마로 이동")
+    parser.add_argument("--dry-run", action="store_true", help="변경 없이 대상만 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        created = [] if args.dry_run else ensure_partitions(db, args.ahead)
+        pruned = prune_partitions(db, args.retention_days, archive=args.archive, dry_run=args.dry_run)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    print(f"✅ created: {', '.join(created) or '-'}")
+    action = "would prune" if args.dry_run else ("archived" if args.archive else "dropped")
+    print(f"✅ {action}: {', '.join(pruned) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,7 +4,7 @@ import sys
 
 sys.path.append("/app")
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from app.core.database import Base
 
 # ✅ 모델 import 강제 (Base.metadata에 등록되게)
@@ -14,6 +14,9 @@ DATABASE_URL = os.environ["DATABASE_URL"]
 
 def main():
     engine = create_engine(DATABASE_URL)
+    # history trigram 인덱스(gin_trgm_ops)에 필요
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
     print("✅ DB schema created via Base.metadata.create_all()")
 
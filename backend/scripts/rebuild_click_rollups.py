@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+click_rollups_hourly / click_rollups_daily 재계산 (compactor)
+
+평소에는 ClickIngestor가 INSERT와 같은 트랜잭션에서 롤업을 갱신하므로 필요 없음.
+수동으로 click_events를 넣었거나 롤업이 어긋났을 때만 실행.
+
+    python scripts/rebuild_click_rollups.py --days 7
+"""
+import argparse
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append('/app')
+
+from app.core.database import SessionLocal
+from app.services.click_rollup import rebuild_rollups
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Rebuild click rollups from click_events")
+    parser.add_argument("--days", type=int, default=2, help="재계산할 기간 (오늘 포함 N일)")
+    args = parser.parse_args()
+
+    since = datetime.utcnow() - timedelta(days=args.days - 1)
+
+    db = SessionLocal()
+    try:
+        rebuild_rollups(db, since)
+        db.commit()
+        print(f"✅ Rollups rebuilt since {since.date()}")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()